@@ -4,13 +4,13 @@ import json
 import pandas as pd
 import numpy as np
 import os
+import sys
+import importlib
 from docx import Document
 import re
 from collections import Counter
 import plotly.graph_objects as go
 import plotly.express as px
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 from nltk.tokenize import word_tokenize
 from nltk.corpus import stopwords
 from nltk.stem import WordNetLemmatizer
@@ -20,6 +20,50 @@ import time
 from typing import Dict, List, Any, Optional
 import uuid
 from jdoptim_logger import JDOptimLogger
+
+# Resume ranking is shared with the modular app in jd_optim_OOP_implement/
+OOP_APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "jd_optim_OOP_implement")
+OOP_APP_PACKAGES = ('models', 'utils')
+# Prefix the modular app's modules are kept under in sys.modules
+OOP_MODULE_PREFIX = 'jd_optim_oop.'
+
+
+def _is_app_package_module(name):
+    return name.split('.')[0] in OOP_APP_PACKAGES
+
+
+def load_oop_module(module_name):
+    """
+    Import a module of the modular app by its path inside jd_optim_OOP_implement/
+
+    The modular app's top-level 'models' and 'utils' packages clash with this
+    repository's own 'models' package. They are imported with the app directory
+    first on sys.path, then moved to OOP_MODULE_PREFIX names and the modules
+    previously loaded under the plain names are put back. Streamlit reruns get
+    the already loaded module (and its caches) back.
+
+    Args:
+        module_name (str): Module inside the app, e.g. 'models.ranking_engine'
+
+    Returns:
+        module: The imported module
+    """
+    loaded = sys.modules.get(OOP_MODULE_PREFIX + module_name)
+    if loaded is not None:
+        return loaded
+
+    saved = {name: sys.modules.pop(name) for name in list(sys.modules) if _is_app_package_module(name)}
+    sys.path.insert(0, OOP_APP_DIR)
+    try:
+        return importlib.import_module(module_name)
+    finally:
+        sys.path.remove(OOP_APP_DIR)
+        for name in [name for name in sys.modules if _is_app_package_module(name)]:
+            sys.modules[OOP_MODULE_PREFIX + name] = sys.modules.pop(name)
+        sys.modules.update(saved)
+
+
+RankingEngine = load_oop_module('models.ranking_engine').RankingEngine
 anthropic_client='None'
 
 
@@ -438,44 +482,8 @@ def preprocess_text(text):
 
 def compute_similarity(job_desc, resume_df):
     """Compute enhanced similarity scores between job description and resumes"""
-    # Extract skills from job description
-    job_skills = extract_skills(str(job_desc['Skills']) + ' ' + str(job_desc['Tools']))
-    
-    similarity_scores = []
-    for _, resume in resume_df.iterrows():
-        # Extract skills from resume
-        resume_skills = extract_skills(str(resume['Skills']) + ' ' + str(resume['Tools']))
-        
-        # Calculate skill matches for each category
-        category_scores = []
-        for category in job_skills:
-            job_set = set(job_skills[category])
-            resume_set = set(resume_skills[category])
-            if job_set:
-                match_ratio = len(resume_set.intersection(job_set)) / len(job_set)
-                category_scores.append(match_ratio)
-            else:
-                category_scores.append(0)
-        
-        # Calculate weighted skill score
-        skill_score = np.mean(category_scores) if category_scores else 0
-        
-        # Calculate text similarity
-        job_text = preprocess_text(str(job_desc['Skills']) + ' ' + str(job_desc['Tools']))
-        resume_text = preprocess_text(str(resume['Skills']) + ' ' + str(resume['Tools']) + ' ' + str(resume['Certifications']))
-        
-        vectorizer = TfidfVectorizer()
-        try:
-            tfidf_matrix = vectorizer.fit_transform([job_text, resume_text])
-            text_similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-        except:
-            text_similarity = 0
-        
-        # Combine scores (70% skill match, 30% text similarity)
-        final_score = (0.7 * skill_score) + (0.3 * text_similarity)
-        similarity_scores.append(final_score)
-    
-    return np.array(similarity_scores)
+    # 70% skill match, 30% text similarity, scored pool-wide by the shared engine
+    return RankingEngine('tfidf').score(job_desc, resume_df)
 
 def generate_ai_insights(job_desc, resume):
     """Generate AI insights about the resume match using Anthropic or fallback text"""
@@ -655,32 +663,7 @@ def create_comparison_dataframe(scores_dict):
 
 def categorize_resumes(job_desc, resume_df):
     """Categorize resumes into high, medium, and low matches"""
-    similarity_scores = compute_similarity(job_desc, resume_df)
-    
-    all_resumes = []
-    for i, score in enumerate(similarity_scores):
-        all_resumes.append({
-            'Resume ID': resume_df.iloc[i]['File Name'],
-            'Skills': resume_df.iloc[i]['Skills'],
-            'Tools': resume_df.iloc[i]['Tools'],
-            'Certifications': resume_df.iloc[i]['Certifications'],
-            'Score': score
-        })
-    
-    # Sort all resumes by score
-    all_resumes.sort(key=lambda x: x['Score'], reverse=True)
-    
-    # Categorize based on score thresholds
-    high_matches = [r for r in all_resumes if r['Score'] >= 0.25]
-    medium_matches = [r for r in all_resumes if 0.2 <= r['Score'] < 0.25]
-    low_matches = [r for r in all_resumes if r['Score'] < 0.2]
-    
-    return {
-        'top_3': all_resumes[:3],
-        'high_matches': high_matches,
-        'medium_matches': medium_matches,
-        'low_matches': low_matches
-    }
+    return RankingEngine('tfidf').rank(job_desc, resume_df)
 
 def init_session_state():
     """Initialize session state variables if they don't exist"""
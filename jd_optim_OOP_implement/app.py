@@ -11,7 +11,7 @@ from config import set_page_config, custom_css
 from utils.file_utils import save_enhanced_jd
 from utils.job_search import JobSearchUtility
 from models.job_description_analyzer import JobDescriptionAnalyzer
-from models.job_description_agent import JobDescriptionAgent
+from models.job_description_agent import get_agent
 from jdoptim_logger import JDOptimLogger
 from state_manager import StateManager
 
@@ -303,9 +303,10 @@ def main():
     # Render tabs based on role
     render_role_specific_tabs(state_manager, tabs)
     
-    # Initialize the analyzer and agent as shared services
+    # Initialize the analyzer and agent as shared services (the agent and its
+    # Bedrock client are built once per process, not on every rerun)
     analyzer = JobDescriptionAnalyzer()
-    agent = JobDescriptionAgent(model_id="anthropic.claude-3-haiku-20240307-v1:0")
+    agent = get_agent(model_id="anthropic.claude-3-haiku-20240307-v1:0")
     
     # Create service container for shared resources
     services = {
@@ -0,0 +1,106 @@
+"""
+Startup / per-rerun benchmark for the Bedrock client registry
+
+Simulates Streamlit reruns against a local fake Bedrock endpoint. Each rerun
+gets an agent and makes one model call, either the old way (a new boto3
+client per rerun) or through the process-wide pooled client:
+
+  startup      first agent build in the process
+  build ms     average agent build on later reruns
+  rerun ms     average agent build + one InvokeModel call
+  connections  TCP connections the endpoint accepted for all reruns
+
+Usage (from jd_optim_OOP_implement/):
+    python benchmarks/bench_bedrock_client.py [--sessions 8] [--reruns 10] [--latency 0.02]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+import boto3
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_bedrock import FakeBedrockServer
+from models.job_description_agent import BEDROCK_CLIENT_CONFIG, JobDescriptionAgent, get_bedrock_client
+
+MODEL_ID = "anthropic.claude-3-haiku-20240307-v1:0"
+CREDENTIALS = {'region_name': "us-east-1", 'access_key': "AKIABENCHMARK", 'secret_key': "benchmark-secret"}
+
+
+def fresh_agent(endpoint_url):
+    """Agent built like app.main did before: new client on every rerun"""
+    client = boto3.client(
+        service_name='bedrock-runtime',
+        aws_access_key_id=CREDENTIALS['access_key'],
+        aws_secret_access_key=CREDENTIALS['secret_key'],
+        region_name=CREDENTIALS['region_name'],
+        endpoint_url=endpoint_url,
+    )
+    return JobDescriptionAgent(MODEL_ID, use_response_cache=False, client=client)
+
+
+def shared_agent(endpoint_url):
+    """Agent on the process-wide pooled client"""
+    client = get_bedrock_client(endpoint_url=endpoint_url, **CREDENTIALS)
+    return JobDescriptionAgent(MODEL_ID, use_response_cache=False, client=client)
+
+
+def run_sessions(build, server, sessions, reruns):
+    """Run concurrent sessions, return (build seconds, rerun seconds) per rerun"""
+    builds, totals = [], []
+    lock = threading.Lock()
+
+    def session(index):
+        for rerun in range(reruns):
+            start = time.perf_counter()
+            agent = build(server.endpoint_url)
+            built = time.perf_counter()
+            response = agent._invoke_bedrock_model(f"session {index} rerun {rerun}", use_cache=False)
+            end = time.perf_counter()
+            if not response:
+                raise RuntimeError("fake endpoint call failed")
+            with lock:
+                builds.append(built - start)
+                totals.append(end - start)
+
+    threads = [threading.Thread(target=session, args=(index,)) for index in range(sessions)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return builds, totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bedrock client registry benchmark")
+    parser.add_argument("--sessions", type=int, default=8, help="Concurrent sessions")
+    parser.add_argument("--reruns", type=int, default=10, help="Reruns per session")
+    parser.add_argument("--latency", type=float, default=0.02, help="Fake model latency in seconds")
+    args = parser.parse_args()
+
+    server = FakeBedrockServer(latency=args.latency).start()
+    print(f"fake endpoint: {server.endpoint_url}, {args.sessions} sessions x {args.reruns} reruns, "
+          f"pool size {BEDROCK_CLIENT_CONFIG.max_pool_connections}")
+    print(f"{'mode':>7} {'startup ms':>10} {'build ms':>9} {'rerun ms':>9} {'wall s':>7} {'connections':>11}")
+    try:
+        for mode, build in (("fresh", fresh_agent), ("shared", shared_agent)):
+            start = time.perf_counter()
+            build(server.endpoint_url)
+            startup = time.perf_counter() - start
+
+            server.reset_counters()
+            start = time.perf_counter()
+            builds, totals = run_sessions(build, server, args.sessions, args.reruns)
+            wall = time.perf_counter() - start
+
+            print(f"{mode:>7} {startup * 1000:>10.1f} {sum(builds) * 1000 / len(builds):>9.2f} "
+                  f"{sum(totals) * 1000 / len(totals):>9.2f} {wall:>7.2f} {server.connections:>11}")
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,313 @@
+"""
+Ranking benchmark suite on synthetic resume pools
+
+Generates pools with the File Name / Skills / Tools / Certifications schema of
+the extracted resume CSVs (1k, 10k and 100k rows by default) and times every
+ranking stage on each:
+
+  load_csv             load_resume_pool on a fresh CSV (parse + Parquet cache write)
+  load_cached          load_resume_pool again (Parquet cache hit)
+  extract_skills       taxonomy skill extraction of every resume
+  preprocess_text      text preprocessing of every resume (caches cleared first,
+                       NLP resources already loaded)
+  compute_similarity   ResumeAnalyzer.compute_similarity, cold feature index
+  compute_similarity_warm  the same call again, features served by the index
+  categorize_resumes   full ranking (scores, buckets, breakdowns)
+  rerank_edited_jd     full ranking again for an edited JD (analyzed pool cached)
+  categorize_streaming streaming ranking with bounded buckets
+
+Each pool size runs in its own subprocess, inside a temporary working
+directory, so peak RSS is per size and the app's cache/ is left untouched.
+Results (seconds, rows/s, peak RSS) are compared with a JSON baseline; the run
+fails (exit code 1) when a stage is slower, or a pool uses more memory, than
+the baseline allows. Without a baseline file the results become the baseline.
+
+Usage (from jd_optim_OOP_implement/):
+    python benchmarks/bench_ranking.py [--sizes 1000,10000,100000] [--tolerance 0.25]
+    python benchmarks/bench_ranking.py --update-baseline
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+DEFAULT_BASELINE = os.path.join(APP_DIR, "benchmarks", "ranking_baseline.json")
+DEFAULT_SIZES = "1000,10000,100000"
+
+# Job description scored in every run (Skills / Tools like the ranking page builds them)
+JOB_DESC = {
+    'File Name': "benchmark JD",
+    'Skills': "java, python, spring, microservices, sql, aws, docker, kubernetes, rest api, agile",
+    'Tools': "git, jenkins, maven, jira, terraform"
+}
+
+# The same JD after a feedback iteration, re-ranked against the cached pool
+EDITED_JOB_DESC = dict(JOB_DESC, Skills=JOB_DESC['Skills'] + ", kafka, react")
+
+# Building blocks of the synthetic resumes
+SKILL_PHRASES = [
+    "Java (Version 11 and higher)", "Python", "JavaScript", "TypeScript", "C++", "C#", "Scala", "Golang",
+    "Spring Boot", "Spring MVC", "Hibernate", "Django", "Flask", "React", "Angular", "Vue", "Node.js",
+    "Microservices architecture", "REST APIs", "RESTful web services", "GraphQL", "Kafka", "RabbitMQ",
+    "SQL", "PL/SQL", "MySQL", "PostgreSQL", "MongoDB", "Oracle", "Redis", "Elasticsearch", "Cassandra",
+    "AWS (EC2, S3, Lambda)", "Azure", "GCP", "Docker", "Kubernetes", "Terraform", "CI/CD pipelines",
+    "Unit testing frameworks", "JUnit", "Mockito", "Selenium", "Design patterns", "System analysis",
+    "Database management", "Data modeling", "Machine learning", "Pandas", "Spark", "Hadoop", "Airflow",
+    "Agile methodologies", "Scrum", "TDD", "Linux", "Shell scripting", "HTML5", "CSS3", "jQuery"
+]
+TOOL_PHRASES = [
+    "Git", "GitHub", "GitLab", "Bitbucket", "Jenkins", "Bamboo", "Maven", "Gradle", "Ant", "JIRA",
+    "Confluence", "IntelliJ IDEA", "Eclipse", "Visual Studio Code", "Postman", "Swagger", "Splunk",
+    "Grafana", "Prometheus", "New Relic", "SonarQube", "Docker", "Kubernetes", "Terraform", "Ansible",
+    "AWS CloudFormation", "Tableau", "Power BI", "Jupyter", "Apache Tomcat", "WebLogic", "JMeter"
+]
+CERTIFICATIONS = [
+    "AWS Certified Solutions Architect - Associate", "AWS Certified Developer", "Oracle Certified Professional Java SE",
+    "OCAJP 1Z0-808 - Oracle", "Certified Kubernetes Administrator", "Microsoft Certified: Azure Fundamentals",
+    "Google Professional Cloud Architect", "Certified ScrumMaster (CSM)", "PMP", "Databricks Certified Data Engineer"
+]
+
+
+def synthetic_pool(rows, seed=42):
+    """
+    Build a resume pool with the extracted resume CSV schema
+
+    Args:
+        rows (int): Number of resumes
+        seed (int): Random seed (pools are reproducible)
+
+    Returns:
+        DataFrame: File Name, Skills, Tools and Certifications columns
+    """
+    rng = np.random.default_rng(seed)
+
+    def phrases(vocabulary, low, high):
+        count = int(rng.integers(low, high))
+        picks = rng.choice(len(vocabulary), size=min(count, len(vocabulary)), replace=False)
+        return ", ".join(vocabulary[i] for i in picks)
+
+    certifications = []
+    for _ in range(rows):
+        # Most extracted resumes list no certification
+        certifications.append(phrases(CERTIFICATIONS, 1, 4) if rng.random() < 0.35 else "None mentioned")
+
+    return pd.DataFrame({
+        'File Name': [f"resume_{i:06d}.docx" for i in range(rows)],
+        'Skills': [phrases(SKILL_PHRASES, 4, 25) for _ in range(rows)],
+        'Tools': [phrases(TOOL_PHRASES, 2, 12) for _ in range(rows)],
+        'Certifications': certifications
+    })
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far, in MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def timed(function, *args, **kwargs):
+    """Run a function once, returning (seconds, result)"""
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def run_size(rows):
+    """
+    Benchmark every stage on one pool size (runs inside the worker subprocess)
+
+    Args:
+        rows (int): Pool size
+
+    Returns:
+        dict: Stage name -> {'seconds', 'rows_per_sec', 'rss_mb'} plus 'peak_rss_mb'
+    """
+    from models.resume_analyzer import ResumeAnalyzer
+    from models.scoring_engine import resume_texts
+    from utils.pool_cache import load_resume_pool
+    from utils.text_processing import clear_preprocess_caches, extract_skills, preprocess_text
+
+    stages = {}
+
+    def record(name, seconds):
+        stages[name] = {
+            'seconds': seconds,
+            'rows_per_sec': rows / seconds if seconds > 0 else None,
+            'rss_mb': peak_rss_mb()
+        }
+
+    csv_path = os.path.join(os.getcwd(), f"resumes_analysis_output_bench_{rows}.csv")
+    synthetic_pool(rows).to_csv(csv_path, index=False)
+
+    seconds, pool = timed(load_resume_pool, csv_path)
+    record('load_csv', seconds)
+    seconds, pool = timed(load_resume_pool, csv_path)
+    record('load_cached', seconds)
+
+    skill_texts, similarity_texts = resume_texts(pool)
+    seconds, _ = timed(lambda: [extract_skills(text) for text in skill_texts])
+    record('extract_skills', seconds)
+
+    # Load the NLP resources first so the stage measures preprocessing only
+    preprocess_text("warm up")
+    clear_preprocess_caches()
+    seconds, _ = timed(lambda: [preprocess_text(text) for text in similarity_texts])
+    record('preprocess_text', seconds)
+    clear_preprocess_caches()
+
+    analyzer = ResumeAnalyzer()
+    seconds, _ = timed(analyzer.compute_similarity, JOB_DESC, pool)
+    record('compute_similarity', seconds)
+    seconds, _ = timed(analyzer.compute_similarity, JOB_DESC, pool)
+    record('compute_similarity_warm', seconds)
+
+    seconds, _ = timed(analyzer.categorize_resumes, JOB_DESC, pool)
+    record('categorize_resumes', seconds)
+    seconds, _ = timed(analyzer.categorize_resumes, EDITED_JOB_DESC, pool)
+    record('rerank_edited_jd', seconds)
+    seconds, _ = timed(analyzer.categorize_resumes, JOB_DESC, pool, streaming=True)
+    record('categorize_streaming', seconds)
+
+    return {'rows': rows, 'stages': stages, 'peak_rss_mb': peak_rss_mb()}
+
+
+def run_in_subprocess(rows):
+    """Benchmark one pool size in a fresh interpreter and temporary working directory"""
+    with tempfile.TemporaryDirectory(prefix="bench_ranking_") as work_dir:
+        completed = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--worker", str(rows)],
+            cwd=work_dir, capture_output=True, text=True
+        )
+    if completed.returncode != 0:
+        raise RuntimeError(f"benchmark of {rows} rows failed:\n{completed.stderr}")
+    # The result is the last stdout line; anything printed before is app logging
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def compare(results, baseline, tolerance, rss_tolerance, min_seconds):
+    """
+    Find regressions against a baseline
+
+    Args:
+        results (dict): Current run
+        baseline (dict): Baseline run
+        tolerance (float): Allowed relative slowdown per stage (0.25 = 25%)
+        rss_tolerance (float): Allowed relative peak RSS increase per pool size
+        min_seconds (float): Stages faster than this in the baseline are not
+            checked (timer noise dominates)
+
+    Returns:
+        list: Human readable regression messages (empty when within tolerance)
+    """
+    regressions = []
+    for size, current in results['sizes'].items():
+        reference = baseline.get('sizes', {}).get(size)
+        if reference is None:
+            continue
+
+        for stage, timing in current['stages'].items():
+            expected = reference['stages'].get(stage)
+            if expected is None or expected['seconds'] < min_seconds:
+                continue
+            limit = expected['seconds'] * (1 + tolerance)
+            if timing['seconds'] > limit:
+                regressions.append(
+                    f"{size} rows / {stage}: {timing['seconds']:.3f}s vs baseline "
+                    f"{expected['seconds']:.3f}s (limit {limit:.3f}s)"
+                )
+
+        limit = reference['peak_rss_mb'] * (1 + rss_tolerance)
+        if current['peak_rss_mb'] > limit:
+            regressions.append(
+                f"{size} rows / peak RSS: {current['peak_rss_mb']:.0f} MB vs baseline "
+                f"{reference['peak_rss_mb']:.0f} MB (limit {limit:.0f} MB)"
+            )
+    return regressions
+
+
+def print_table(results, baseline):
+    """Print stage timings, with the change against the baseline when available"""
+    for size, current in results['sizes'].items():
+        reference = baseline.get('sizes', {}).get(size, {}) if baseline else {}
+        print(f"\n{size} rows (peak RSS {current['peak_rss_mb']:.0f} MB)")
+        for stage, timing in current['stages'].items():
+            rate = f"{timing['rows_per_sec']:>12,.0f} rows/s" if timing['rows_per_sec'] else ""
+            line = f"  {stage:<24} {timing['seconds']:9.3f}s {rate}"
+            expected = reference.get('stages', {}).get(stage)
+            if expected and expected['seconds'] > 0:
+                line += f"  ({(timing['seconds'] / expected['seconds'] - 1) * 100:+.0f}% vs baseline)"
+            print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ranking benchmark suite on synthetic resume pools")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma-separated pool sizes")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--output", help="Also write this run's results to a JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed relative slowdown per stage (default 0.25)")
+    parser.add_argument("--rss-tolerance", type=float, default=0.25,
+                        help="Allowed relative peak RSS increase per pool size (default 0.25)")
+    parser.add_argument("--min-seconds", type=float, default=0.05,
+                        help="Skip the check for stages faster than this in the baseline")
+    parser.add_argument("--update-baseline", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--worker", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        print(json.dumps(run_size(args.worker)))
+        return 0
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    results = {
+        'created': time.strftime("%Y-%m-%d %H:%M:%S"),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'cpus': os.cpu_count(),
+        'sizes': {}
+    }
+    for rows in sizes:
+        print(f"Benchmarking {rows} rows...", flush=True)
+        results['sizes'][str(rows)] = run_in_subprocess(rows)
+
+    baseline = None
+    if os.path.exists(args.baseline) and not args.update_baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+
+    print_table(results, baseline)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if baseline is None:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance, args.rss_tolerance, args.min_seconds)
+    if regressions:
+        print("\nRegressions beyond tolerance:")
+        for message in regressions:
+            print(f"  {message}")
+        return 1
+    print(f"\nWithin tolerance of {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,144 @@
+"""
+Recall / latency benchmark for the candidate retrieval stage
+
+Builds a synthetic pool of noisy variants of the bundled resume CSVs and ranks
+it for job-description-shaped queries: the bundled JDs plus synthetic short
+JDs (a handful of taxonomy skills and tools, as the ranking page extracts
+them). For several min_containment settings it compares the shortlist
+(retrieval + exact re-scoring) with exhaustive scoring of the whole pool:
+
+  candidates    average number of resumes re-scored exactly per query
+  recall high   share of the exhaustive high matches the shortlist returns
+  recall medium share of the exhaustive medium matches the shortlist returns
+  fallback      share of queries RankingEngine.rank would score exhaustively
+                (cut shortlist with fewer than top-k candidates or no low matches)
+  latency       average time per query, exhaustive vs shortlist
+
+Usage (from jd_optim_OOP_implement/):
+    python benchmarks/bench_retrieval.py [--rows 20000] [--queries 50] [--containment 0,0.1,0.2,0.3]
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.candidate_retrieval import DEFAULT_MIN_CANDIDATES, ContainmentRetriever
+from models.score_buckets import rank_and_bucket, score_thresholds
+from models.scoring_engine import PoolScoringEngine
+from rank_resumes import build_job_desc
+from utils.text_processing import TECH_KEYWORDS
+
+DEFAULT_CSVS = os.path.join("Data", "Extracted Resumes", "*.csv")
+DEFAULT_JDS = os.path.join("Data", "JDs", "*.txt")
+
+
+def synthetic_pool(csv_paths, rows, seed=7):
+    """
+    Variants of real resumes: each keeps ~80% of a source resume's tokens and
+    gets a few random tokens from the whole corpus
+    """
+    source = pd.concat([pd.read_csv(path) for path in csv_paths], ignore_index=True).fillna("")
+    rng = np.random.default_rng(seed)
+    sources = rng.integers(0, len(source), size=rows)
+    columns = {}
+    for column in ('Skills', 'Tools', 'Certifications'):
+        texts = source[column].astype(str).tolist()
+        vocabulary = " ".join(texts).split()
+        values = []
+        for idx in sources:
+            tokens = [token for token in texts[idx].split() if rng.random() < 0.8]
+            tokens += [vocabulary[i] for i in rng.integers(0, len(vocabulary), size=rng.integers(0, 6))]
+            values.append(" ".join(tokens))
+        columns[column] = values
+    columns['File Name'] = [f"Resume_{i}" for i in range(rows)]
+    return pd.DataFrame(columns)
+
+
+def synthetic_jds(count, seed=11):
+    """
+    Short job descriptions: 3-8 taxonomy skills and 1-3 taxonomy tools
+    """
+    rng = np.random.default_rng(seed)
+    skills = [keyword for category, keywords in TECH_KEYWORDS.items() if category != 'tools' for keyword in keywords]
+    tools = TECH_KEYWORDS['tools']
+    return [
+        {
+            'File Name': f"synthetic_{i}",
+            'Skills': ", ".join(rng.choice(skills, size=rng.integers(3, 9), replace=False)),
+            'Tools': ", ".join(rng.choice(tools, size=rng.integers(1, 4), replace=False))
+        }
+        for i in range(count)
+    ]
+
+
+def bucket_positions(scores, positions, adaptive, pool_size):
+    """Pool positions of the high and medium matches of a score array"""
+    _, buckets = rank_and_bucket(scores, score_thresholds(scores, adaptive, pool_size))
+    return {name: set(positions[buckets[name]].tolist()) for name in ('high_matches', 'medium_matches')}, buckets
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Candidate retrieval recall / latency benchmark")
+    parser.add_argument("--csv", default=DEFAULT_CSVS, help="Resume CSVs used as token source (glob)")
+    parser.add_argument("--jds", default=DEFAULT_JDS, help="Job description files (glob)")
+    parser.add_argument("--rows", type=int, default=20000, help="Synthetic pool size")
+    parser.add_argument("--queries", type=int, default=50, help="Synthetic short JDs added to the bundled ones")
+    parser.add_argument("--top-k", type=int, default=3, help="Top matches the shortlist has to fill")
+    parser.add_argument("--min-candidates", type=int, default=DEFAULT_MIN_CANDIDATES,
+                        help="Candidates kept at least before min_containment cuts any")
+    parser.add_argument("--containment", default="0,0.1,0.2,0.3", help="min_containment values to compare")
+    parser.add_argument("--adaptive", action="store_true", help="Bucket with adaptive thresholds")
+    args = parser.parse_args()
+
+    pool = synthetic_pool(sorted(glob.glob(args.csv)), args.rows)
+    queries = [build_job_desc(path) for path in sorted(glob.glob(args.jds))] + synthetic_jds(args.queries)
+
+    start = time.perf_counter()
+    engine = PoolScoringEngine(pool)
+    retriever = ContainmentRetriever(engine)
+    print(f"pool: {len(pool)} resumes, analyzed and indexed in {time.perf_counter() - start:.2f} s")
+    print(f"queries: {len(queries)} job descriptions")
+
+    everyone = np.arange(len(pool))
+    exhaustive = []
+    start = time.perf_counter()
+    for job_desc in queries:
+        exhaustive.append(bucket_positions(engine.score(job_desc), everyone, args.adaptive, len(pool))[0])
+    exhaustive_ms = (time.perf_counter() - start) * 1000 / len(queries)
+    expected = {name: np.mean([len(buckets[name]) for buckets in exhaustive]) for name in ('high_matches', 'medium_matches')}
+
+    print(f"exhaustive: {exhaustive_ms:8.2f} ms/query, "
+          f"{expected['high_matches']:.0f} high / {expected['medium_matches']:.0f} medium matches per query")
+    print(f"{'containment':>11} {'candidates':>10} {'recall high':>11} {'recall medium':>13} {'fallback':>8} {'ms/query':>9}")
+    for min_containment in (float(value) for value in args.containment.split(",")):
+        recalls = {'high_matches': [], 'medium_matches': []}
+        candidates = []
+        fallbacks = 0
+        elapsed = 0.0
+        for job_desc, reference in zip(queries, exhaustive):
+            start = time.perf_counter()
+            rows, complete = retriever.search(job_desc, min_containment, args.min_candidates)
+            found, buckets = bucket_positions(engine.score(job_desc, rows), rows, args.adaptive, len(pool))
+            elapsed += time.perf_counter() - start
+
+            candidates.append(len(rows))
+            cut = len(rows) < len(pool) and not complete
+            fallbacks += len(rows) < min(args.top_k, len(pool)) or (cut and not len(buckets['low_matches']))
+            for name in recalls:
+                if reference[name]:
+                    recalls[name].append(len(found[name] & reference[name]) / len(reference[name]))
+
+        recall = {name: np.mean(values) if values else 1.0 for name, values in recalls.items()}
+        print(f"{min_containment:>11.2f} {np.mean(candidates):>10.0f} {recall['high_matches']:>11.3f} "
+              f"{recall['medium_matches']:>13.3f} {fallbacks / len(queries):>8.2f} "
+              f"{elapsed * 1000 / len(queries):>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,110 @@
+"""
+Time-to-first-token benchmark for streamed job description generation
+
+Generates enhanced versions against a local fake Bedrock endpoint that
+produces the answer word by word, blocking (InvokeModel) vs streamed
+(InvokeModelWithResponseStream, VERSION splitting of the text received so far):
+
+  first text   time until the page can show any generated text
+  version 1    time until the first version is complete
+  total        time until all versions are parsed
+
+and the cost of re-splitting the whole response, which the page does on each
+throttled redraw (at most every STREAM_REFRESH_SECONDS).
+
+Usage (from jd_optim_OOP_implement/):
+    python benchmarks/bench_streaming.py [--words 600] [--latency 0.3] [--token-interval 0.005]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_bedrock import FakeBedrockServer
+from models.job_description_agent import JobDescriptionAgent, get_bedrock_client, split_versions
+from ui.common import STREAM_REFRESH_SECONDS
+
+MODEL_ID = "anthropic.claude-3-haiku-20240307-v1:0"
+SECTION_WORDS = ("Overview", "Responsibilities", "Required Skills", "Preferred Skills", "Experience", "Tools")
+
+
+def synthetic_response(words):
+    """Three VERSION n: job descriptions of about `words` words in total"""
+    filler = "this role designs builds and maintains reliable services with the team".split()
+    versions = []
+    for number in range(1, 4):
+        lines = []
+        for idx in range(words // 3 // 12):
+            section = SECTION_WORDS[idx % len(SECTION_WORDS)]
+            lines.append(f"**{section}:** " + " ".join(filler[:10]))
+        versions.append(f"VERSION {number}:\n" + "\n".join(lines))
+    return "\n\n".join(versions)
+
+
+def measure(agent, stream):
+    """Generate versions once, return (first text s, first version s, total s, versions)"""
+    marks = {}
+    start = time.perf_counter()
+
+    def on_update(text):
+        now = time.perf_counter() - start
+        versions = split_versions(text)
+        if versions and versions[0]:
+            marks.setdefault('first', now)
+        if len(versions) > 1:
+            marks.setdefault('version', now)
+
+    versions = agent.generate_initial_descriptions("Benchmark JD", regenerate=True,
+                                                   on_update=on_update if stream else None)
+    total = time.perf_counter() - start
+    return marks.get('first', total), marks.get('version', total), total, versions
+
+
+def split_cost(text, repeats=200):
+    """Seconds to split the complete response once"""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        split_versions(text)
+    return (time.perf_counter() - start) / repeats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming time-to-first-token benchmark")
+    parser.add_argument("--words", type=int, default=600, help="Approximate response length in words")
+    parser.add_argument("--latency", type=float, default=0.3, help="Fake time to first token in seconds")
+    parser.add_argument("--token-interval", type=float, default=0.005, help="Fake seconds between words")
+    parser.add_argument("--runs", type=int, default=3, help="Generations per mode")
+    args = parser.parse_args()
+
+    text = synthetic_response(args.words)
+    server = FakeBedrockServer(latency=args.latency, response_text=text,
+                               token_interval=args.token_interval).start()
+    client = get_bedrock_client("us-east-1", "AKIABENCHMARK", "benchmark-secret", endpoint_url=server.endpoint_url)
+    agent = JobDescriptionAgent(MODEL_ID, use_response_cache=False, client=client)
+    deltas = server.deltas()
+    print(f"fake endpoint: {len(deltas)} deltas, {args.latency:g} s to first token, "
+          f"{args.token_interval * 1000:g} ms between deltas")
+
+    try:
+        print(f"{'mode':>9} {'first text s':>12} {'version 1 s':>11} {'total s':>8}")
+        results = {}
+        for mode in ("blocking", "streamed"):
+            runs = [measure(agent, mode == "streamed") for _ in range(args.runs)]
+            results[mode] = runs[-1][3]
+            first, version, total = (sum(run[idx] for run in runs) / len(runs) for idx in range(3))
+            print(f"{mode:>9} {first:>12.3f} {version:>11.3f} {total:>8.3f}")
+        if results['blocking'] != results['streamed']:
+            raise RuntimeError("streamed versions differ from blocking ones")
+    finally:
+        server.stop()
+
+    redraws = int((args.latency + args.token_interval * len(deltas)) / STREAM_REFRESH_SECONDS) + 1
+    cost = split_cost(text)
+    print(f"re-splitting the full response: {cost * 1000:.3f} ms per redraw, "
+          f"at most {redraws} redraws ({cost * redraws * 1000:.2f} ms in total)")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
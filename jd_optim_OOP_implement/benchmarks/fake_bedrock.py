@@ -0,0 +1,172 @@
+"""
+Local stand-in for the Bedrock runtime endpoint, used by the client benchmarks
+
+Answers InvokeModel (POST /model/<model id>/invoke) and
+InvokeModelWithResponseStream (POST /model/<model id>/invoke-with-response-stream)
+requests with a fixed Anthropic messages response, over HTTP/1.1 with
+keep-alive, and counts the TCP connections clients open against it.
+
+The response is produced word by word: the first word after `latency` seconds,
+each further one after `token_interval` seconds. Streams are sent as they are
+produced (AWS event stream framing, chunked transfer encoding); the plain
+invoke answers once the whole text is "generated".
+"""
+import base64
+import json
+import struct
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_RESPONSE_TEXT = (
+    "VERSION 1:\nOverview: This role leads the design of backend services.\n\n"
+    "VERSION 2:\nOverview: This role focuses on delivery and code quality.\n\n"
+    "VERSION 3:\nOverview: This role bridges engineering and product teams."
+)
+
+
+def _event_header(name, value):
+    """Encode a string header of an event stream message"""
+    name, value = name.encode("utf-8"), value.encode("utf-8")
+    return struct.pack("B", len(name)) + name + struct.pack(">BH", 7, len(value)) + value
+
+
+def encode_event(message):
+    """
+    Encode an Anthropic stream message as a Bedrock 'chunk' event
+
+    Args:
+        message (dict): Stream message, e.g. {"type": "content_block_delta", ...}
+
+    Returns:
+        bytes: Event stream message (prelude, headers, payload, CRCs)
+    """
+    payload = json.dumps({"bytes": base64.b64encode(json.dumps(message).encode("utf-8")).decode("ascii")})
+    payload = payload.encode("utf-8")
+    headers = (_event_header(":event-type", "chunk") + _event_header(":content-type", "application/json")
+               + _event_header(":message-type", "event"))
+    total_length = 12 + len(headers) + len(payload) + 4
+    prelude = struct.pack(">II", total_length, len(headers))
+    prelude += struct.pack(">I", zlib.crc32(prelude))
+    message_bytes = prelude + headers + payload
+    return message_bytes + struct.pack(">I", zlib.crc32(message_bytes))
+
+
+def stream_messages(deltas):
+    """Anthropic stream messages for a response made of the given text deltas"""
+    yield {"type": "message_start", "message": {"id": "msg_fake", "type": "message", "role": "assistant",
+                                                "content": [], "usage": {"input_tokens": 100}}}
+    yield {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}}
+    for delta in deltas:
+        yield {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": delta}}
+    yield {"type": "content_block_stop", "index": 0}
+    yield {"type": "message_delta", "delta": {"stop_reason": "end_turn"}, "usage": {"output_tokens": len(deltas)}}
+    yield {"type": "message_stop"}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length", 0))
+        return self.rfile.read(length) if length else b""
+
+    def _send(self, status, payload, content_type="application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self):
+        self._read_body()
+        with self.server.lock:
+            self.server.requests += 1
+        if self.path.endswith("/invoke-with-response-stream"):
+            self._stream()
+            return
+        if not self.path.endswith("/invoke"):
+            self._send(404, b'{"message": "Unknown operation"}')
+            return
+        deltas = self.server.deltas()
+        time.sleep(self.server.latency + self.server.token_interval * (len(deltas) - 1))
+        text = self.server.response_text
+        body = {
+            "id": "msg_fake",
+            "type": "message",
+            "role": "assistant",
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": "end_turn",
+            "usage": {"input_tokens": 100, "output_tokens": len(text.split())},
+        }
+        self._send(200, json.dumps(body).encode("utf-8"))
+
+    def _write_chunk(self, data):
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def _stream(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/vnd.amazon.eventstream")
+        self.send_header("X-Amzn-Bedrock-Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        # Deltas are paced against a fixed schedule so sleep overshoot does not add up
+        start = time.perf_counter()
+        produced = 0
+        for message in stream_messages(self.server.deltas()):
+            if message["type"] == "content_block_delta":
+                delay = start + self.server.latency + self.server.token_interval * produced - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                produced += 1
+            self._write_chunk(encode_event(message))
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+class FakeBedrockServer(ThreadingHTTPServer):
+    """Threaded HTTP server impersonating bedrock-runtime on 127.0.0.1"""
+    daemon_threads = True
+
+    def __init__(self, latency=0.0, response_text=DEFAULT_RESPONSE_TEXT, token_interval=0.0):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.latency = latency
+        self.token_interval = token_interval
+        self.response_text = response_text
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = 0
+        self._thread = None
+
+    @property
+    def endpoint_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def deltas(self):
+        """The response text split into word-sized deltas"""
+        words = self.response_text.split(" ")
+        return [word if idx == 0 else " " + word for idx, word in enumerate(words)]
+
+    def reset_counters(self):
+        with self.lock:
+            self.connections = 0
+            self.requests = 0
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
\ No newline at end of file
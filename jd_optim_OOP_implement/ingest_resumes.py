@@ -0,0 +1,91 @@
+"""
+Keep resume pools in sync with the "Resume New" folders
+
+Watches each sub-folder of "Resume New" (Resumes_JDJavaDeveloper,
+Resumes_JDPrincipalSoftwareEngineer, ...) and extracts only new or changed
+resumes into the matching resumes_analysis_output*.csv pool, its columnar
+cache and the resume feature index.
+
+watchdog is optional and not in requirements.txt: with it installed
+(pip install watchdog), file events start a scan early instead of waiting
+for the next poll.
+
+Usage (from jd_optim_OOP_implement/):
+    python ingest_resumes.py                  # watch, scanning every 30 seconds
+    python ingest_resumes.py --once           # one scan, then exit
+    python ingest_resumes.py --source "../Resume New/Resumes_JDJavaDeveloper=Data/Extracted Resumes/java.csv"
+"""
+import argparse
+import sys
+
+from models.resume_ingestion import (
+    DEFAULT_BATCH_SIZE, DEFAULT_POLL_INTERVAL, DEFAULT_SETTLE_SECONDS, WATCHDOG_AVAILABLE,
+    ResumeIngestionService
+)
+
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Ingest new resumes into the resume pools")
+    parser.add_argument("--source", action="append", metavar="FOLDER=POOL_CSV",
+                        help="Source folder and the pool CSV it feeds (repeatable, default: every "
+                             "sub-folder of \"Resume New\")")
+    parser.add_argument("--once", action="store_true", help="Scan once and exit")
+    parser.add_argument("--interval", type=float, default=DEFAULT_POLL_INTERVAL,
+                        help=f"Seconds between scans (default: {DEFAULT_POLL_INTERVAL})")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Files extracted per batch")
+    parser.add_argument("--settle", type=float, default=DEFAULT_SETTLE_SECONDS,
+                        help="Seconds a file must be unchanged before it is ingested")
+    parser.add_argument("--workers", type=int, help="Worker processes used to parse DOCX files")
+    args = parser.parse_args(argv)
+
+    if args.source:
+        sources = {}
+        for source in args.source:
+            folder, separator, pool_path = source.partition("=")
+            if not separator or not folder or not pool_path:
+                parser.error(f"--source expects FOLDER=POOL_CSV, got '{source}'")
+            sources[folder] = pool_path
+        args.source = sources
+    return args
+
+
+def print_stats(stats):
+    """Print the outcome of one scan"""
+    for pool_path, counts in stats['pools'].items():
+        print(f"{pool_path}: {counts['ingested']} ingested, {counts['failed']} failed")
+    print(f"Scan finished in {stats['seconds']:.2f}s "
+          f"({stats['ingested']} ingested, {stats['failed']} failed)")
+
+
+def main(argv=None):
+    """Command line entry point"""
+    args = parse_args(argv)
+    service = ResumeIngestionService(sources=args.source, batch_size=args.batch_size,
+                                     settle_seconds=args.settle, max_workers=args.workers)
+    if not service.sources:
+        print("No resume folders to watch")
+        return 1
+    for folder, pool_path in service.sources.items():
+        print(f"{folder} -> {pool_path}")
+
+    if args.once:
+        print_stats(service.run_once())
+        return 0
+
+    mode = "file events and polling" if WATCHDOG_AVAILABLE else "polling"
+    print(f"Watching ({mode}, every {args.interval:g}s), press Ctrl+C to stop")
+    def report(stats):
+        # Quiet while nothing changes
+        if stats['pools']:
+            print_stats(stats)
+
+    try:
+        service.watch(args.interval, on_scan=report)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
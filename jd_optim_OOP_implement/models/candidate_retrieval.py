@@ -0,0 +1,158 @@
+import numpy as np
+from scipy import sparse
+
+from utils.text_processing import TECH_KEYWORDS, extract_skills, preprocess_text
+from models.scoring_engine import SKILL_CATEGORIES, job_texts, skills_to_bitmask
+
+# Recall knob: share of the JD's terms and skills a resume must contain to stay
+# a candidate once there are more than DEFAULT_MIN_CANDIDATES matching resumes.
+# 0 keeps every resume sharing anything with the JD (exact for the text scorers).
+DEFAULT_MIN_CONTAINMENT = 0.2
+
+# Candidates kept at least (best containment first) before the knob cuts any
+DEFAULT_MIN_CANDIDATES = 1000
+
+
+def _skill_elements(skill_bits):
+    """
+    Expand per-category skill bitmasks into a sparse keyword indicator matrix
+
+    Args:
+        skill_bits (numpy.ndarray): (resumes x categories) uint64 bitmasks
+
+    Returns:
+        scipy.sparse.csr_matrix: (resumes x taxonomy keywords) indicator matrix
+    """
+    blocks = []
+    for position, category in enumerate(SKILL_CATEGORIES):
+        shifts = np.arange(len(TECH_KEYWORDS[category]), dtype=np.uint64)
+        bits = (skill_bits[:, position, None] >> shifts) & np.uint64(1)
+        blocks.append(sparse.csr_matrix(bits.astype(np.float64)))
+    return sparse.hstack(blocks, format='csr')
+
+
+class ContainmentRetriever:
+    """
+    Inverted-index candidate retrieval over a resume pool
+
+    Each resume is reduced to the set of its text terms plus its taxonomy
+    skills (the two things the exact score looks at), stored as posting lists.
+    A job description is much shorter than a resume, so resumes are ranked by
+    containment - the share of the JD's elements they contain - rather than by
+    a symmetric similarity. A resume sharing no element with the JD scores 0
+    with the text scorers, so the matching resumes are an exact shortlist; only
+    when there are more than min_candidates of them are the ones below
+    min_containment left out. The index is built once per pool and queried per
+    job description.
+    """
+
+    def __init__(self, engine):
+        """
+        Build the posting lists for a pool
+
+        Args:
+            engine (PoolScoringEngine): Analyzed pool
+        """
+        self.engine = engine
+        self.size = engine.size
+        self.n_terms = engine.term_presence.shape[1]
+        # One column (posting list) per term and per taxonomy keyword
+        self.postings = sparse.hstack(
+            [engine.term_presence, _skill_elements(engine.skill_bits)], format='csc'
+        )
+
+    def job_elements(self, job_desc):
+        """
+        Columns of the pool's elements found in a job description
+
+        Args:
+            job_desc (dict): Job description with Skills and Tools fields
+
+        Returns:
+            list: Sorted element columns (JD terms missing from the pool are left out)
+        """
+        skill_text, similarity_text = job_texts(job_desc)
+        columns = set()
+        for term in self.engine.analyzer(preprocess_text(similarity_text)):
+            idx = self.engine.vocabulary.get(term)
+            if idx is not None and idx < self.n_terms:
+                columns.add(idx)
+
+        if skill_text:
+            job_bits = skills_to_bitmask(extract_skills(skill_text))[None, :]
+            columns.update(int(self.n_terms + column) for column in _skill_elements(job_bits).indices)
+        return sorted(columns)
+
+    def containment(self, job_desc):
+        """
+        Share of a job description's elements every resume contains
+
+        Args:
+            job_desc (dict): Job description with Skills and Tools fields
+
+        Returns:
+            numpy.ndarray: Containment in [0, 1] per resume
+        """
+        columns = self.job_elements(job_desc)
+        if not columns:
+            return np.zeros(self.size)
+        overlap = np.asarray(self.postings[:, columns].sum(axis=1)).ravel()
+        return overlap / len(columns)
+
+    def search(self, job_desc, min_containment=DEFAULT_MIN_CONTAINMENT, min_candidates=DEFAULT_MIN_CANDIDATES):
+        """
+        Candidates of a job description, and whether the shortlist is complete
+
+        Args:
+            job_desc (dict): Job description with Skills and Tools fields
+            min_containment (float): Containment a candidate needs once there are
+                more than min_candidates matching resumes
+            min_candidates (int): Candidates kept at least, best containment first
+
+        Returns:
+            tuple: (sorted pool positions, complete) where complete is True when
+                every resume sharing an element with the JD is a candidate
+        """
+        containment = self.containment(job_desc)
+        matching = np.flatnonzero(containment > 0)
+        if len(matching) <= min_candidates:
+            return matching, True
+
+        rows = matching[containment[matching] >= min_containment]
+        if len(rows) < min_candidates:
+            # Best containment first, earlier pool position first among ties
+            order = np.lexsort((matching, -containment[matching]))
+            rows = np.sort(matching[order[:min_candidates]])
+        return rows, False
+
+    def candidates(self, job_desc, min_containment=DEFAULT_MIN_CONTAINMENT, min_candidates=DEFAULT_MIN_CANDIDATES):
+        """
+        Positions of the candidate resumes of a job description (see search)
+
+        Returns:
+            numpy.ndarray: Sorted pool positions
+        """
+        return self.search(job_desc, min_containment, min_candidates)[0]
+
+    def shortlist(self, job_desc, limit=None, min_containment=DEFAULT_MIN_CONTAINMENT):
+        """
+        Retrieve candidates and re-score them exactly
+
+        Args:
+            job_desc (dict): Job description with Skills and Tools fields
+            limit (int): Keep only the best `limit` candidates (all when None)
+            min_containment (float): Recall knob, see search()
+
+        Returns:
+            tuple: (positions, scores) ordered from best to worst score
+        """
+        rows = self.candidates(job_desc, min_containment)
+        if not len(rows):
+            return rows, np.zeros(0)
+
+        scores = self.engine.score(job_desc, rows)
+        # Best score first, earlier pool position first among ties
+        order = np.lexsort((rows, -scores))
+        if limit is not None:
+            order = order[:limit]
+        return rows[order], scores[order]
\ No newline at end of file
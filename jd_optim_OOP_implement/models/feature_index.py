@@ -0,0 +1,510 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from collections import Counter
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer
+
+from utils.text_processing import extract_skills, preprocess_text
+from utils.file_lock import FileLock
+from utils.nlp_resources import get_lemmatizer
+from models.scoring_engine import SKILL_CATEGORIES, SKILL_COLUMNS, resume_texts, skills_to_bitmask
+
+# Bump whenever the stored features (or their layout on disk) change meaning
+INDEX_VERSION = 3
+
+# Default location, relative to the working directory like logs/
+DEFAULT_INDEX_DIR = os.path.join("cache", "feature_index")
+
+# Arrays stored per index generation, each in its own memory-mappable .npy file
+_ARRAY_NAMES = ('hashes', 'skills', 'indptr', 'indices', 'counts', 'text_offsets', 'text_blob')
+
+# Generations listed by meta.json before a save compacts them into one (saves
+# also compact once the delta generations hold more rows than the first one)
+MAX_GENERATIONS = 8
+
+# Attempts at loading the current generation while writers replace it
+_LOAD_ATTEMPTS = 5
+
+# Resumes analyzed per task when analysis is spread over an executor
+ANALYZE_BATCH_SIZE = 256
+
+# Tokenizer of the stored term counts
+_term_analyzer = CountVectorizer().build_analyzer()
+
+
+def content_hash(skill_text, similarity_text):
+    """
+    Hash the resume text that all stored features are derived from
+
+    Args:
+        skill_text (str): Text used for skill extraction
+        similarity_text (str): Text used for text similarity
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    digest.update(skill_text.encode('utf-8'))
+    digest.update(b'\x00')
+    digest.update(similarity_text.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _lemmatizer_name():
+    """Name (and rules version) of the lemmatizer behind the stored normalized text"""
+    lemmatizer = get_lemmatizer()
+    name = type(lemmatizer).__name__
+    version = getattr(lemmatizer, 'RULES_VERSION', None)
+    return name if version is None else f"{name}-{version}"
+
+
+def _generation_sequence(name):
+    """Sequence number of a generation directory (-1 for unnumbered ones)"""
+    try:
+        return int(name.split("-")[1])
+    except (IndexError, ValueError):
+        return -1
+
+
+def _analyze_batch(items):
+    """
+    Analyze resumes (runs in worker processes when an executor is used)
+
+    Args:
+        items (list): (skill_text, similarity_text) tuples
+
+    Returns:
+        list: (skill bitmask row, normalized text bytes, term counts) per resume
+    """
+    analyzed = []
+    for skill_text, similarity_text in items:
+        normalized = preprocess_text(similarity_text)
+        analyzed.append((
+            skills_to_bitmask(extract_skills(skill_text)),
+            normalized.encode('utf-8'),
+            Counter(_term_analyzer(normalized))
+        ))
+    return analyzed
+
+
+def _slice_arrays(arrays, start):
+    """Rows from `start` on, with offsets rebased to 0 (the rows of a delta generation)"""
+    nnz_start = int(arrays['indptr'][start])
+    text_start = int(arrays['text_offsets'][start])
+    return {
+        'hashes': arrays['hashes'][start:],
+        'skills': arrays['skills'][start:],
+        'indptr': arrays['indptr'][start:] - nnz_start,
+        'indices': arrays['indices'][nnz_start:],
+        'counts': arrays['counts'][nnz_start:],
+        'text_offsets': arrays['text_offsets'][start:] - text_start,
+        'text_blob': arrays['text_blob'][text_start:],
+    }
+
+
+def _concat_arrays(parts):
+    """Arrays of consecutive generations as one index (offsets shifted)"""
+    if len(parts) == 1:
+        return parts[0]
+    nnz_bases = np.cumsum([0] + [int(part['indptr'][-1]) for part in parts[:-1]])
+    text_bases = np.cumsum([0] + [int(part['text_offsets'][-1]) for part in parts[:-1]])
+    return {
+        'hashes': np.concatenate([part['hashes'] for part in parts]),
+        'skills': np.vstack([part['skills'] for part in parts]),
+        'indptr': np.concatenate([parts[0]['indptr'][:1]] + [
+            part['indptr'][1:] + base for part, base in zip(parts, nnz_bases)
+        ]),
+        'indices': np.concatenate([part['indices'] for part in parts]),
+        'counts': np.concatenate([part['counts'] for part in parts]),
+        'text_offsets': np.concatenate([parts[0]['text_offsets'][:1]] + [
+            part['text_offsets'][1:] + base for part, base in zip(parts, text_bases)
+        ]),
+        'text_blob': np.concatenate([part['text_blob'] for part in parts]),
+    }
+
+
+def _empty_arrays():
+    """Arrays of an index with no rows"""
+    return {
+        'hashes': np.zeros(0, dtype='S64'),
+        'skills': np.zeros((0, len(SKILL_CATEGORIES)), dtype=np.uint64),
+        'indptr': np.zeros(1, dtype=np.int64),
+        'indices': np.zeros(0, dtype=np.int32),
+        'counts': np.zeros(0, dtype=np.int32),
+        'text_offsets': np.zeros(1, dtype=np.int64),
+        'text_blob': np.zeros(0, dtype=np.uint8),
+    }
+
+
+class ResumeFeatureIndex:
+    """
+    Persistent per-resume feature store keyed by content hash
+
+    For every distinct resume text the index keeps the skill bitmasks, the
+    normalized (preprocessed) text and its term-count row over an append-only
+    vocabulary. Arrays live on disk as .npy files and are memory-mapped on load,
+    so opening the index is cheap and only unseen resumes are ever analyzed.
+
+    On disk the index is a list of numbered generations (meta.json names them
+    in order): an update writes only its new rows and terms as a delta
+    generation, and the generations are compacted into one when there are more
+    than MAX_GENERATIONS or the deltas outgrow the first generation, so disk
+    writes stay proportional to the new rows.
+
+    Processes sharing a directory (app workers, CLI, ingestion) write under a
+    file lock: a writer first merges the latest generations on disk, then saves.
+    Generations listed by the meta.json it replaced are kept for readers still
+    loading them; others are deleted. A read-only index (e.g. in worker
+    processes) never writes: resumes it has not stored are analyzed and kept in
+    memory only.
+    """
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, index_dir=DEFAULT_INDEX_DIR, read_only=False):
+        """
+        Open (or lazily create) an index
+
+        Args:
+            index_dir (str): Directory holding the index files
+            read_only (bool): Never write to the directory
+        """
+        self.index_dir = index_dir
+        self.read_only = read_only
+        self.meta_path = os.path.join(index_dir, "meta.json")
+        self._file_lock = FileLock(os.path.join(index_dir, "write.lock"))
+        self.analyzer = _term_analyzer
+        self._lock = threading.Lock()
+        self._reset()
+        self._load()
+
+    @classmethod
+    def shared(cls, index_dir=DEFAULT_INDEX_DIR):
+        """
+        Get the process-wide index instance for a directory
+
+        Args:
+            index_dir (str): Directory holding the index files
+
+        Returns:
+            ResumeFeatureIndex: Shared index
+        """
+        with cls._shared_lock:
+            index = cls._shared.get(index_dir)
+            if index is None:
+                index = cls(index_dir)
+                cls._shared[index_dir] = index
+            return index
+
+    def __len__(self):
+        return len(self.arrays['hashes'])
+
+    def _reset(self):
+        """Drop all rows"""
+        self.arrays = _empty_arrays()
+        self.terms = []
+        self.vocabulary = {}
+        self._row_of = {}
+        self._meta_mtime = None
+        self._generations = []  # (name, rows) of the stored generations, in order
+        self._stored_rows = 0
+        self._stored_terms = 0
+        self._sequence = -1
+        self._count_matrix = None
+
+    def _load(self):
+        """
+        Load the current generations from disk, memory-mapping all arrays
+
+        A single generation stays memory-mapped, several are concatenated. The
+        in-memory state is only replaced once every generation loaded completely.
+
+        Returns:
+            bool: True if the stored index is the one now in memory
+        """
+        for attempt in range(_LOAD_ATTEMPTS):
+            try:
+                mtime = os.path.getmtime(self.meta_path)
+                with open(self.meta_path, 'r') as f:
+                    meta = json.load(f)
+            except FileNotFoundError:
+                return False
+            except Exception as e:
+                print(f"Error loading resume feature index: {e}")
+                return False
+
+            # A different format, taxonomy or lemmatizer invalidates every stored row
+            if (meta.get('version') != INDEX_VERSION or
+                    meta.get('skill_columns') != [list(column) for column in SKILL_COLUMNS] or
+                    meta.get('lemmatizer') != _lemmatizer_name()):
+                # Numbering continues, so the unusable generations get cleaned up
+                self._meta_mtime = mtime
+                self._sequence = meta.get('sequence', _generation_sequence(meta.get('generation', '')))
+                return False
+
+            try:
+                parts = []
+                terms = []
+                for name, _ in meta['generations']:
+                    generation_dir = os.path.join(self.index_dir, name)
+                    parts.append({
+                        array_name: np.load(os.path.join(generation_dir, f"{array_name}.npy"), mmap_mode='r')
+                        for array_name in _ARRAY_NAMES
+                    })
+                    with open(os.path.join(generation_dir, "terms.json"), 'r') as f:
+                        terms.extend(json.load(f))
+                arrays = _concat_arrays(parts) if parts else _empty_arrays()
+                break
+            except FileNotFoundError:
+                # Replaced and cleaned up by other writers meanwhile, read meta.json again
+                time.sleep(0.01 * (attempt + 1))
+            except Exception as e:
+                print(f"Error loading resume feature index: {e}")
+                return False
+        else:
+            print("Error loading resume feature index: generation kept changing while loading")
+            return False
+
+        self.arrays = arrays
+        self.terms = terms
+        self.vocabulary = {term: idx for idx, term in enumerate(self.terms)}
+        self._row_of = {key.decode('ascii'): row for row, key in enumerate(arrays['hashes'])}
+        self._meta_mtime = mtime
+        self._generations = [(name, rows) for name, rows in meta['generations']]
+        self._stored_rows = len(arrays['hashes'])
+        self._stored_terms = len(terms)
+        self._sequence = meta['sequence']
+        self._count_matrix = None
+        return True
+
+    def _refresh(self):
+        """Reload if another process has saved a newer generation"""
+        try:
+            mtime = os.path.getmtime(self.meta_path)
+        except OSError:
+            return
+        if mtime != self._meta_mtime and not self._load():
+            # Stored rows are unusable (other format or lemmatizer), start over
+            sequence = self._sequence
+            self._reset()
+            self._meta_mtime = mtime
+            self._sequence = sequence
+
+    def _needs_compaction(self, new_rows):
+        """Whether a save should rewrite everything as one generation"""
+        if not self._generations or len(self._generations) >= MAX_GENERATIONS:
+            return True
+        delta_rows = sum(rows for _, rows in self._generations[1:]) + new_rows
+        return delta_rows > self._generations[0][1]
+
+    def _save(self):
+        """
+        Write the rows appended since the last load as a new generation
+
+        Rows and terms already stored are not written again, unless the
+        generations are compacted into one. Must be called with the file lock
+        held, after merging the stored generations.
+        """
+        new_rows = len(self) - self._stored_rows
+        compact = self._needs_compaction(new_rows)
+        start_row, start_term = (0, 0) if compact else (self._stored_rows, self._stored_terms)
+
+        sequence = self._sequence + 1
+        generation = f"gen-{sequence:010d}-{uuid.uuid4().hex[:8]}"
+        generation_dir = os.path.join(self.index_dir, generation)
+        generations = [] if compact else list(self._generations)
+        generations.append((generation, len(self) - start_row))
+
+        try:
+            os.makedirs(generation_dir, exist_ok=True)
+            arrays = _slice_arrays(self.arrays, start_row)
+            for name in _ARRAY_NAMES:
+                np.save(os.path.join(generation_dir, f"{name}.npy"), arrays[name])
+            with open(os.path.join(generation_dir, "terms.json"), 'w') as f:
+                json.dump(self.terms[start_term:], f)
+
+            meta = {
+                'version': INDEX_VERSION,
+                'generations': generations,
+                'sequence': sequence,
+                'rows': len(self),
+                'skill_columns': [list(column) for column in SKILL_COLUMNS],
+                'lemmatizer': _lemmatizer_name(),
+            }
+            tmp_path = f"{self.meta_path}.{generation}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(meta, f)
+            os.replace(tmp_path, self.meta_path)
+        except Exception as e:
+            # Keep working from memory if the cache directory is not writable
+            print(f"Error saving resume feature index: {e}")
+            return
+
+        # Keep the generations of the replaced meta.json for processes still
+        # loading them, remove the rest (best effort, readers may still map them)
+        keep = {name for name, _ in generations} | {name for name, _ in self._generations}
+        for entry in os.listdir(self.index_dir):
+            if entry.startswith("gen-") and entry not in keep:
+                shutil.rmtree(os.path.join(self.index_dir, entry), ignore_errors=True)
+
+        if compact:
+            # Switch to the memory-mapped copy (the in-memory arrays stay if that fails)
+            self._load()
+            return
+        self._generations = generations
+        self._stored_rows = len(self)
+        self._stored_terms = len(self.terms)
+        self._sequence = sequence
+        try:
+            self._meta_mtime = os.path.getmtime(self.meta_path)
+        except OSError:
+            pass
+
+    def _append(self, pending, executor=None):
+        """
+        Analyze unseen resumes and append them to the in-memory arrays
+
+        Args:
+            pending (dict): Content hash -> (skill_text, similarity_text)
+            executor (Executor): Optional executor analyzing batches in parallel
+        """
+        items = list(pending.values())
+        if executor is not None and len(items) > ANALYZE_BATCH_SIZE:
+            batches = [items[start:start + ANALYZE_BATCH_SIZE] for start in range(0, len(items), ANALYZE_BATCH_SIZE)]
+            analyzed = [result for batch in executor.map(_analyze_batch, batches) for result in batch]
+        else:
+            analyzed = _analyze_batch(items)
+
+        skill_rows = []
+        row_lengths = []
+        new_indices = []
+        new_counts = []
+        texts = []
+
+        # Vocabulary ids are assigned here, in pool order, so they do not depend on the executor
+        for skill_row, text, term_counts in analyzed:
+            skill_rows.append(skill_row)
+            texts.append(text)
+
+            columns = []
+            for term in term_counts:
+                if term not in self.vocabulary:
+                    self.vocabulary[term] = len(self.terms)
+                    self.terms.append(term)
+                columns.append(self.vocabulary[term])
+            order = np.argsort(columns)
+            new_indices.append(np.asarray(columns, dtype=np.int32)[order])
+            new_counts.append(np.asarray(list(term_counts.values()), dtype=np.int32)[order])
+            row_lengths.append(len(columns))
+
+        arrays = self.arrays
+        base_nnz = arrays['indptr'][-1]
+        base_text = arrays['text_offsets'][-1]
+        text_lengths = [len(text) for text in texts]
+
+        self.arrays = {
+            'hashes': np.concatenate([arrays['hashes'], np.array(list(pending), dtype='S64')]),
+            'skills': np.vstack([arrays['skills'], np.array(skill_rows, dtype=np.uint64)]),
+            'indptr': np.concatenate([arrays['indptr'], base_nnz + np.cumsum(row_lengths, dtype=np.int64)]),
+            'indices': np.concatenate([arrays['indices']] + new_indices),
+            'counts': np.concatenate([arrays['counts']] + new_counts),
+            'text_offsets': np.concatenate([arrays['text_offsets'], base_text + np.cumsum(text_lengths, dtype=np.int64)]),
+            'text_blob': np.concatenate([arrays['text_blob'], np.frombuffer(b"".join(texts), dtype=np.uint8)]),
+        }
+        self._count_matrix = None
+        start = len(self._row_of)
+        for offset, key in enumerate(pending):
+            self._row_of[key] = start + offset
+
+    def _pending(self, keys, skill_texts, similarity_texts):
+        """Unseen resumes by content hash"""
+        pending = {}
+        for key, skill_text, similarity_text in zip(keys, skill_texts, similarity_texts):
+            if key not in self._row_of and key not in pending:
+                pending[key] = (skill_text, similarity_text)
+        return pending
+
+    def _rows_for(self, resume_df, executor=None):
+        """Row numbers for every resume, indexing unseen ones first"""
+        skill_texts, similarity_texts = resume_texts(resume_df)
+        keys = [content_hash(s, t) for s, t in zip(skill_texts, similarity_texts)]
+
+        self._refresh()
+        if any(key not in self._row_of for key in keys):
+            if self.read_only:
+                self._append(self._pending(keys, skill_texts, similarity_texts), executor)
+            else:
+                with self._file_lock:
+                    # Other processes may have saved meanwhile: merge their rows first
+                    self._refresh()
+                    pending = self._pending(keys, skill_texts, similarity_texts)
+                    if pending:
+                        self._append(pending, executor)
+                        self._save()
+
+        return np.fromiter((self._row_of[key] for key in keys), dtype=np.int64, count=len(keys))
+
+    def update(self, resume_df, executor=None):
+        """
+        Index any resumes of a pool that are not stored yet
+
+        Args:
+            resume_df (DataFrame): DataFrame containing resume data
+            executor (Executor): Optional executor (e.g. a ProcessPoolExecutor)
+                analyzing the unseen resumes in parallel
+        """
+        with self._lock:
+            self._rows_for(resume_df, executor)
+
+    def features_for(self, resume_df):
+        """
+        Get scoring features for a resume pool, computing only unseen resumes
+
+        Args:
+            resume_df (DataFrame): DataFrame containing resume data
+
+        Returns:
+            tuple: (skill_bits, term_counts, vocabulary) where skill_bits holds one
+                uint64 mask per SKILL_CATEGORIES entry and term_counts is a CSR
+                matrix over the index vocabulary (which may grow later, terms
+                beyond term_counts.shape[1] are not part of this pool)
+        """
+        with self._lock:
+            rows = self._rows_for(resume_df)
+            arrays = self.arrays
+
+            skill_bits = np.asarray(arrays['skills'][rows])
+
+            if self._count_matrix is None:
+                self._count_matrix = sparse.csr_matrix(
+                    (arrays['counts'], arrays['indices'], arrays['indptr']),
+                    shape=(len(self), len(self.terms))
+                )
+            term_counts = self._count_matrix[rows].astype(np.float64)
+
+            return skill_bits, term_counts, self.vocabulary
+
+    def normalized_text(self, key):
+        """
+        Get the stored preprocessed text for a content hash
+
+        Args:
+            key (str): Content hash
+
+        Returns:
+            str or None: Normalized text, or None if the hash is not indexed
+        """
+        with self._lock:
+            row = self._row_of.get(key)
+            if row is None:
+                return None
+            start, end = self.arrays['text_offsets'][row:row + 2]
+            return bytes(self.arrays['text_blob'][start:end]).decode('utf-8')
\ No newline at end of file
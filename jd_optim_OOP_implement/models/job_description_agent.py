@@ -1,32 +1,182 @@
 import json
 import re
+import threading
 import boto3
 import streamlit as st
+from botocore.config import Config
+from utils.llm_cache import get_llm_cache, response_key
+
+# Summaries returned when no real summary could be generated (callers should not keep them)
+SUMMARY_UNAVAILABLE = "Summary generation unavailable - AI service connection not available."
+SUMMARY_FAILED = "Unable to generate summary of changes."
+
+# HTTP settings of the shared Bedrock client: enough pooled connections for every
+# concurrent session (and the parallel summary calls), kept alive between requests,
+# and a read timeout that allows a full max_tokens response
+BEDROCK_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    connect_timeout=10,
+    read_timeout=300,
+    retries={'max_attempts': 3, 'mode': 'standard'},
+)
+
+# Process-wide registries (boto3 clients are thread-safe, agents hold no session state)
+_session = None
+_clients = {}
+_agents = {}
+_registry_lock = threading.Lock()
+
+
+def get_bedrock_client(region_name, access_key=None, secret_key=None, endpoint_url=None):
+    """
+    Get the process-wide Bedrock runtime client for a set of credentials
+    
+    Credential resolution, endpoint loading and the connection pool are set up
+    once per process; every session then reuses the warm HTTPS connections.
+    
+    Args:
+        region_name (str): AWS region
+        access_key (str): AWS access key id (default credential chain if None)
+        secret_key (str): AWS secret access key
+        endpoint_url (str): Alternative endpoint, e.g. a local test server
+        
+    Returns:
+        botocore client for 'bedrock-runtime'
+    """
+    key = (region_name, access_key, secret_key, endpoint_url)
+    with _registry_lock:
+        client = _clients.get(key)
+        if client is None:
+            # boto3 sessions are not thread-safe, clients are only created under the lock
+            global _session
+            if _session is None:
+                _session = boto3.session.Session()
+            client = _session.client(
+                'bedrock-runtime',
+                aws_access_key_id=access_key,
+                aws_secret_access_key=secret_key,
+                region_name=region_name,
+                endpoint_url=endpoint_url,
+                config=BEDROCK_CLIENT_CONFIG,
+            )
+            _clients[key] = client
+        return client
+
+
+def get_agent(model_id, max_tokens=10000, temperature=0.7):
+    """
+    Get the process-wide agent for a model configuration
+    
+    Args:
+        model_id (str): Bedrock model id
+        max_tokens (int): Response token limit
+        temperature (float): Sampling temperature
+        
+    Returns:
+        JobDescriptionAgent: Shared agent
+    """
+    key = (model_id, max_tokens, temperature)
+    with _registry_lock:
+        agent = _agents.get(key)
+    if agent is not None and agent.client is not None:
+        return agent
+    
+    # Built outside the lock (client creation takes it); agents without a client
+    # (missing secrets) are rebuilt on the next call so fixed credentials are picked up
+    agent = JobDescriptionAgent(model_id, max_tokens=max_tokens, temperature=temperature)
+    with _registry_lock:
+        if agent.client is None:
+            return agent
+        return _agents.setdefault(key, agent)
+
+def split_versions(text, max_versions=3):
+    """
+    Split a (possibly partial) "VERSION n:" response into versions
+    
+    A trailing line that may be the start of the next header is held back, so
+    streamed text never shows half a header.
+    
+    Args:
+        text (str): Model response received so far
+        max_versions (int): Number of versions to return
+        
+    Returns:
+        list: Version texts (without headers), the last one possibly incomplete
+    """
+    line_start = text.rfind("\n") + 1
+    tail = text[line_start:]
+    if tail and ("VERSION ".startswith(tail) or re.fullmatch(r'VERSION \d*', tail)):
+        text = text[:line_start]
+    return [part.strip() for part in re.split(r'VERSION \d+:', text)[1:max_versions + 1]]
 
 class JobDescriptionAgent:
     """Agent for enhancing job descriptions using AWS Bedrock Claude"""
-    def __init__(self, model_id, max_tokens=10000, temperature=0.7):
+    def __init__(self, model_id, max_tokens=10000, temperature=0.7, response_cache=None, use_response_cache=True,
+                 client=None):
         self.model_id = model_id
         self.max_tokens = max_tokens
         self.temperature = temperature
         
-        # Initialize AWS client for Bedrock
+        # Responses persisted across sessions and app workers, keyed by model settings and prompt
+        self.response_cache = None
+        if use_response_cache:
+            self.response_cache = response_cache if response_cache is not None else get_llm_cache()
+        
+        # Use the given client, or the shared AWS client for Bedrock
+        if client is not None:
+            self.client = client
+            return
         try:
             # Use Streamlit secrets for credentials in production
-            self.client = boto3.client(
-                service_name='bedrock-runtime',
-                aws_access_key_id=st.secrets["aws"]["access_key"],
-                aws_secret_access_key=st.secrets["aws"]["secret_key"],
+            self.client = get_bedrock_client(
                 region_name=st.secrets["aws"]["region"],
+                access_key=st.secrets["aws"]["access_key"],
+                secret_key=st.secrets["aws"]["secret_key"],
             )
         except Exception as e:
             print(f"Error initializing AWS Bedrock client: {e}")
             self.client = None
 
-    def _invoke_bedrock_model(self, prompt):
-        """Private method to invoke the Bedrock model with a prompt"""
+    def _invoke_bedrock_model(self, prompt, use_cache=True, on_delta=None):
+        """
+        Private method to invoke the Bedrock model with a prompt
+        
+        Args:
+            prompt (str): Prompt text
+            use_cache (bool): Serve a cached response for the same request if there is one;
+                with False the model is always called (the new response is still cached)
+            on_delta (callable): If given, the response is streamed and on_delta(text)
+                is called with each text delta as it arrives (once with the whole
+                text for a cached response)
+        """
         if not self.client:
             return None
+        
+        key = None
+        if self.response_cache is not None:
+            key = response_key(self.model_id, self.temperature, self.max_tokens, prompt)
+            if use_cache:
+                cached_response = self.response_cache.get(key)
+                if cached_response is not None:
+                    if on_delta is not None and cached_response.get("content"):
+                        on_delta(cached_response["content"][0]["text"])
+                    return cached_response
+        
+        if on_delta is not None:
+            text = []
+            try:
+                for delta in self._stream_bedrock_model(prompt):
+                    text.append(delta)
+                    on_delta(delta)
+            except Exception as e:
+                print(f"Error streaming Bedrock model: {e}")
+                return None
+            
+            model_response = {"content": [{"type": "text", "text": "".join(text)}]}
+            if key is not None and text:
+                self.response_cache.put(key, self.model_id, model_response)
+            return model_response
             
         try:
             native_request = {
@@ -43,13 +193,86 @@ class JobDescriptionAgent:
             )
             
             response_body = response['body'].read().decode("utf-8")
-            return json.loads(response_body)
+            model_response = json.loads(response_body)
+            
+            # Only complete answers are cached, errors are retried on the next call
+            if key is not None and model_response.get("content"):
+                self.response_cache.put(key, self.model_id, model_response)
+            return model_response
         except Exception as e:
             print(f"Error invoking Bedrock model: {e}")
             return None
+    
+    def stream_text(self, prompt):
+        """
+        Stream the model's answer to a prompt (not cached)
+        
+        Args:
+            prompt (str): Prompt text
+            
+        Yields:
+            str: Text deltas as the model produces them
+        """
+        if not self.client:
+            return
+        try:
+            yield from self._stream_bedrock_model(prompt)
+        except Exception as e:
+            print(f"Error streaming Bedrock model: {e}")
+    
+    def _stream_bedrock_model(self, prompt):
+        """
+        Private generator invoking the Bedrock model with a streamed response
+        
+        Args:
+            prompt (str): Prompt text
+            
+        Yields:
+            str: Text deltas
             
-    def generate_initial_descriptions(self, job_description):
-        """Generate detailed and structured job descriptions based on the given job description."""
+        Raises:
+            RuntimeError: If the stream ends before the message is complete
+        """
+        native_request = {
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        
+        response = self.client.invoke_model_with_response_stream(
+            modelId=self.model_id,
+            body=json.dumps(native_request),
+            contentType="application/json",
+        )
+        
+        complete = False
+        for event in response['body']:
+            chunk = event.get('chunk')
+            if not chunk:
+                continue
+            message = json.loads(chunk['bytes'].decode("utf-8"))
+            if message.get("type") == "content_block_delta":
+                text = message.get("delta", {}).get("text")
+                if text:
+                    yield text
+            elif message.get("type") == "message_stop":
+                complete = True
+        
+        # An interrupted stream must not be taken (and cached) as a complete answer
+        if not complete:
+            raise RuntimeError("Response stream ended before message_stop")
+            
+    def generate_initial_descriptions(self, job_description, regenerate=False, on_update=None):
+        """
+        Generate detailed and structured job descriptions based on the given job description.
+        
+        Args:
+            job_description (str): The original job description
+            regenerate (bool): Ask the model again instead of reusing a cached response
+            on_update (callable): If given, the response is streamed and on_update(text) is
+                called with the text received so far (split_versions() splits it)
+        """
         # If client is not initialized properly, return dummy versions
         if not self.client:
             return [
@@ -94,7 +317,13 @@ class JobDescriptionAgent:
             f"### Original Job Description:\n{job_description}\n"
         )
 
-        model_response = self._invoke_bedrock_model(prompt)
+        on_delta = None
+        if on_update is not None:
+            received = [""]
+            def on_delta(delta):
+                received[0] += delta
+                on_update(received[0])
+        model_response = self._invoke_bedrock_model(prompt, use_cache=not regenerate, on_delta=on_delta)
         
         try:
             if model_response and "content" in model_response and isinstance(model_response["content"], list):
@@ -125,13 +354,16 @@ class JobDescriptionAgent:
             f"Enhanced Version 3 of the job description:\n{job_description}"
         ]
 
-    def generate_final_description(self, selected_description, feedback_history):
+    def generate_final_description(self, selected_description, feedback_history, regenerate=False, on_update=None):
         """
         Generate enhanced description incorporating feedback history
         
         Args:
             selected_description (str): The base description to enhance
             feedback_history (list): List of previous feedback items
+            regenerate (bool): Ask the model again instead of reusing a cached response
+            on_update (callable): If given, the response is streamed and on_update(text)
+                is called with the text received so far
         """
         # If client is not initialized properly, return the selected description
         if not self.client:
@@ -180,7 +412,13 @@ class JobDescriptionAgent:
                 "Return the complete enhanced job description incorporating all feedback."
             )
         
-        model_response = self._invoke_bedrock_model(prompt)
+        on_delta = None
+        if on_update is not None:
+            received = [""]
+            def on_delta(delta):
+                received[0] += delta
+                on_update(received[0])
+        model_response = self._invoke_bedrock_model(prompt, use_cache=not regenerate, on_delta=on_delta)
         
         try:
             if model_response and "content" in model_response and isinstance(model_response["content"], list):
@@ -190,20 +428,21 @@ class JobDescriptionAgent:
             
         return selected_description + f"\n\n[Error generating final version: Unable to process feedback]"
 
-    def generate_version_summary(self, original_description, enhanced_description):
+    def generate_version_summary(self, original_description, enhanced_description, regenerate=False):
         """
         Generate a summary of changes between the original and enhanced job descriptions
         
         Args:
             original_description (str): The original job description
             enhanced_description (str): The enhanced job description
+            regenerate (bool): Ask the model again instead of reusing a cached response
             
         Returns:
             str: A paragraph summarizing the key changes
         """
         # If client is not initialized properly, return a simple summary
         if not self.client:
-            return "Summary generation unavailable - AI service connection not available."
+            return SUMMARY_UNAVAILABLE
                 
         # Construct prompt for the summary
         prompt = (
@@ -225,7 +464,7 @@ class JobDescriptionAgent:
             "### Summary of Changes (3-5 sentences):\n"
         )
         
-        model_response = self._invoke_bedrock_model(prompt)
+        model_response = self._invoke_bedrock_model(prompt, use_cache=not regenerate)
         
         try:
             if model_response and "content" in model_response and isinstance(model_response["content"], list):
@@ -234,4 +473,4 @@ class JobDescriptionAgent:
         except Exception as e:
             print(f"Error generating summary: {str(e)}")
             
-        return "Unable to generate summary of changes."
\ No newline at end of file
+        return SUMMARY_FAILED
\ No newline at end of file
@@ -0,0 +1,135 @@
+import pandas as pd
+
+from utils.text_processing import TECH_KEYWORDS
+
+# Category of every taxonomy keyword; JD skills outside the taxonomy go to 'other'
+_KEYWORD_CATEGORIES = {
+    keyword: category
+    for category, keywords in TECH_KEYWORDS.items()
+    for keyword in keywords
+}
+OTHER_CATEGORY = 'other'
+
+# Certification values that mean "no certification"
+_NO_CERTIFICATION = {'', 'nan', 'none', 'none mentioned', 'not mentioned', 'n/a', 'na', 'error'}
+
+# Certification count giving a full radar axis
+FULL_CERT_COUNT = 10
+
+
+def split_items(value):
+    """
+    Split a comma-separated field into lowercase items
+
+    Args:
+        value: Field value (NaN and None give no items)
+
+    Returns:
+        list: Stripped, lowercase, de-duplicated items in their original order
+    """
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return []
+    items = (item.strip().lower() for item in str(value).split(','))
+    return list(dict.fromkeys(item for item in items if item))
+
+
+def job_match_profile(job_desc):
+    """
+    Prepare the skills and tools of a job description for breakdowns
+
+    Built once per job description and shared by every candidate's breakdown.
+
+    Args:
+        job_desc (dict): Job description with Skills and Tools fields
+
+    Returns:
+        dict: 'skills' as (skill, category) pairs and 'tools' as a list
+    """
+    if not isinstance(job_desc, (dict, pd.Series)):
+        return {'skills': [], 'tools': []}
+    return {
+        'skills': [
+            (skill, _KEYWORD_CATEGORIES.get(skill, OTHER_CATEGORY))
+            for skill in split_items(job_desc.get('Skills', ''))
+        ],
+        'tools': split_items(job_desc.get('Tools', ''))
+    }
+
+
+def count_certifications(value):
+    """Number of listed certifications, placeholders such as "None mentioned" excluded"""
+    return sum(1 for item in split_items(value) if item not in _NO_CERTIFICATION)
+
+
+def match_breakdown(profile, resume_skills, resume_tools, resume_certifications=''):
+    """
+    Compare one resume with a job description
+
+    A JD skill or tool counts as matched when it appears in the resume's
+    Skills or Tools text, like the ranking page's scoring does.
+
+    Args:
+        profile (dict): Result of job_match_profile
+        resume_skills (str): Resume Skills field
+        resume_tools (str): Resume Tools field
+        resume_certifications (str): Resume Certifications field
+
+    Returns:
+        dict: Compact breakdown with
+            'skills': category -> {'matched': [...], 'missing': [...]}
+            'skill_overlap': share of the JD skills matched
+            'tools': {'matched': [...], 'missing': [...]}
+            'tool_overlap': share of the JD tools matched
+            'cert_count': number of certifications
+    """
+    skills_text = str(resume_skills).lower()
+    tools_text = str(resume_tools).lower()
+
+    skills = {}
+    matched_skills = 0
+    for skill, category in profile['skills']:
+        bucket = skills.setdefault(category, {'matched': [], 'missing': []})
+        if skill in skills_text:
+            bucket['matched'].append(skill)
+            matched_skills += 1
+        else:
+            bucket['missing'].append(skill)
+
+    tools = {'matched': [], 'missing': []}
+    for tool in profile['tools']:
+        tools['matched' if tool in tools_text else 'missing'].append(tool)
+
+    return {
+        'skills': skills,
+        'skill_overlap': matched_skills / max(1, len(profile['skills'])),
+        'tools': tools,
+        'tool_overlap': len(tools['matched']) / max(1, len(profile['tools'])),
+        'cert_count': count_certifications(resume_certifications)
+    }
+
+
+def matched_skills(breakdown):
+    """All matched JD skills of a breakdown, in category order"""
+    return [skill for bucket in breakdown['skills'].values() for skill in bucket['matched']]
+
+
+def missing_skills(breakdown):
+    """All missing JD skills of a breakdown, in category order"""
+    return [skill for bucket in breakdown['skills'].values() for skill in bucket['missing']]
+
+
+def radar_scores(breakdown):
+    """
+    Radar chart axes of a breakdown
+
+    Args:
+        breakdown (dict): Result of match_breakdown
+
+    Returns:
+        list: [technical skills, tools proficiency, certifications] in [0, 1]
+    """
+    return [
+        breakdown['skill_overlap'],
+        breakdown['tool_overlap'],
+        min(breakdown['cert_count'] / FULL_CERT_COUNT, 1.0)
+    ]
\ No newline at end of file
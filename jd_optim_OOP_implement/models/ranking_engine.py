@@ -0,0 +1,717 @@
+import hashlib
+import math
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from utils.pool_cache import POOL_COLUMNS
+from utils.text_processing import extract_skills, preprocess_text
+from models.candidate_retrieval import DEFAULT_MIN_CONTAINMENT, ContainmentRetriever
+from models.match_breakdown import job_match_profile
+from models.score_buckets import rank_and_bucket, score_thresholds
+from models.scoring_engine import SKILL_WEIGHT, TEXT_WEIGHT, PoolScoringEngine, job_texts, pool_fingerprint
+from models.streaming_ranker import StreamingRanker, resume_entry
+
+# Scorer used when none is requested
+DEFAULT_SCORER = 'tfidf'
+
+# Resume rows of the analyzed pools kept in memory for re-ranking with another JD
+MAX_CACHED_POOL_ROWS = 100000
+
+# Ranked entries of the results kept per (scorer, JD, pool, options)
+MAX_CACHED_RESULT_ENTRIES = 100000
+
+# Full rankings attach match breakdowns to the best entries of each bucket only
+# (the ones the UI displays); streaming rankings attach them to every kept entry
+BREAKDOWN_LIMIT = 50
+
+
+def job_fingerprint(job_desc):
+    """
+    Hash the fields of a job description that ranking reads
+
+    Args:
+        job_desc (dict): Job description with Skills and Tools fields
+
+    Returns:
+        str: Hex digest, equal for job descriptions that rank identically
+    """
+    if not isinstance(job_desc, (dict, pd.Series)):
+        return ""
+    digest = hashlib.sha256()
+    for field in ('Skills', 'Tools'):
+        value = job_desc.get(field) if field in job_desc else None
+        digest.update(f"{field}={value!r}\0".encode('utf-8'))
+    return digest.hexdigest()
+
+
+class PoolCache:
+    """
+    Per-pool artifacts (analyzed engine, retrieval index) kept across rankings
+
+    Artifacts are keyed by the pool's content fingerprint, so a pool re-read
+    from disk or shared through the pool store finds the work done for an
+    earlier ranking; only the job description side is recomputed. The
+    fingerprint is a hash of the columns ranking reads or shows, recomputed
+    on every lookup (no reference to the DataFrame is kept), so a pool edited
+    in place gets a new fingerprint.
+
+    Memory is bounded by the number of resume rows of the cached pools; the
+    most recently used pool is kept even when it alone exceeds the bound.
+    """
+
+    def __init__(self, max_rows=MAX_CACHED_POOL_ROWS):
+        """
+        Args:
+            max_rows (int): Resume rows kept over all pools, least recently
+                used pools evicted first
+        """
+        self.max_rows = max_rows
+        self._pools = OrderedDict()  # fingerprint -> artifacts
+        self._pool_rows = {}  # fingerprint -> rows
+        self._lock = threading.Lock()
+
+    def fingerprint(self, resume_df):
+        """Content fingerprint of the scored and displayed columns of a pool"""
+        return pool_fingerprint(resume_df, columns=_entry_columns(resume_df))
+
+    def get(self, resume_df, name, build):
+        """
+        Get an artifact of a pool, building it on first use
+
+        Args:
+            resume_df (DataFrame): Resume pool
+            name (str): Artifact name
+            build (callable): Called without arguments to build a missing artifact
+
+        Returns:
+            The artifact
+        """
+        fingerprint = self.fingerprint(resume_df)
+        with self._lock:
+            artifacts = self._pools.get(fingerprint)
+            if artifacts is not None:
+                self._pools.move_to_end(fingerprint)
+                if name in artifacts:
+                    return artifacts[name]
+
+        artifact = build()
+        with self._lock:
+            self._pools.setdefault(fingerprint, {})[name] = artifact
+            self._pools.move_to_end(fingerprint)
+            self._pool_rows[fingerprint] = len(resume_df)
+            while len(self._pools) > 1 and sum(self._pool_rows.values()) > self.max_rows:
+                evicted, _ = self._pools.popitem(last=False)
+                del self._pool_rows[evicted]
+        return artifact
+
+    def clear(self):
+        """Forget every pool"""
+        with self._lock:
+            self._pools.clear()
+            self._pool_rows.clear()
+
+
+def _entry_columns(resume_df):
+    """Pool columns read by scoring or shown in result records"""
+    return [column for column in POOL_COLUMNS if column in resume_df.columns]
+
+
+def _pool_artifact(pool_cache, resume_df, name, build):
+    """Artifact from a pool cache, or built directly when caching is off"""
+    return build() if pool_cache is None else pool_cache.get(resume_df, name, build)
+
+
+def _pool_engine(resume_df, feature_index, pool_cache):
+    """Analyzed pool, reused across job descriptions when a cache is given"""
+    return _pool_artifact(
+        pool_cache, resume_df, 'engine',
+        lambda: PoolScoringEngine(resume_df, feature_index=feature_index)
+    )
+
+
+def _pool_retriever(resume_df, feature_index, pool_cache):
+    """Inverted retrieval index of a pool, reused across job descriptions when a cache is given"""
+    return _pool_artifact(
+        pool_cache, resume_df, 'retriever',
+        lambda: ContainmentRetriever(_pool_engine(resume_df, feature_index, pool_cache))
+    )
+
+
+class KeywordScorer:
+    """
+    Share of the JD's listed skills and tools found in each resume
+
+    A JD skill counts when it occurs as a substring of the resume's Skills
+    field (tools likewise in Tools); the score is 70% skills and 30% tools.
+    Cheap and transparent, and what the breakdown panel shows.
+    """
+
+    name = 'keyword'
+    label = 'Keyword match'
+    TOOL_WEIGHT = 0.3
+
+    def __init__(self, feature_index=None):
+        """Keyword matching needs no precomputed features"""
+        self.feature_index = feature_index
+
+    @staticmethod
+    def _hits(column, items):
+        """Number of items found in every value of a lowercased text column"""
+        hits = np.zeros(len(column))
+        for item in items:
+            hits += column.str.contains(item, regex=False).to_numpy(dtype=np.float64, na_value=0.0)
+        return hits
+
+    def score(self, job_desc, resume_df, pool_cache=None, rows=None):
+        """
+        Score every resume of a pool
+
+        Args:
+            job_desc (dict): Job description with Skills and Tools fields
+            resume_df (DataFrame): DataFrame containing resume data
+            pool_cache (PoolCache): Optional cache for the pool side of the work
+            rows (numpy.ndarray): Optional pool positions to score (e.g. a
+                retrieval shortlist), all resumes when None
+
+        Returns:
+            numpy.ndarray: Scores in pool order, aligned with rows when given
+        """
+        profile = job_match_profile(job_desc)
+        skills = [skill for skill, _ in profile['skills']]
+        tools = profile['tools']
+
+        def lowered(column):
+            if column not in resume_df.columns:
+                return pd.Series([""] * len(resume_df))
+            return resume_df[column].fillna("").astype(str).str.lower()
+
+        skills_text = _pool_artifact(pool_cache, resume_df, 'skills_lower', lambda: lowered('Skills'))
+        tools_text = _pool_artifact(pool_cache, resume_df, 'tools_lower', lambda: lowered('Tools'))
+        if rows is not None:
+            skills_text, tools_text = skills_text.iloc[rows], tools_text.iloc[rows]
+        skill_overlap = self._hits(skills_text, skills) / max(1, len(skills))
+        tool_overlap = self._hits(tools_text, tools) / max(1, len(tools))
+        return (1.0 - self.TOOL_WEIGHT) * skill_overlap + self.TOOL_WEIGHT * tool_overlap
+
+
+class TfidfScorer:
+    """
+    Taxonomy skill match blended with pairwise TF-IDF cosine similarity
+
+    The scoring used by ResumeAnalyzer.compute_similarity (70% skill match,
+    30% text similarity), computed with the vectorized pool engine.
+    """
+
+    name = 'tfidf'
+    label = 'Skills + TF-IDF'
+
+    def __init__(self, feature_index=None):
+        """
+        Args:
+            feature_index (ResumeFeatureIndex): Optional persistent feature store
+        """
+        self.feature_index = feature_index
+
+    def score(self, job_desc, resume_df, pool_cache=None, rows=None):
+        """Score every resume of a pool (see KeywordScorer.score)"""
+        # With a cached engine only the JD vector and a few sparse products are computed
+        return _pool_engine(resume_df, self.feature_index, pool_cache).score(job_desc, rows)
+
+
+class BM25Scorer:
+    """
+    Taxonomy skill match blended with Okapi BM25 text relevance
+
+    BM25 uses the pool itself for document frequencies and lengths, so rare
+    JD terms weigh more and long resumes are not favoured for repeating words.
+    The text part is normalized by its upper bound (every JD term present with
+    saturated frequency), which keeps scores in [0, 1] like the other scorers.
+
+    Those statistics belong to the whole pool: when a pool is scored chunk by
+    chunk, they are gathered first with collection_stats() and passed to every
+    chunk's score() call, so chunked scores equal whole-pool scores.
+    """
+
+    name = 'bm25'
+    label = 'Skills + BM25'
+
+    # Chunk-wise scoring needs collection_stats() of the whole pool first
+    needs_collection_stats = True
+
+    def __init__(self, feature_index=None, k1=1.5, b=0.75):
+        """
+        Args:
+            feature_index (ResumeFeatureIndex): Optional persistent feature store
+            k1 (float): Term frequency saturation
+            b (float): Document length normalization
+        """
+        self.feature_index = feature_index
+        self.k1 = k1
+        self.b = b
+
+    @staticmethod
+    def _job_terms(engine, job_text):
+        """Distinct terms of a preprocessed JD text"""
+        return set(engine.analyzer(job_text))
+
+    @staticmethod
+    def _add_stats(stats, engine):
+        """Add an analyzed pool (or chunk) to collection statistics"""
+        stats['size'] += engine.size
+        stats['total_length'] += float(engine.term_counts.sum())
+
+        n_terms = engine.term_counts.shape[1]
+        located = [
+            (term, engine.vocabulary.get(term)) for term in stats['doc_freq']
+        ]
+        located = [(term, idx) for term, idx in located if idx is not None and idx < n_terms]
+        if not located:
+            return
+        columns = [idx for _, idx in located]
+        doc_freq = np.bincount(engine.term_counts[:, columns].tocoo().col, minlength=len(columns))
+        for (term, _), count in zip(located, doc_freq):
+            stats['doc_freq'][term] += int(count)
+
+    def collection_stats(self, job_desc, resume_chunks, pool_cache=None):
+        """
+        BM25 statistics of a pool given chunk by chunk
+
+        Only the job description's terms are counted, so the statistics are
+        small and can be gathered in one pass over any chunk source.
+
+        Args:
+            job_desc (dict): Job description with Skills and Tools fields
+            resume_chunks (iterable): DataFrame chunks of the pool
+            pool_cache (PoolCache): Optional cache for the analyzed chunks
+
+        Returns:
+            dict: 'size', 'total_length' (sum of resume lengths in terms) and
+                'doc_freq' (JD term -> number of resumes containing it)
+        """
+        _, similarity_text = job_texts(job_desc)
+        job_text = preprocess_text(similarity_text)
+        stats = None
+        for chunk_df in resume_chunks:
+            if len(chunk_df) == 0:
+                continue
+            engine = _pool_engine(chunk_df, self.feature_index, pool_cache)
+            if stats is None:
+                stats = {'size': 0, 'total_length': 0.0,
+                         'doc_freq': dict.fromkeys(self._job_terms(engine, job_text), 0)}
+            self._add_stats(stats, engine)
+        return stats or {'size': 0, 'total_length': 0.0, 'doc_freq': {}}
+
+    def text_scores(self, engine, job_text, rows=None, stats=None):
+        """
+        Normalized BM25 of a preprocessed JD text against every resume
+
+        Args:
+            engine (PoolScoringEngine): Analyzed pool (or chunk of a pool)
+            job_text (str): Preprocessed job description text
+            rows (numpy.ndarray): Optional positions to score
+            stats (dict): Statistics of the whole pool from collection_stats(),
+                those of the engine's own resumes when None
+
+        Returns:
+            numpy.ndarray: Scores in [0, 1]
+        """
+        terms = self._job_terms(engine, job_text)
+        if stats is None:
+            stats = {'size': 0, 'total_length': 0.0, 'doc_freq': dict.fromkeys(terms, 0)}
+            self._add_stats(stats, engine)
+        scores = self._text_scores(engine, terms, stats)
+        return scores if rows is None else scores[rows]
+
+    def _text_scores(self, engine, terms, stats):
+        """Normalized BM25 of JD terms against every resume of an engine"""
+        size = engine.size
+        if not terms or not size or not stats['size']:
+            return np.zeros(size)
+
+        # Pool-level idf of every JD term (terms no resume contains still count
+        # towards the upper bound)
+        idf = {
+            term: math.log((stats['size'] - df + 0.5) / (df + 0.5) + 1.0)
+            for term, df in ((term, stats['doc_freq'].get(term, 0)) for term in terms)
+        }
+        upper_bound = sum(idf.values()) * (self.k1 + 1.0)
+
+        n_terms = engine.term_counts.shape[1]
+        located = sorted(
+            (idx, term) for idx, term in ((engine.vocabulary.get(term), term) for term in terms)
+            if idx is not None and idx < n_terms
+        )
+        if not located:
+            return np.zeros(size)
+        columns = [idx for idx, _ in located]
+        column_idf = np.array([idf[term] for _, term in located])
+
+        doc_lengths = np.asarray(engine.term_counts.sum(axis=1)).ravel()
+        avg_length = (stats['total_length'] / stats['size']) or 1.0
+
+        counts = engine.term_counts[:, columns].tocoo()
+        tf = counts.data
+        norm = self.k1 * (1.0 - self.b + self.b * doc_lengths[counts.row] / avg_length)
+        weights = column_idf[counts.col] * tf * (self.k1 + 1.0) / (tf + norm)
+        return np.bincount(counts.row, weights=weights, minlength=size) / upper_bound
+
+    def score(self, job_desc, resume_df, pool_cache=None, rows=None, stats=None):
+        """
+        Score every resume of a pool (see KeywordScorer.score)
+
+        Args:
+            stats (dict): Whole-pool statistics from collection_stats() when
+                resume_df is only a chunk of the pool
+        """
+        engine = _pool_engine(resume_df, self.feature_index, pool_cache)
+        skill_text, similarity_text = job_texts(job_desc)
+        job_skills = extract_skills(skill_text) if skill_text else {}
+
+        skill_scores = engine.skill_scores(job_skills, rows)
+        text_scores = self.text_scores(engine, preprocess_text(similarity_text), rows, stats)
+        return (SKILL_WEIGHT * skill_scores) + (TEXT_WEIGHT * text_scores)
+
+
+# Available scorers by name
+SCORERS = {scorer.name: scorer for scorer in (KeywordScorer, TfidfScorer, BM25Scorer)}
+
+
+def register_scorer(scorer_class):
+    """
+    Make a scorer available by name
+
+    Args:
+        scorer_class (type): Class with `name` and `label` attributes, built as
+            scorer_class(feature_index=...) and providing
+            score(job_desc, resume_df, pool_cache=None, rows=None)
+
+    Returns:
+        type: The class, so this can be used as a decorator
+    """
+    SCORERS[scorer_class.name] = scorer_class
+    return scorer_class
+
+
+def scorer_labels():
+    """Scorer name -> display label, in registration order"""
+    return {name: scorer.label for name, scorer in SCORERS.items()}
+
+
+# Module-level caches, shared by every engine (and Streamlit session) in the process
+_shared_pool_cache = PoolCache()
+_results_cache = OrderedDict()
+_results_entries = {}  # results cache key -> ranked entries
+_results_lock = threading.Lock()
+
+
+def get_pool_cache():
+    """
+    Get the process-wide pool cache
+
+    Returns:
+        PoolCache: Shared cache
+    """
+    return _shared_pool_cache
+
+
+def clear_ranking_caches():
+    """Forget cached pools and ranking results (e.g. after changing a scorer)"""
+    _shared_pool_cache.clear()
+    with _results_lock:
+        _results_cache.clear()
+        _results_entries.clear()
+
+
+class RankingEngine:
+    """
+    Single entry point for scoring and ranking resume pools
+
+    Every ranking path (ranking page, ResumeAnalyzer, batch CLI, legacy
+    frontend) goes through this class with a pluggable scorer, then shares
+    the same bucketing, breakdowns and streaming ranker.
+
+    Whole-pool rankings are cached per (JD hash, pool hash): the analyzed pool
+    is kept after the first ranking, so re-ranking it for an edited JD only
+    builds the JD side and multiplies it against the cached resume matrices.
+
+    For large pools, rank(shortlist=True) puts an inverted-index retrieval
+    stage in front of the scorer: only the resumes containing enough of the
+    JD's terms and skills are scored exactly and ranked, with a fallback to
+    exhaustive scoring when the shortlist is too small to fill the results.
+    """
+
+    def __init__(self, scorer=DEFAULT_SCORER, feature_index=None, pool_cache=None):
+        """
+        Initialize the engine
+
+        Args:
+            scorer (str or object): Scorer name from SCORERS, or a scorer instance
+            feature_index (ResumeFeatureIndex): Optional persistent feature store
+                used by scorers that analyze resume text
+            pool_cache (PoolCache): Cache for analyzed pools, the process-wide one by default
+        """
+        if isinstance(scorer, str):
+            if scorer not in SCORERS:
+                raise ValueError(f"Unknown scorer '{scorer}', expected one of: {', '.join(SCORERS)}")
+            scorer = SCORERS[scorer](feature_index=feature_index)
+        self.scorer = scorer
+        self.feature_index = feature_index
+        self.pool_cache = pool_cache if pool_cache is not None else get_pool_cache()
+
+    def score(self, job_desc, resume_df, pool_cache=None, rows=None, stats=None):
+        """
+        Score every resume of a pool
+
+        Args:
+            job_desc (dict): Job description with Skills and Tools fields
+            resume_df (DataFrame): DataFrame containing resume data
+            pool_cache (PoolCache): Optional cache for the pool side of the work
+            rows (numpy.ndarray): Optional pool positions to score, all when None
+            stats (dict): Whole-pool statistics from collection_stats() when
+                resume_df is a chunk of a larger pool
+
+        Returns:
+            numpy.ndarray: Scores in pool order, aligned with rows when given
+        """
+        if resume_df is None or len(resume_df) == 0 or (rows is not None and not len(rows)):
+            return np.array([])
+        options = {}
+        if rows is not None:
+            options['rows'] = rows
+        if stats is not None:
+            options['stats'] = stats
+        return np.asarray(self.scorer.score(job_desc, resume_df, pool_cache, **options), dtype=np.float64)
+
+    @property
+    def needs_collection_stats(self):
+        """Whether chunk-wise scoring needs whole-pool statistics first (BM25)"""
+        return getattr(self.scorer, 'needs_collection_stats', False)
+
+    def collection_stats(self, job_desc, resume_chunks):
+        """
+        Whole-pool statistics for scoring the pool chunk by chunk
+
+        Args:
+            job_desc (dict): Job description with Skills and Tools fields
+            resume_chunks (iterable): DataFrame chunks of the pool
+
+        Returns:
+            dict or None: Statistics to pass to score(), None for scorers whose
+                scores do not depend on the rest of the pool
+        """
+        if not self.needs_collection_stats:
+            return None
+        return self.scorer.collection_stats(job_desc, resume_chunks)
+
+    def candidates(self, job_desc, resume_df, min_containment=DEFAULT_MIN_CONTAINMENT, use_cache=True):
+        """
+        Retrieve the resumes likely to match a job description
+
+        Args:
+            job_desc (dict): Job description with Skills and Tools fields
+            resume_df (DataFrame): DataFrame containing resume data
+            min_containment (float): Recall knob, share of the JD's terms and
+                skills a resume needs once the pool has many matching resumes
+                (0 keeps every resume sharing anything with the JD)
+            use_cache (bool): Reuse the pool's retrieval index
+
+        Returns:
+            numpy.ndarray: Sorted pool positions
+        """
+        return self._search(job_desc, resume_df, min_containment, use_cache)[0]
+
+    def _search(self, job_desc, resume_df, min_containment, use_cache):
+        """Candidates of a job description and whether they are every matching resume"""
+        if resume_df is None or len(resume_df) == 0:
+            return np.zeros(0, dtype=np.int64), True
+        pool_cache = self.pool_cache if use_cache else None
+        return _pool_retriever(resume_df, self.feature_index, pool_cache).search(job_desc, min_containment)
+
+    def iter_score_chunks(self, job_desc, resume_chunks, chunk_size=5000, stats=None):
+        """
+        Score a resume pool chunk by chunk
+
+        Scorers that need whole-pool statistics (BM25) get them from a first pass
+        over the chunks, so the chunks must be re-iterable: a DataFrame or a
+        list of DataFrames. One-shot iterables (e.g. pd.read_csv(..., chunksize=...))
+        need precomputed stats from collection_stats() for those scorers.
+
+        Args:
+            job_desc (dict): Job description with Skills and Tools fields
+            resume_chunks (DataFrame or iterable): A resume DataFrame, or an iterable of
+                DataFrame chunks such as pd.read_csv(..., chunksize=...)
+            chunk_size (int): Rows per chunk when a single DataFrame is given
+            stats (dict): Precomputed whole-pool statistics
+
+        Yields:
+            tuple: (offset, chunk_df, scores) for each chunk
+
+        Raises:
+            ValueError: If the scorer needs statistics the chunks cannot provide
+        """
+        if isinstance(resume_chunks, pd.DataFrame):
+            pool_df = resume_chunks
+            resume_chunks = [
+                pool_df.iloc[start:start + chunk_size]
+                for start in range(0, len(pool_df), chunk_size)
+            ]
+
+        if stats is None and self.needs_collection_stats:
+            if not isinstance(resume_chunks, (list, tuple)):
+                raise ValueError(
+                    f"The '{self.scorer.name}' scorer needs statistics of the whole pool: pass a DataFrame "
+                    "or a list of chunks, or stats from collection_stats()"
+                )
+            stats = self.collection_stats(job_desc, resume_chunks)
+
+        offset = 0
+        for chunk_df in resume_chunks:
+            if len(chunk_df) == 0:
+                continue
+            # Scores only depend on the resume itself (and, for BM25, on the
+            # statistics of the whole pool)
+            yield offset, chunk_df, self.score(job_desc, chunk_df, stats=stats)
+            offset += len(chunk_df)
+
+    def _cached_results(self, key):
+        """Cached ranking results, as a copy the caller may update"""
+        with _results_lock:
+            results = _results_cache.get(key)
+            if results is None:
+                return None
+            _results_cache.move_to_end(key)
+            return dict(results)
+
+    def _store_results(self, key, results):
+        """Remember ranking results, evicting the least recently used ones"""
+        entries = results['candidates']
+        if entries > MAX_CACHED_RESULT_ENTRIES:
+            return
+        with _results_lock:
+            _results_cache[key] = dict(results)
+            _results_cache.move_to_end(key)
+            _results_entries[key] = entries
+            while sum(_results_entries.values()) > MAX_CACHED_RESULT_ENTRIES:
+                evicted, _ = _results_cache.popitem(last=False)
+                del _results_entries[evicted]
+
+    def rank(self, job_desc, resume_df, adaptive=False, top_k=3, use_cache=True, shortlist=False,
+             min_containment=DEFAULT_MIN_CONTAINMENT):
+        """
+        Rank a whole pool and split it into high, medium and low matches
+
+        Args:
+            job_desc (dict): Job description with Skills and Tools fields
+            resume_df (DataFrame): DataFrame containing resume data
+            adaptive (bool): Derive per-JD thresholds from the score distribution
+            top_k (int): Number of top matches
+            use_cache (bool): Reuse cached pools and results
+            shortlist (bool): Score and rank only the candidates of the
+                retrieval stage (resumes it does not return are left out).
+                Falls back to scoring the whole pool when a cut shortlist has
+                fewer than top_k candidates or no low matches, i.e. when the
+                left-out resumes could belong in the results
+            min_containment (float): Retrieval recall knob, see candidates()
+
+        Returns:
+            dict: 'top_3', bucket lists of result records, the 'thresholds' used,
+                and the 'jd_hash', 'pool_hash', 'scorer', 'adaptive' and
+                'shortlist' mode actually used, with the number of
+                'candidates' ranked.
+                The top matches and the first BREAKDOWN_LIMIT entries of each
+                bucket carry match breakdowns.
+        """
+        pool_cache = self.pool_cache if use_cache else None
+        size = 0 if resume_df is None else len(resume_df)
+        jd_hash = job_fingerprint(job_desc)
+        pool_hash = self.pool_cache.fingerprint(resume_df) if size else ""
+        scorer_name = getattr(self.scorer, 'name', None)
+
+        # Custom scorer instances without a name are never served from the cache
+        key = (scorer_name, jd_hash, pool_hash, bool(adaptive), top_k, min_containment if shortlist else None)
+        if use_cache and scorer_name:
+            results = self._cached_results(key)
+            if results is not None:
+                return results
+
+        # Pool positions that get scored: the retrieved candidates, or every resume
+        if shortlist:
+            positions, complete = self._search(job_desc, resume_df, min_containment, use_cache)
+            scores = self.score(job_desc, resume_df, pool_cache, rows=positions)
+            thresholds = score_thresholds(scores, adaptive, pool_size=size)
+            order, buckets = rank_and_bucket(scores, thresholds)
+            # A cut shortlist must reach below the medium threshold, otherwise
+            # left-out resumes may belong in the top matches or the buckets
+            cut = len(positions) < size and not complete
+            shortlist = len(positions) >= min(top_k, size) and not (cut and not len(buckets['low_matches']))
+        if not shortlist:
+            positions = np.arange(size)
+            scores = self.score(job_desc, resume_df, pool_cache)
+            thresholds = score_thresholds(scores, adaptive)
+            order, buckets = rank_and_bucket(scores, thresholds)
+
+        # Breakdowns are computed here once and reused by the charts on every rerun
+        profile = job_match_profile(job_desc)
+        # Records are built for the ranked rows only, from the displayed columns
+        columns = _entry_columns(resume_df) if size else []
+        values = [resume_df[column].to_numpy() for column in columns]
+
+        def record(pos):
+            return {column: column_values[pos] for column, column_values in zip(columns, values)}
+
+        # Buckets are consecutive runs of the ranked list
+        high_end = len(buckets['high_matches'])
+        medium_end = high_end + len(buckets['medium_matches'])
+        detailed = set(range(top_k))
+        for start in (0, high_end, medium_end):
+            detailed.update(range(start, start + BREAKDOWN_LIMIT))
+        ranked = [
+            resume_entry(record(positions[i]), int(positions[i]), scores[i], profile if position in detailed else None)
+            for position, i in enumerate(order.tolist())
+        ]
+
+        results = {
+            'top_3': ranked[:top_k],
+            'high_matches': ranked[:high_end],
+            'medium_matches': ranked[high_end:medium_end],
+            'low_matches': ranked[medium_end:],
+            'thresholds': {'medium': float(thresholds[0]), 'high': float(thresholds[1])},
+            'jd_hash': jd_hash,
+            'pool_hash': pool_hash,
+            'scorer': scorer_name,
+            'adaptive': bool(adaptive),
+            'shortlist': bool(shortlist),
+            'candidates': len(scores)
+        }
+        if use_cache and scorer_name:
+            self._store_results(key, results)
+        return results
+
+    def rank_streaming(self, job_desc, resume_chunks, top_k=3, bucket_limit=50, chunk_size=5000, adaptive=False,
+                       stats=None):
+        """
+        Rank a pool chunk by chunk with bounded memory
+
+        Args:
+            job_desc (dict): Job description with Skills and Tools fields
+            resume_chunks (DataFrame or iterable): Pool or iterable of DataFrame chunks
+                (see iter_score_chunks for scorers needing whole-pool statistics)
+            top_k (int): Number of top matches
+            bucket_limit (int): Entries kept per bucket
+            chunk_size (int): Rows per chunk when a single DataFrame is given
+            adaptive (bool): Derive per-JD thresholds from the score distribution
+            stats (dict): Precomputed whole-pool statistics
+
+        Returns:
+            dict: Same layout as rank(), with bucket lists capped at bucket_limit
+                and full bucket sizes under 'counts'
+        """
+        ranker = StreamingRanker(top_k=top_k, bucket_limit=bucket_limit,
+                                 profile=job_match_profile(job_desc), adaptive=adaptive)
+        if resume_chunks is not None:
+            for offset, chunk_df, scores in self.iter_score_chunks(job_desc, resume_chunks, chunk_size, stats):
+                ranker.push(scores, chunk_df, offset)
+        return ranker.results()
\ No newline at end of file
@@ -1,20 +1,143 @@
 import os
+import csv
+import time
 import numpy as np
 import pandas as pd
-import tempfile
-import streamlit as st
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from io import BytesIO, StringIO
 from docx import Document
-from utils.text_processing import extract_skills, preprocess_text
+from utils.text_processing import extract_skills
+from utils.extraction_cache import content_key, get_extraction_cache
+from models.scoring_engine import PoolScoringEngine
+from models.feature_index import ResumeFeatureIndex
+from models.resume_catalog import ResumeCatalog
+from models.ranking_engine import DEFAULT_SCORER, RankingEngine
+from models.streaming_ranker import StreamingRanker
+
+# Keywords used to detect tools and certification lines in DOCX resumes
+DOCX_TOOL_KEYWORDS = [
+    'git', 'docker', 'kubernetes', 'jenkins', 'jira', 
+    'confluence', 'aws', 'azure', 'vs code', 'intellij',
+    'eclipse', 'idea', 'visual studio', 'vscode', 'maven',
+    'gradle', 'npm', 'yarn', 'webpack', 'jupyter'
+]
+DOCX_CERT_KEYWORDS = [
+    'certified', 'certification', 'certificate', 'aws', 'azure', 
+    'google', 'professional', 'associate', 'expert', 'oracle',
+    'microsoft', 'java', 'python', 'scrum', 'pmp'
+]
+
+# Below this many DOCX files a process pool costs more than it saves
+MIN_PARALLEL_DOCX_FILES = 8
+
+def extract_docx_resume(file_name, docx_bytes):
+    """
+    Extract resume details from DOCX content held in memory
+    
+    Module-level (and free of Streamlit objects) so it can run in worker processes.
+    
+    Args:
+        file_name (str): Name of the uploaded file
+        docx_bytes (bytes): Raw DOCX content
+        
+    Returns:
+        dict: Dictionary with extracted resume details, or None if parsing failed
+    """
+    try:
+        # python-docx reads directly from a file-like object, no temp file needed
+        doc = Document(BytesIO(docx_bytes))
+        
+        # Extract text from paragraphs
+        paragraphs = []
+        for para in doc.paragraphs:
+            if para.text.strip():  # Only include non-empty paragraphs
+                paragraphs.append(para.text)
+        
+        resume_text = "\n".join(paragraphs)
+        resume_text_lower = resume_text.lower()
+        
+        # Extract information
+        skills_map = extract_skills(resume_text)
+        skills_str = ", ".join([item for sublist in skills_map.values() for item in sublist])
+        
+        # Detect tools
+        detected_tools = [tool for tool in DOCX_TOOL_KEYWORDS if tool in resume_text_lower]
+        
+        # Detect certifications
+        certification_text = ""
+        for line in paragraphs:
+            line_lower = line.lower()
+            if any(kw in line_lower for kw in DOCX_CERT_KEYWORDS):
+                certification_text += line + "\n"
+        
+        if not certification_text:
+            certification_text = "None specified"
+        
+        return {
+            'File Name': file_name,
+            'Skills': skills_str or "General technical skills",
+            'Tools': ", ".join(detected_tools) or "Standard development tools",
+            'Certifications': certification_text
+        }
+    except Exception:
+        return None
+
+def extract_csv_resume(file_name, csv_bytes):
+    """
+    Extract resume details from a single-resume CSV held in memory
+    
+    Args:
+        file_name (str): Name of the uploaded file
+        csv_bytes (bytes): Raw CSV content
+        
+    Returns:
+        dict: Dictionary with extracted resume details or None if CSV has multiple rows
+    """
+    try:
+        # Read CSV content
+        csv_content = csv_bytes.decode('utf-8')
+        
+        # First check if this is a multi-row CSV (resume dataset) or single resume
+        csv_rows = list(csv.reader(StringIO(csv_content)))
+        
+        if len(csv_rows) <= 2:  # Header + single data row
+            # This is likely a single resume in CSV format
+            if len(csv_rows) == 2:
+                # Has header and one data row
+                header = csv_rows[0]
+                data = csv_rows[1]
+                
+                # Create a dictionary of header->value
+                resume_data = {header[i]: data[i] for i in range(min(len(header), len(data)))}
+                
+                # Extract required fields or use defaults
+                return {
+                    'File Name': file_name,
+                    'Skills': resume_data.get('Skills', resume_data.get('skills', '')),
+                    'Tools': resume_data.get('Tools', resume_data.get('tools', '')),
+                    'Certifications': resume_data.get('Certifications', resume_data.get('certifications', ''))
+                }
+            else:
+                # No data rows, just header
+                return None
+        else:
+            # This is a multi-row CSV, likely a resume dataset
+            # Return None to indicate this should be treated as a full dataset not a single resume
+            return None
+    except Exception:
+        return None
 
 class ResumeAnalyzer:
     """Analyze and rank resumes based on job descriptions"""
     
     def __init__(self):
         """Initialize the ResumeAnalyzer"""
-        self.vectorizer = TfidfVectorizer()
+        # Persistent per-resume features shared by every analyzer in the process
+        self.feature_index = ResumeFeatureIndex.shared()
+        
+        # Extraction results memoized by upload content, shared across sessions
+        self.extraction_cache = get_extraction_cache()
+        
         # Get the base directory (where your app is running)
         self.base_dir = os.getcwd()
         
@@ -30,125 +153,148 @@ class ResumeAnalyzer:
             os.path.join(self.base_dir, "Data"),
             os.path.join(self.base_dir, "jd_optim_OOP_implement(vasu)", "Data"),
         ]
+        
+        # Manifest of the pool CSVs in those directories, shared process-wide
+        self.catalog = ResumeCatalog.shared(self.fallback_dirs)
     
-    def compute_similarity(self, job_desc, resume_df):
+    def compute_similarity(self, job_desc, resume_df, shortlist=False):
         """
         Compute enhanced similarity scores between job description and resumes
         
         Args:
             job_desc (dict): Job description with Skills and Tools fields
             resume_df (DataFrame): DataFrame containing resume data
+            shortlist (bool): Score only the candidates of the retrieval stage
+                (resumes containing the JD's terms or skills); resumes it does
+                not return score 0
             
         Returns:
             numpy.ndarray: Array of similarity scores
         """
-        # Check if job_desc is valid
-        if not isinstance(job_desc, (dict, pd.Series)) or 'Skills' not in job_desc:
-            job_skills = {'programming_languages': [], 'frameworks': [], 'databases': [], 'cloud': [], 'tools': []}
-        else:
-            # Extract skills from job description
-            job_skills = extract_skills(str(job_desc['Skills']) + ' ' + str(job_desc['Tools']))
+        # Pool features come from the index (analyzing only unseen resumes),
+        # then every resume is scored with array operations
+        engine = self.ranking_engine()
+        if not shortlist or resume_df is None or len(resume_df) == 0:
+            return engine.score(job_desc, resume_df)
         
-        similarity_scores = []
-        for _, resume in resume_df.iterrows():
-            # Extract skills from resume
-            resume_skills = extract_skills(str(resume['Skills']) + ' ' + str(resume['Tools']))
-            
-            # Calculate skill matches for each category
-            category_scores = []
-            for category in job_skills:
-                job_set = set(job_skills[category])
-                resume_set = set(resume_skills[category])
-                if job_set:
-                    match_ratio = len(resume_set.intersection(job_set)) / len(job_set)
-                    category_scores.append(match_ratio)
-                else:
-                    category_scores.append(0)
-            
-            # Calculate weighted skill score
-            skill_score = np.mean(category_scores) if category_scores else 0
-            
-            # Calculate text similarity
-            job_text = preprocess_text(str(job_desc.get('Skills', '')) + ' ' + str(job_desc.get('Tools', '')))
-            resume_text = preprocess_text(
-                str(resume['Skills']) + ' ' + 
-                str(resume['Tools']) + ' ' + 
-                str(resume.get('Certifications', ''))
-            )
+        scores = np.zeros(len(resume_df))
+        rows = engine.candidates(job_desc, resume_df)
+        scores[rows] = engine.score(job_desc, resume_df, engine.pool_cache, rows=rows)
+        return scores
+    
+    def ranking_engine(self, scorer=DEFAULT_SCORER):
+        """
+        Get a ranking engine backed by this analyzer's feature index
+        
+        Args:
+            scorer (str): Scorer name ('keyword', 'tfidf' or 'bm25')
             
-            try:
-                tfidf_matrix = self.vectorizer.fit_transform([job_text, resume_text])
-                text_similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-            except:
-                text_similarity = 0
+        Returns:
+            RankingEngine: Engine using the requested scorer
+        """
+        return RankingEngine(scorer, feature_index=self.feature_index)
+    
+    def rank_matrix(self, jds, resumes, jd_chunk_size=64, resume_chunk_size=10000, out=None):
+        """
+        Score every job description against every resume of a pool
+        
+        Args:
+            jds (list or DataFrame): Job descriptions with Skills and Tools fields
+                (e.g. the requisitions of a Position Report)
+            resumes (DataFrame): DataFrame containing resume data
+            jd_chunk_size (int): JDs scored per block
+            resume_chunk_size (int): Resumes scored per block
+            out (numpy.ndarray): Optional preallocated (JDs x resumes) array, e.g. a
+                numpy.memmap for matrices that should not live in memory
             
-            # Combine scores (70% skill match, 30% text similarity)
-            final_score = (0.7 * skill_score) + (0.3 * text_similarity)
-            similarity_scores.append(final_score)
+        Returns:
+            numpy.ndarray: JD x resume score matrix, row i holds the same scores as
+                compute_similarity(jds[i], resumes)
+        """
+        if isinstance(jds, pd.DataFrame):
+            jds = jds.to_dict('records')
+        else:
+            jds = list(jds)
         
-        return np.array(similarity_scores)
+        n_resumes = 0 if resumes is None else len(resumes)
+        if out is None:
+            out = np.zeros((len(jds), n_resumes))
+        if not jds or not n_resumes:
+            return out
+        
+        # One pass over the pool, then block-wise scoring with bounded temporaries
+        engine = PoolScoringEngine(resumes, feature_index=self.feature_index)
+        for jd_start, resume_start, block in engine.score_blocks(jds, jd_chunk_size, resume_chunk_size):
+            out[jd_start:jd_start + block.shape[0], resume_start:resume_start + block.shape[1]] = block
+        return out
     
-    def categorize_resumes(self, job_desc, resume_df):
+    def iter_score_chunks(self, job_desc, resume_chunks, chunk_size=5000, scorer=DEFAULT_SCORER, stats=None):
+        """
+        Score a resume pool chunk by chunk
+        
+        Args:
+            job_desc (dict): Job description with Skills and Tools fields
+            resume_chunks (DataFrame or iterable): A resume DataFrame, or an iterable of
+                DataFrame chunks such as pd.read_csv(..., chunksize=...); the 'bm25'
+                scorer needs a DataFrame, a list of chunks or precomputed stats
+            chunk_size (int): Rows per chunk when a single DataFrame is given
+            scorer (str): Scorer name
+            stats (dict): Whole-pool statistics from RankingEngine.collection_stats()
+            
+        Yields:
+            tuple: (offset, chunk_df, scores) for each chunk
+        """
+        return self.ranking_engine(scorer).iter_score_chunks(job_desc, resume_chunks, chunk_size, stats)
+    
+    def categorize_resumes(self, job_desc, resume_df, streaming=False, top_k=3, bucket_limit=50, chunk_size=5000,
+                           adaptive=False, scorer=DEFAULT_SCORER, shortlist=False):
         """
         Categorize resumes into high, medium, and low matches
         
         Args:
             job_desc (dict): Job description with Skills and Tools fields
-            resume_df (DataFrame): DataFrame containing resume data
+            resume_df (DataFrame): DataFrame containing resume data (in streaming mode
+                also any iterable of DataFrame chunks)
+            streaming (bool): Rank chunk by chunk with bounded heaps instead of sorting
+                the whole pool; bucket lists are then capped at bucket_limit entries
+                and full bucket sizes are reported under 'counts'
+            top_k (int): Number of top matches to keep
+            bucket_limit (int): Entries kept per bucket in streaming mode
+            chunk_size (int): Rows scored per chunk in streaming mode
+            adaptive (bool): Derive per-JD thresholds from the score distribution
+                (score quantiles, with the fixed thresholds as floors)
+            scorer (str): Scorer name ('keyword', 'tfidf' or 'bm25')
+            shortlist (bool): Rank only the candidates of the retrieval stage
+                (whole-pool mode only, see RankingEngine.rank)
             
         Returns:
             dict: Dictionary with categorized resumes
         """
+        empty_result = {
+            'top_3': [],
+            'high_matches': [],
+            'medium_matches': [],
+            'low_matches': []
+        }
+        engine = self.ranking_engine(scorer)
+        
+        if streaming:
+            try:
+                return engine.rank_streaming(job_desc, resume_df, top_k=top_k, bucket_limit=bucket_limit,
+                                             chunk_size=chunk_size, adaptive=adaptive)
+            except Exception:
+                return StreamingRanker(top_k=top_k, bucket_limit=bucket_limit, adaptive=adaptive).results()
+        
         # Check if inputs are valid
         if resume_df is None or len(resume_df) == 0:
-            empty_result = {
-                'top_3': [],
-                'high_matches': [],
-                'medium_matches': [],
-                'low_matches': []
-            }
             return empty_result
-            
-        # Compute similarity scores
+        
         try:
-            similarity_scores = self.compute_similarity(job_desc, resume_df)
+            return engine.rank(job_desc, resume_df, adaptive=adaptive, top_k=top_k, shortlist=shortlist)
         except Exception as e:
             # Return empty results in case of error
-            empty_result = {
-                'top_3': [],
-                'high_matches': [],
-                'medium_matches': [],
-                'low_matches': []
-            }
+            print(f"Error ranking resumes: {e}")
             return empty_result
-        
-        all_resumes = []
-        for i, score in enumerate(similarity_scores):
-            # Make sure we don't go out of bounds
-            if i < len(resume_df):
-                resume_row = resume_df.iloc[i]
-                all_resumes.append({
-                    'Resume ID': resume_row.get('File Name', f"Resume_{i+1}"),
-                    'Skills': resume_row.get('Skills', ''),
-                    'Tools': resume_row.get('Tools', ''),
-                    'Certifications': resume_row.get('Certifications', ''),
-                    'Score': float(score)
-                })
-        
-        # Sort all resumes by score
-        all_resumes.sort(key=lambda x: x['Score'], reverse=True)
-        
-        # Categorize based on score thresholds
-        high_matches = [r for r in all_resumes if r['Score'] >= 0.25]
-        medium_matches = [r for r in all_resumes if 0.2 <= r['Score'] < 0.25]
-        low_matches = [r for r in all_resumes if r['Score'] < 0.2]
-        
-        return {
-            'top_3': all_resumes[:3] if len(all_resumes) >= 3 else all_resumes,
-            'high_matches': high_matches,
-            'medium_matches': medium_matches,
-            'low_matches': low_matches
-        }
     
     def _find_resume_file(self, file_name):
         """
@@ -160,15 +306,8 @@ class ResumeAnalyzer:
         Returns:
             str or None: Full path to the file if found, None otherwise
         """
-        # Try all potential directories
-        for directory in self.fallback_dirs:
-            if os.path.exists(directory):
-                file_path = os.path.join(directory, file_name)
-                if os.path.exists(file_path):
-                    return file_path
-                
-        # If we reach here, file wasn't found
-        return None
+        # Catalog lookup (directories are re-listed only when their mtime changes)
+        return self.catalog.find(file_name)
     
     def find_default_resume_file(self, jd_type):
         """
@@ -208,39 +347,64 @@ class ResumeAnalyzer:
             if file_path:
                 return file_path
                 
-        # If no specific file was found, try to find ANY resume CSV
-        for directory in self.fallback_dirs:
-            if os.path.exists(directory):
-                for file in os.listdir(directory):
-                    if file.endswith('.csv') and ('resume' in file.lower() or 'analysis' in file.lower()):
-                        return os.path.join(directory, file)
-        
-        # Perform broader search as a last resort
-        for root, _, files in os.walk(os.getcwd()):
-            csv_files = [f for f in files if f.endswith('.csv')]
-            for file in csv_files:
-                if 'resume' in file.lower() or 'analysis' in file.lower():
-                    return os.path.join(root, file)
+        # If no specific file was found, use any catalogued pool, preferring
+        # pools whose file name suggests the same JD type
+        for entry in self.catalog.entries(jd_type) + self.catalog.entries():
+            if os.path.exists(entry['path']):
+                return entry['path']
         
         return None
     
-    def process_resume_pool(self, uploaded_files):
+    def process_resume_pool(self, uploaded_files, parallel=False, max_workers=None, progress_callback=None):
         """
         Process a batch of uploaded resume files and return a DataFrame
         
         Args:
             uploaded_files (list): List of uploaded resume files
+            parallel (bool): Parse DOCX files in a process pool
+            max_workers (int): Worker processes for parallel parsing (defaults to CPU count)
+            progress_callback (callable): Called as progress_callback(done, total, file_name)
+                after each file is processed
             
         Returns:
             DataFrame: DataFrame containing processed resume data
         """
         processed_resumes = []
         csv_dataframes = []
+        docx_jobs = []  # (slot, file name, bytes) parsed by the process pool
+        docx_keys = {}  # slot -> extraction cache key
+        
+        start_time = time.perf_counter()
+        total_files = len(uploaded_files)
+        progress = {'done': 0}
+        
+        def report(file_name):
+            progress['done'] += 1
+            if progress_callback:
+                progress_callback(progress['done'], total_files, file_name)
         
         # First pass: Process each file
         for uploaded_file in uploaded_files:
             try:
                 if uploaded_file.name.endswith(".docx"):
+                    if parallel:
+                        docx_bytes = uploaded_file.getvalue()
+                        key = content_key('docx', docx_bytes)
+                        found, resume_data = self.extraction_cache.get(key)
+                        if found:
+                            # Duplicate upload, only the hash was computed
+                            if resume_data is not None:
+                                resume_data['File Name'] = uploaded_file.name
+                                processed_resumes.append(resume_data)
+                            report(uploaded_file.name)
+                            continue
+                        
+                        # Keep the slot so results stay in upload order
+                        docx_keys[len(processed_resumes)] = key
+                        docx_jobs.append((len(processed_resumes), uploaded_file.name, docx_bytes))
+                        processed_resumes.append(None)
+                        continue
+                    
                     # Process DOCX as individual resume
                     resume_data = self.analyze_uploaded_resume(uploaded_file)
                     if resume_data is not None:
@@ -284,6 +448,22 @@ class ResumeAnalyzer:
                             pass
             except Exception:
                 pass
+            report(uploaded_file.name)
+        
+        # Parse queued DOCX files in parallel
+        if docx_jobs:
+            for slot, resume_data in self._parse_docx_parallel(docx_jobs, max_workers, report).items():
+                self.extraction_cache.put(docx_keys[slot], resume_data)
+                processed_resumes[slot] = resume_data
+            processed_resumes = [r for r in processed_resumes if r is not None]
+        
+        elapsed = time.perf_counter() - start_time
+        self.last_ingestion_stats = {
+            'files': total_files,
+            'seconds': elapsed,
+            'files_per_sec': total_files / elapsed if elapsed > 0 else 0.0,
+            'parallel': bool(docx_jobs)
+        }
         
         # Second pass: Combine results
         if csv_dataframes:
@@ -300,15 +480,71 @@ class ResumeAnalyzer:
                 if col not in combined_df.columns:
                     combined_df[col] = ""
             
+            self._index_pool(combined_df)
             return combined_df
             
         elif processed_resumes:
             # If we only have individually processed resumes
-            return pd.DataFrame(processed_resumes)
+            pool_df = pd.DataFrame(processed_resumes)
+            self._index_pool(pool_df)
+            return pool_df
         
         # No valid data
         return None
         
+    def _parse_docx_parallel(self, docx_jobs, max_workers, report):
+        """
+        Parse DOCX files in a process pool
+        
+        Args:
+            docx_jobs (list): (slot, file name, bytes) tuples
+            max_workers (int): Worker processes (defaults to CPU count)
+            report (callable): Called with the file name after each file
+            
+        Returns:
+            dict: Slot -> extracted resume details (None for unparseable files)
+        """
+        results = {}
+        
+        # Small batches are parsed inline, process start-up would dominate
+        if len(docx_jobs) >= MIN_PARALLEL_DOCX_FILES:
+            workers = max_workers or min(len(docx_jobs), os.cpu_count() or 1)
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    futures = {
+                        executor.submit(extract_docx_resume, file_name, docx_bytes): (slot, file_name)
+                        for slot, file_name, docx_bytes in docx_jobs
+                    }
+                    for future in as_completed(futures):
+                        slot, file_name = futures[future]
+                        try:
+                            results[slot] = future.result()
+                        except Exception:
+                            results[slot] = None
+                        report(file_name)
+            except Exception as e:
+                # Process pools can be unavailable (restricted hosts, broken workers)
+                print(f"Parallel resume parsing failed, continuing serially: {e}")
+        
+        for slot, file_name, docx_bytes in docx_jobs:
+            if slot not in results:
+                results[slot] = extract_docx_resume(file_name, docx_bytes)
+                report(file_name)
+        
+        return results
+    
+    def _index_pool(self, pool_df):
+        """
+        Add newly ingested resumes to the feature index so ranking finds them precomputed
+        
+        Args:
+            pool_df (DataFrame): DataFrame containing processed resume data
+        """
+        try:
+            self.feature_index.update(pool_df)
+        except Exception as e:
+            print(f"Error updating resume feature index: {e}")
+        
     def analyze_uploaded_resume(self, uploaded_file):
         """
         Analyze a user-uploaded resume (.docx) and extract the information
@@ -340,72 +576,7 @@ class ResumeAnalyzer:
         Returns:
             dict: Dictionary with extracted resume details
         """
-        try:
-            # Get file content
-            docx_bytes = uploaded_file.getvalue()
-            
-            # Create a temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".docx") as tmp:
-                tmp.write(docx_bytes)
-                temp_path = tmp.name
-            
-            try:
-                # Load the document
-                doc = Document(temp_path)
-                
-                # Extract text from paragraphs
-                paragraphs = []
-                for para in doc.paragraphs:
-                    if para.text.strip():  # Only include non-empty paragraphs
-                        paragraphs.append(para.text)
-                
-                resume_text = "\n".join(paragraphs)
-                
-                # Extract information
-                skills_map = extract_skills(resume_text)
-                skills_str = ", ".join([item for sublist in skills_map.values() for item in sublist])
-                
-                # Detect tools
-                tools_keywords = [
-                    'git', 'docker', 'kubernetes', 'jenkins', 'jira', 
-                    'confluence', 'aws', 'azure', 'vs code', 'intellij',
-                    'eclipse', 'idea', 'visual studio', 'vscode', 'maven',
-                    'gradle', 'npm', 'yarn', 'webpack', 'jupyter'
-                ]
-                
-                detected_tools = []
-                for tool in tools_keywords:
-                    if tool.lower() in resume_text.lower():
-                        detected_tools.append(tool)
-                
-                # Detect certifications
-                cert_keywords = [
-                    'certified', 'certification', 'certificate', 'aws', 'azure', 
-                    'google', 'professional', 'associate', 'expert', 'oracle',
-                    'microsoft', 'java', 'python', 'scrum', 'pmp'
-                ]
-                
-                certification_text = ""
-                for line in paragraphs:
-                    if any(kw.lower() in line.lower() for kw in cert_keywords):
-                        certification_text += line + "\n"
-                
-                if not certification_text:
-                    certification_text = "None specified"
-                
-                return {
-                    'File Name': uploaded_file.name,
-                    'Skills': skills_str or "General technical skills",
-                    'Tools': ", ".join(detected_tools) or "Standard development tools",
-                    'Certifications': certification_text
-                }
-            finally:
-                # Clean up the temporary file
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
-                    
-        except Exception:
-            return None
+        return self._cached_extraction('docx', uploaded_file, extract_docx_resume)
     
     def _analyze_csv_resume(self, uploaded_file):
         """
@@ -417,39 +588,29 @@ class ResumeAnalyzer:
         Returns:
             dict: Dictionary with extracted resume details or None if CSV has multiple rows
         """
-        try:
-            # Read CSV content
-            csv_content = uploaded_file.getvalue().decode('utf-8')
-            
-            # Parse CSV
-            import csv
-            
-            # First check if this is a multi-row CSV (resume dataset) or single resume
-            csv_rows = list(csv.reader(StringIO(csv_content)))
+        return self._cached_extraction('csv', uploaded_file, extract_csv_resume)
+    
+    def _cached_extraction(self, kind, uploaded_file, extract):
+        """
+        Run an extraction function, memoized by the SHA-256 of the uploaded bytes
+        
+        Args:
+            kind (str): Extraction type used in the cache key
+            uploaded_file (UploadedFile): The uploaded file
+            extract (callable): Called as extract(file_name, file_bytes) on a cache miss
             
-            if len(csv_rows) <= 2:  # Header + single data row
-                # This is likely a single resume in CSV format
-                if len(csv_rows) == 2:
-                    # Has header and one data row
-                    header = csv_rows[0]
-                    data = csv_rows[1]
-                    
-                    # Create a dictionary of header->value
-                    resume_data = {header[i]: data[i] for i in range(min(len(header), len(data)))}
-                    
-                    # Extract required fields or use defaults
-                    return {
-                        'File Name': uploaded_file.name,
-                        'Skills': resume_data.get('Skills', resume_data.get('skills', '')),
-                        'Tools': resume_data.get('Tools', resume_data.get('tools', '')),
-                        'Certifications': resume_data.get('Certifications', resume_data.get('certifications', ''))
-                    }
-                else:
-                    # No data rows, just header
-                    return None
-            else:
-                # This is a multi-row CSV, likely a resume dataset
-                # Return None to indicate this should be treated as a full dataset not a single resume
-                return None
-        except Exception:
-            return None
\ No newline at end of file
+        Returns:
+            dict: Dictionary with extracted resume details or None
+        """
+        file_bytes = uploaded_file.getvalue()
+        key = content_key(kind, file_bytes)
+        
+        found, resume_data = self.extraction_cache.get(key)
+        if not found:
+            resume_data = extract(uploaded_file.name, file_bytes)
+            self.extraction_cache.put(key, resume_data)
+        elif resume_data is not None:
+            # The same content may be uploaded again under another name
+            resume_data['File Name'] = uploaded_file.name
+        
+        return resume_data
\ No newline at end of file
@@ -0,0 +1,214 @@
+import csv
+import json
+import os
+import threading
+import uuid
+
+from utils.text_processing import detect_jd_type
+
+# Default manifest location, relative to the working directory like logs/
+DEFAULT_MANIFEST_PATH = os.path.join("cache", "resume_catalog.json")
+
+# Bump whenever the manifest layout changes
+CATALOG_VERSION = 1
+
+
+def is_pool_file(file_name):
+    """Whether a file name looks like a resume pool CSV"""
+    lowered = file_name.lower()
+    return lowered.endswith('.csv') and ('resume' in lowered or 'analysis' in lowered)
+
+
+def count_rows(csv_path):
+    """
+    Count data rows of a CSV (quoted multi-line fields count once)
+
+    Args:
+        csv_path (str): Path to the CSV file
+
+    Returns:
+        int or None: Number of rows after the header, None if unreadable
+    """
+    try:
+        with open(csv_path, 'r', encoding='utf-8', errors='replace', newline='') as f:
+            return max(sum(1 for _ in csv.reader(f)) - 1, 0)
+    except (OSError, csv.Error):
+        return None
+
+
+class ResumeCatalog:
+    """
+    Manifest of resume pool CSVs in a fixed list of directories
+
+    Each directory is listed once and re-listed only when its mtime changes
+    (adding, removing or renaming a file updates it), so keeping the catalog
+    current costs one stat per directory. Entries record the inferred JD type,
+    row count, mtime and size of every CSV; lookups by file name are dict hits.
+    The manifest is persisted so row counts survive restarts.
+    """
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, directories, manifest_path=DEFAULT_MANIFEST_PATH):
+        """
+        Initialize the catalog
+
+        Args:
+            directories (list): Directories to catalog, in lookup priority order
+            manifest_path (str): Where the manifest is persisted
+        """
+        # Absolute paths, duplicates dropped (first occurrence keeps its priority)
+        self.directories = list(dict.fromkeys(os.path.abspath(directory) for directory in directories))
+        self.manifest_path = manifest_path
+        self._lock = threading.Lock()
+        self._dirs = {}      # directory -> {'mtime_ns', 'files': {file name: entry}}
+        self._by_name = {}   # file name -> entry of the highest priority directory
+        self._load_manifest()
+
+    @classmethod
+    def shared(cls, directories, manifest_path=DEFAULT_MANIFEST_PATH):
+        """
+        Get the process-wide catalog for a list of directories
+
+        Args:
+            directories (list): Directories to catalog, in lookup priority order
+            manifest_path (str): Where the manifest is persisted
+
+        Returns:
+            ResumeCatalog: Shared catalog
+        """
+        key = (tuple(os.path.abspath(directory) for directory in directories), manifest_path)
+        with cls._shared_lock:
+            catalog = cls._shared.get(key)
+            if catalog is None:
+                catalog = cls(directories, manifest_path)
+                cls._shared[key] = catalog
+            return catalog
+
+    def _load_manifest(self):
+        """Reuse directory listings and row counts from a saved manifest"""
+        try:
+            with open(self.manifest_path, 'r') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if manifest.get('version') != CATALOG_VERSION:
+            return
+        saved = manifest.get('directories', {})
+        self._dirs = {directory: saved[directory] for directory in self.directories if directory in saved}
+        self._rebuild_lookup()
+
+    def _save_manifest(self):
+        """Persist the manifest (best effort, replaced atomically)"""
+        manifest = {'version': CATALOG_VERSION, 'directories': self._dirs}
+        tmp_path = f"{self.manifest_path}.{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.manifest_path) or ".", exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump(manifest, f)
+            os.replace(tmp_path, self.manifest_path)
+        except Exception as e:
+            print(f"Error saving resume catalog: {e}")
+
+    def _scan_directory(self, directory, mtime_ns, previous):
+        """
+        List the pool CSVs of one directory
+
+        Args:
+            directory (str): Directory to list
+            mtime_ns (int): Directory mtime at listing time
+            previous (dict): Earlier entries, reused for unchanged files
+
+        Returns:
+            dict: Directory record
+        """
+        files = {}
+        for file_name in sorted(os.listdir(directory)):
+            path = os.path.join(directory, file_name)
+            if not is_pool_file(file_name) or not os.path.isfile(path):
+                continue
+
+            stat = os.stat(path)
+            entry = previous.get(file_name)
+            if not entry or entry['mtime_ns'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+                entry = {
+                    'path': path,
+                    'file_name': file_name,
+                    'jd_type': detect_jd_type(file_name),
+                    'rows': count_rows(path),
+                    'mtime_ns': stat.st_mtime_ns,
+                    'size': stat.st_size,
+                }
+            files[file_name] = entry
+        return {'mtime_ns': mtime_ns, 'files': files}
+
+    def _rebuild_lookup(self):
+        """Map every file name to its entry in the highest priority directory"""
+        by_name = {}
+        for directory in self.directories:
+            for file_name, entry in self._dirs.get(directory, {}).get('files', {}).items():
+                by_name.setdefault(file_name, entry)
+        self._by_name = by_name
+
+    def refresh(self):
+        """Re-list only the directories whose mtime changed since the last listing"""
+        with self._lock:
+            changed = False
+            for directory in self.directories:
+                try:
+                    mtime_ns = os.stat(directory).st_mtime_ns
+                except OSError:
+                    if self._dirs.pop(directory, None) is not None:
+                        changed = True
+                    continue
+
+                record = self._dirs.get(directory)
+                if record is not None and record['mtime_ns'] == mtime_ns:
+                    continue
+                previous = record['files'] if record else {}
+                try:
+                    self._dirs[directory] = self._scan_directory(directory, mtime_ns, previous)
+                except OSError as e:
+                    print(f"Error listing resume directory {directory}: {e}")
+                    continue
+                changed = True
+
+            if changed:
+                self._rebuild_lookup()
+                self._save_manifest()
+
+    def find(self, file_name):
+        """
+        Look up a pool CSV by file name
+
+        Args:
+            file_name (str): Name of the CSV file
+
+        Returns:
+            str or None: Path of the file in the highest priority directory
+        """
+        self.refresh()
+        entry = self._by_name.get(file_name)
+        if entry and os.path.exists(entry['path']):
+            return entry['path']
+        return None
+
+    def entries(self, jd_type=None):
+        """
+        List catalogued pools in directory priority order
+
+        Args:
+            jd_type (str): Only pools whose file name infers this JD type
+
+        Returns:
+            list: Entry dicts (path, file_name, jd_type, rows, mtime_ns, size)
+        """
+        self.refresh()
+        return [
+            entry
+            for directory in self.directories
+            for entry in self._dirs.get(directory, {}).get('files', {}).values()
+            if jd_type is None or entry['jd_type'] == jd_type
+        ]
\ No newline at end of file
@@ -0,0 +1,370 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+
+import pandas as pd
+
+from models.resume_analyzer import ResumeAnalyzer
+from utils.pool_cache import POOL_COLUMNS, append_pool_rows
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+# Default manifest location, relative to the working directory like logs/
+DEFAULT_MANIFEST_PATH = os.path.join("cache", "resume_ingestion.json")
+
+# Bump whenever the manifest layout changes
+MANIFEST_VERSION = 1
+
+# Folder holding one sub-folder of new resumes per job description
+RESUME_INBOX = "Resume New"
+
+# Inbox sub-folders and the pool CSV each one feeds (others map by name, see pool_file_for)
+DEFAULT_POOL_FILES = {
+    "Resumes_JDJavaDeveloper": "resumes_analysis_outputJDJavaDeveloper.csv",
+    "Resumes_JDPrincipalSoftwareEngineer": "resumes_analysis_output_JDPrincipalSoftwareEngineer.csv",
+}
+
+# File types ResumeAnalyzer can extract
+SUPPORTED_EXTENSIONS = ('.docx',)
+
+# Files ingested per batch (one process_resume_pool call and one pool write)
+DEFAULT_BATCH_SIZE = 32
+
+# Seconds between folder scans, and how long a file must be unchanged before it
+# is picked up (so half-copied files are not extracted)
+DEFAULT_POLL_INTERVAL = 30
+DEFAULT_SETTLE_SECONDS = 2
+
+# Scans that try a file whose extraction failed before it is left alone until
+# its content changes
+MAX_INGEST_ATTEMPTS = 3
+
+
+def pool_file_for(folder_name):
+    """
+    Pool CSV fed by an inbox sub-folder
+
+    Args:
+        folder_name (str): Sub-folder name, e.g. "Resumes_JDJavaDeveloper"
+
+    Returns:
+        str: Pool CSV file name
+    """
+    if folder_name in DEFAULT_POOL_FILES:
+        return DEFAULT_POOL_FILES[folder_name]
+    suffix = folder_name[len("Resumes_"):] if folder_name.startswith("Resumes_") else folder_name
+    return f"resumes_analysis_output_{suffix}.csv"
+
+
+def file_digest(path):
+    """SHA-256 of a file's content"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class _LocalResumeFile:
+    """Resume on disk with the name / getvalue() interface of a Streamlit upload"""
+
+    def __init__(self, path):
+        self.path = path
+        self.name = os.path.basename(path)
+
+    def getvalue(self):
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+
+class ResumeIngestionService:
+    """
+    Keep resume pools in sync with folders of incoming resume files
+
+    Every source folder feeds one pool CSV. A scan stats the folder's files and
+    extracts only the ones that are new or whose content changed since the last
+    scan (a persisted manifest records size, mtime and content hash per file),
+    in batches through ResumeAnalyzer.process_resume_pool: DOCX parsing runs in
+    a process pool, results go through the extraction cache and straight into
+    the feature index. Each batch is appended to the pool CSV and its columnar
+    cache with append_pool_rows, so no pool is ever rebuilt from scratch.
+
+    Files already listed in a pool when the service first sees them (the ones
+    extracted offline) are recorded as they are and not re-extracted. Files
+    whose extraction failed are retried on later scans, up to
+    MAX_INGEST_ATTEMPTS times for the same content.
+
+    Extraction writes the feature index, which is safe while the app or other
+    ingestion processes use it too (writers hold the index's file lock).
+    """
+
+    def __init__(self, sources=None, analyzer=None, manifest_path=DEFAULT_MANIFEST_PATH,
+                 batch_size=DEFAULT_BATCH_SIZE, settle_seconds=DEFAULT_SETTLE_SECONDS, max_workers=None):
+        """
+        Initialize the service
+
+        Args:
+            sources (dict): Source folder -> pool CSV path (defaults to default_sources())
+            analyzer (ResumeAnalyzer): Analyzer used for extraction and indexing
+            manifest_path (str): Where the per-file manifest is persisted
+            batch_size (int): Files extracted per batch
+            settle_seconds (float): Minimum age of a file's last modification
+            max_workers (int): Worker processes for DOCX parsing
+        """
+        self.analyzer = analyzer or ResumeAnalyzer()
+        self.sources = {
+            os.path.abspath(folder): os.path.abspath(pool_path)
+            for folder, pool_path in (sources if sources is not None else self.default_sources()).items()
+        }
+        self.manifest_path = manifest_path
+        self.batch_size = batch_size
+        self.settle_seconds = settle_seconds
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._files = self._load_manifest()
+        self._wakeup = threading.Event()
+        self._observer = None
+        self.last_stats = None
+
+    def default_sources(self):
+        """
+        Sub-folders of the resume inbox, each feeding its pool in the analyzer's resume directory
+
+        The inbox is looked up in the working directory, then in its parent
+        (the app runs from jd_optim_OOP_implement/, the inbox sits next to it).
+
+        Returns:
+            dict: Source folder -> pool CSV path
+        """
+        base_dir = self.analyzer.base_dir
+        for inbox in (os.path.join(base_dir, RESUME_INBOX), os.path.join(os.path.dirname(base_dir), RESUME_INBOX)):
+            if os.path.isdir(inbox):
+                return {
+                    os.path.join(inbox, name): os.path.join(self.analyzer.resume_dir, pool_file_for(name))
+                    for name in sorted(os.listdir(inbox))
+                    if os.path.isdir(os.path.join(inbox, name))
+                }
+        return {}
+
+    def _load_manifest(self):
+        """Per-file records of earlier scans"""
+        try:
+            with open(self.manifest_path, 'r') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if manifest.get('version') != MANIFEST_VERSION:
+            return {}
+        return manifest.get('files', {})
+
+    def _save_manifest(self):
+        """Persist the manifest (best effort, replaced atomically)"""
+        manifest = {'version': MANIFEST_VERSION, 'files': self._files}
+        tmp_path = f"{self.manifest_path}.{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.manifest_path) or ".", exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump(manifest, f)
+            os.replace(tmp_path, self.manifest_path)
+        except Exception as e:
+            print(f"Error saving resume ingestion manifest: {e}")
+
+    def _pool_file_names(self, pool_path):
+        """File names already listed in a pool CSV"""
+        if not os.path.exists(pool_path):
+            return set()
+        try:
+            return set(pd.read_csv(pool_path, usecols=['File Name'])['File Name'].astype(str))
+        except Exception as e:
+            print(f"Error reading resume pool {pool_path}: {e}")
+            return set()
+
+    def pending_files(self, folder, pool_path, now=None):
+        """
+        New or changed files of a source folder
+
+        Unchanged files (same size and mtime) cost one stat; a changed stat with
+        the same content only updates the manifest. Files that failed to extract
+        are returned again until they used up MAX_INGEST_ATTEMPTS.
+
+        Args:
+            folder (str): Source folder
+            pool_path (str): Pool CSV the folder feeds
+            now (float): Current time, for the settle check
+
+        Returns:
+            list: (path, stat record) of the files to extract
+        """
+        now = time.time() if now is None else now
+        pending = []
+        known_names = None
+
+        try:
+            file_names = sorted(os.listdir(folder))
+        except OSError as e:
+            print(f"Error listing resume folder {folder}: {e}")
+            return pending
+
+        for file_name in file_names:
+            path = os.path.join(folder, file_name)
+            if not os.path.isfile(path) or file_name.startswith(('~$', '.')):
+                continue
+            stat = os.stat(path)
+            record = self._files.get(path)
+            if record and record['mtime_ns'] == stat.st_mtime_ns and record['size'] == stat.st_size:
+                if self._should_retry(record):
+                    pending.append((path, dict(record)))
+                continue
+            if now - stat.st_mtime < self.settle_seconds:
+                continue  # still being written, picked up by a later scan
+
+            current = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'pool': pool_path}
+            if not file_name.lower().endswith(SUPPORTED_EXTENSIONS):
+                self._files[path] = dict(current, status='unsupported')
+                continue
+
+            current['sha256'] = file_digest(path)
+            if record and record.get('sha256') == current['sha256']:
+                self._files[path] = dict(record, mtime_ns=current['mtime_ns'], size=current['size'])
+                if self._should_retry(record):
+                    pending.append((path, dict(self._files[path])))
+                continue
+
+            if record is None:
+                if known_names is None:
+                    known_names = self._pool_file_names(pool_path)
+                if file_name in known_names:
+                    # Extracted offline before the service existed
+                    self._files[path] = dict(current, status='baseline')
+                    continue
+
+            pending.append((path, current))
+        return pending
+
+    @staticmethod
+    def _should_retry(record):
+        """Whether a file whose content is unchanged should be extracted again"""
+        return record.get('status') == 'failed' and record.get('attempts', 1) < MAX_INGEST_ATTEMPTS
+
+    def _ingest_batch(self, pool_path, batch):
+        """
+        Extract a batch of files and add them to their pool
+
+        Args:
+            pool_path (str): Pool CSV
+            batch (list): (path, stat record) pairs
+
+        Returns:
+            int: Number of resumes added or replaced
+        """
+        files = [_LocalResumeFile(path) for path, _ in batch]
+        pool_df = self.analyzer.process_resume_pool(files, parallel=True, max_workers=self.max_workers)
+
+        extracted = set()
+        if pool_df is not None and len(pool_df):
+            rows_df = pool_df.reindex(columns=POOL_COLUMNS)
+            append_pool_rows(pool_path, rows_df)
+            extracted = set(rows_df['File Name'].astype(str))
+
+        for path, current in batch:
+            if os.path.basename(path) in extracted:
+                record = dict(current, status='ingested')
+                record.pop('attempts', None)
+            else:
+                # Retries of unchanged content carry the earlier attempts along
+                attempts = current.get('attempts', 0) + 1 if current.get('status') == 'failed' else 1
+                record = dict(current, status='failed', attempts=attempts)
+            self._files[path] = record
+        return len(extracted)
+
+    def run_once(self):
+        """
+        Scan every source folder and ingest new or changed files
+
+        Returns:
+            dict: Files ingested / failed per pool, and the scan time
+        """
+        with self._lock:
+            start_time = time.perf_counter()
+            stats = {'pools': {}, 'ingested': 0, 'failed': 0}
+
+            for folder, pool_path in self.sources.items():
+                pending = self.pending_files(folder, pool_path)
+                ingested = 0
+                for start in range(0, len(pending), self.batch_size):
+                    batch = pending[start:start + self.batch_size]
+                    try:
+                        ingested += self._ingest_batch(pool_path, batch)
+                    except Exception as e:
+                        # Left out of the manifest, so the next scan retries the batch
+                        print(f"Error ingesting resumes into {pool_path}: {e}")
+                        continue
+                    # Progress survives a crash between batches
+                    self._save_manifest()
+
+                if pending:
+                    stats['pools'][pool_path] = {'ingested': ingested, 'failed': len(pending) - ingested}
+                stats['ingested'] += ingested
+                stats['failed'] += len(pending) - ingested
+
+            self._save_manifest()
+            stats['seconds'] = time.perf_counter() - start_time
+            self.last_stats = stats
+            return stats
+
+    def _start_observer(self):
+        """Wake the scan loop on file system events (polling alone without watchdog)"""
+        if not WATCHDOG_AVAILABLE:
+            return
+        wakeup = self._wakeup
+
+        class _WakeOnChange(FileSystemEventHandler):
+            def on_any_event(self, event):
+                wakeup.set()
+
+        try:
+            observer = Observer()
+            for folder in self.sources:
+                if os.path.isdir(folder):
+                    observer.schedule(_WakeOnChange(), folder, recursive=False)
+            observer.start()
+            self._observer = observer
+        except Exception as e:
+            print(f"Error watching resume folders, polling only: {e}")
+
+    def watch(self, interval=DEFAULT_POLL_INTERVAL, on_scan=None):
+        """
+        Scan until interrupted (Ctrl+C)
+
+        Scans run every `interval` seconds, and shortly after a file event when
+        watchdog is installed (once files have settled).
+
+        Args:
+            interval (float): Seconds between scans
+            on_scan (callable): Called with the stats of every scan
+        """
+        self._start_observer()
+        try:
+            while True:
+                try:
+                    stats = self.run_once()
+                    if on_scan:
+                        on_scan(stats)
+                except Exception as e:
+                    print(f"Error scanning resume folders: {e}")
+                if self._wakeup.wait(interval):
+                    self._wakeup.clear()
+                    time.sleep(self.settle_seconds)
+        finally:
+            if self._observer is not None:
+                self._observer.stop()
+                self._observer.join()
+                self._observer = None
@@ -0,0 +1,193 @@
+import numpy as np
+
+# Score thresholds for the high/medium/low buckets, shared by every ranking path
+HIGH_MATCH_THRESHOLD = 0.25
+MEDIUM_MATCH_THRESHOLD = 0.2
+
+# Bucket names in the order of the indices returned by bucket_indices()
+BUCKET_NAMES = ['low_matches', 'medium_matches', 'high_matches']
+
+# Adaptive thresholds: medium from the 60th and high from the 90th percentile
+# of the JD's score distribution (the fixed thresholds act as floors)
+ADAPTIVE_QUANTILES = (0.6, 0.9)
+
+# Sketch resolution; adaptive thresholds are multiples of 1 / SKETCH_BINS
+SKETCH_BINS = 200
+
+
+def bucket_indices(scores, thresholds=(MEDIUM_MATCH_THRESHOLD, HIGH_MATCH_THRESHOLD)):
+    """
+    Bucket every score in one vectorized pass
+
+    Args:
+        scores (numpy.ndarray): Similarity scores
+        thresholds (tuple): (medium, high) minimum scores
+
+    Returns:
+        numpy.ndarray: 0 for low, 1 for medium and 2 for high matches
+            (indices into BUCKET_NAMES)
+    """
+    edges = np.asarray(thresholds, dtype=np.float64)
+    return np.searchsorted(edges, np.asarray(scores, dtype=np.float64), side='right')
+
+
+class ScoreSketch:
+    """
+    Mergeable quantile sketch of a score distribution
+
+    Scores live in [0, 1], so a fixed-bin histogram is enough: updates are one
+    bincount per chunk, memory is SKETCH_BINS counters whatever the pool size,
+    and quantiles are exact up to one bin width. Thresholds taken from the sketch
+    are bin edges, so bucket sizes can be read off the histogram exactly.
+    """
+
+    def __init__(self, bins=SKETCH_BINS):
+        """
+        Initialize an empty sketch
+
+        Args:
+            bins (int): Number of equal-width bins over [0, 1]
+        """
+        self.bins = bins
+        self.edges = np.arange(bins + 1) / bins
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.total = 0
+
+    @classmethod
+    def from_scores(cls, scores, bins=SKETCH_BINS):
+        """Build a sketch of a complete score array"""
+        sketch = cls(bins)
+        sketch.update(scores)
+        return sketch
+
+    def bin_of(self, scores):
+        """Bin of every score (scores outside [0, 1] go to the first / last bin)"""
+        bins = np.searchsorted(self.edges, np.asarray(scores, dtype=np.float64), side='right') - 1
+        return np.clip(bins, 0, self.bins - 1)
+
+    def update(self, scores):
+        """Add a chunk of scores"""
+        if len(scores):
+            self.counts += np.bincount(self.bin_of(scores), minlength=self.bins)
+            self.total += len(scores)
+
+    def merge(self, other):
+        """Add the counts of another sketch with the same bins"""
+        self.counts += other.counts
+        self.total += other.total
+
+    def quantile(self, q):
+        """
+        Smallest bin edge with at least a fraction q of the scores below it
+
+        Args:
+            q (float): Quantile in [0, 1]
+
+        Returns:
+            float or None: Bin edge, None for an empty sketch
+        """
+        if not self.total:
+            return None
+        if q <= 0:
+            return float(self.edges[0])
+        # First bin whose cumulative count reaches q * total; its upper edge
+        cumulative = np.cumsum(self.counts)
+        index = int(np.searchsorted(cumulative, q * self.total, side='left'))
+        return float(self.edges[min(index + 1, self.bins)])
+
+    def snap(self, threshold):
+        """Smallest bin edge at or above a threshold"""
+        index = int(np.searchsorted(self.edges, threshold, side='left'))
+        return float(self.edges[min(index, self.bins)])
+
+    def bucket_counts(self, thresholds):
+        """
+        Exact bucket sizes for thresholds that are bin edges
+
+        Args:
+            thresholds (tuple): (medium, high) bin edges
+
+        Returns:
+            dict: Bucket name -> number of scores
+        """
+        medium, high = (int(np.searchsorted(self.edges, t, side='left')) for t in thresholds)
+        return {
+            'low_matches': int(self.counts[:medium].sum()),
+            'medium_matches': int(self.counts[medium:high].sum()),
+            'high_matches': int(self.counts[high:].sum())
+        }
+
+
+def adaptive_thresholds(sketch, quantiles=ADAPTIVE_QUANTILES,
+                        floors=(MEDIUM_MATCH_THRESHOLD, HIGH_MATCH_THRESHOLD)):
+    """
+    Per-JD (medium, high) thresholds from the score distribution
+
+    A threshold is the score quantile, but never below its floor, so a weak pool
+    does not get "high" matches just for being the best of a poor lot.
+
+    Args:
+        sketch (ScoreSketch): Sketch of the JD's scores
+        quantiles (tuple): (medium, high) quantiles
+        floors (tuple): (medium, high) minimum thresholds
+
+    Returns:
+        tuple: (medium, high) thresholds, bin edges of the sketch
+    """
+    thresholds = []
+    for q, floor in zip(quantiles, floors):
+        value = sketch.quantile(q)
+        floor = sketch.snap(floor)
+        thresholds.append(floor if value is None else max(value, floor))
+    medium, high = thresholds
+    return min(medium, high), high
+
+
+def score_thresholds(scores, adaptive=False, pool_size=None):
+    """
+    Thresholds used to bucket a complete score array
+
+    Args:
+        scores (numpy.ndarray): Similarity scores
+        adaptive (bool): Derive per-JD thresholds from the score distribution
+        pool_size (int): Size of the whole pool when the scores only cover a
+            shortlist of it; the resumes left out count as scoring 0
+
+    Returns:
+        tuple: (medium, high) thresholds
+    """
+    if not adaptive:
+        return MEDIUM_MATCH_THRESHOLD, HIGH_MATCH_THRESHOLD
+    sketch = ScoreSketch.from_scores(scores)
+    left_out = 0 if pool_size is None else max(pool_size - len(scores), 0)
+    sketch.counts[0] += left_out
+    sketch.total += left_out
+    return adaptive_thresholds(sketch)
+
+
+def rank_and_bucket(scores, thresholds=(MEDIUM_MATCH_THRESHOLD, HIGH_MATCH_THRESHOLD)):
+    """
+    Order a pool by score and split it into buckets
+
+    Args:
+        scores (numpy.ndarray): Similarity scores in pool order
+        thresholds (tuple): (medium, high) minimum scores
+
+    Returns:
+        tuple: (order, buckets) where order holds pool positions from best to worst
+            (earlier position first among ties) and buckets maps every name in
+            BUCKET_NAMES to its slice of order
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    order = np.lexsort((np.arange(len(scores)), -scores))
+
+    # Sorted scores fall into high, medium, low runs; their sizes give the slices
+    sizes = np.bincount(bucket_indices(scores, thresholds), minlength=len(BUCKET_NAMES))
+    high_end = int(sizes[2])
+    medium_end = high_end + int(sizes[1])
+    buckets = {
+        'high_matches': order[:high_end],
+        'medium_matches': order[high_end:medium_end],
+        'low_matches': order[medium_end:]
+    }
+    return order, buckets
\ No newline at end of file
@@ -0,0 +1,406 @@
+import hashlib
+import math
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer
+
+from utils.text_processing import TECH_KEYWORDS, extract_skills, preprocess_text
+
+# Final score blend (70% skill match, 30% text similarity)
+SKILL_WEIGHT = 0.7
+TEXT_WEIGHT = 0.3
+
+# Text similarity is defined as the cosine between TF-IDF vectors fitted on the
+# two-document corpus [job_text, resume_text]. With smooth idf a term found in
+# both documents gets idf 1 and a term found in only one gets 1 + ln(3/2), so the
+# pairwise score can be rebuilt from raw term counts of a single pool-wide matrix.
+_UNSHARED_IDF_SQ = (1.0 + math.log(1.5)) ** 2
+
+# Flat column layout of the skill taxonomy
+SKILL_COLUMNS = [
+    (category, keyword)
+    for category, keywords in TECH_KEYWORDS.items()
+    for keyword in keywords
+]
+
+# Skills are stored as one uint64 bitmask per category: bit i of a category's
+# mask is set when the i-th keyword of that category was found
+SKILL_CATEGORIES = list(TECH_KEYWORDS)
+_SKILL_BITS = {
+    (category, keyword): (position, np.uint64(1) << np.uint64(bit))
+    for position, (category, keywords) in enumerate(TECH_KEYWORDS.items())
+    for bit, keyword in enumerate(keywords)
+}
+for _category, _keywords in TECH_KEYWORDS.items():
+    if len(_keywords) > 64:
+        raise ValueError(f"Skill category '{_category}' has more than 64 keywords")
+
+# Per-byte popcount table for numpy versions without np.bitwise_count
+_BYTE_POPCOUNT = np.array([bin(value).count('1') for value in range(256)], dtype=np.uint8)
+
+
+def popcount(bits):
+    """
+    Count set bits of every element of a uint64 array
+
+    Args:
+        bits (numpy.ndarray): uint64 array
+
+    Returns:
+        numpy.ndarray: Bit counts with the same shape
+    """
+    bits = np.ascontiguousarray(bits, dtype=np.uint64)
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(bits)
+    as_bytes = bits.view(np.uint8).reshape(bits.shape + (8,))
+    return _BYTE_POPCOUNT[as_bytes].sum(axis=-1, dtype=np.uint8)
+
+
+def skills_to_bitmask(skills_map):
+    """
+    Encode an extract_skills result as one uint64 bitmask per category
+
+    Args:
+        skills_map (dict): Category -> list of keywords found
+
+    Returns:
+        numpy.ndarray: uint64 array aligned with SKILL_CATEGORIES
+    """
+    masks = np.zeros(len(SKILL_CATEGORIES), dtype=np.uint64)
+    for category, keywords in skills_map.items():
+        for keyword in keywords:
+            bit = _SKILL_BITS.get((category, keyword))
+            if bit is not None:
+                masks[bit[0]] |= bit[1]
+    return masks
+
+
+def bitmask_to_skills(masks):
+    """
+    Decode per-category bitmasks back into keyword lists
+
+    Args:
+        masks (numpy.ndarray): uint64 array aligned with SKILL_CATEGORIES
+
+    Returns:
+        dict: Category -> list of keywords in taxonomy order
+    """
+    return {
+        category: [
+            keyword for bit, keyword in enumerate(TECH_KEYWORDS[category])
+            if int(masks[position]) >> bit & 1
+        ]
+        for position, category in enumerate(SKILL_CATEGORIES)
+    }
+
+
+def job_texts(job_desc):
+    """
+    Build the skill and similarity texts for a job description
+
+    Args:
+        job_desc (dict): Job description with Skills and Tools fields
+
+    Returns:
+        tuple: (skill_text, similarity_text)
+    """
+    if not isinstance(job_desc, (dict, pd.Series)):
+        return "", ""
+
+    similarity_text = f"{job_desc.get('Skills', '')} {job_desc.get('Tools', '')}"
+    skill_text = similarity_text if 'Skills' in job_desc else ""
+    return skill_text, similarity_text
+
+
+def resume_texts(resume_df):
+    """
+    Build the skill and similarity texts for every resume in a pool
+
+    Args:
+        resume_df (DataFrame): DataFrame containing resume data
+
+    Returns:
+        tuple: (skill_texts, similarity_texts) as lists of strings
+    """
+    skills = resume_df['Skills'].tolist()
+    tools = resume_df['Tools'].tolist()
+    if 'Certifications' in resume_df.columns:
+        certifications = resume_df['Certifications'].tolist()
+    else:
+        certifications = [''] * len(resume_df)
+
+    skill_texts = [f"{s} {t}" for s, t in zip(skills, tools)]
+    similarity_texts = [f"{s} {t} {c}" for s, t, c in zip(skills, tools, certifications)]
+    return skill_texts, similarity_texts
+
+
+def pool_fingerprint(resume_df, columns=None):
+    """
+    Hash the scoring-relevant columns of a resume pool
+
+    Args:
+        resume_df (DataFrame): DataFrame containing resume data
+        columns (list): Columns to hash instead, e.g. every column when the
+            fingerprint also identifies the records shown for the pool
+
+    Returns:
+        str: Hex digest identifying the pool contents and row order
+    """
+    if columns is None:
+        columns = [column for column in ('Skills', 'Tools', 'Certifications') if column in resume_df.columns]
+    try:
+        row_hashes = pd.util.hash_pandas_object(resume_df[columns], index=False, categorize=False).to_numpy()
+    except TypeError:
+        # Unhashable cell values (lists, dicts) are hashed by their text
+        row_hashes = pd.util.hash_pandas_object(
+            resume_df[columns].astype(str), index=False, categorize=False
+        ).to_numpy()
+    digest = hashlib.sha256(row_hashes.tobytes())
+    digest.update(",".join(map(str, columns)).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class PoolScoringEngine:
+    """
+    Score a whole resume pool against job descriptions with array operations
+
+    The pool is analyzed once: skills become per-category uint64 bitmasks and the
+    preprocessed text becomes a sparse document-term matrix with a vocabulary
+    fitted once per pool. Scoring a job description then costs a handful of
+    sparse matrix-vector products instead of one TF-IDF fit per resume.
+    """
+
+    def __init__(self, resume_df, feature_index=None):
+        """
+        Analyze a resume pool
+
+        Args:
+            resume_df (DataFrame): DataFrame containing resume data
+            feature_index (ResumeFeatureIndex): Optional persistent feature store,
+                when given only resumes it has not seen before are analyzed
+        """
+        self.size = len(resume_df)
+
+        if feature_index is not None:
+            self.skill_bits, counts, self.vocabulary = feature_index.features_for(resume_df)
+            self.analyzer = feature_index.analyzer
+        else:
+            self.skill_bits, counts, self.vocabulary, self.analyzer = self._analyze(resume_df)
+
+        self.term_counts = counts.tocsr()
+        self.squared_counts = self.term_counts.multiply(self.term_counts).tocsr()
+        self.term_presence = self.term_counts.copy()
+        self.term_presence.data[:] = 1.0
+        self.row_sq_norms = np.asarray(self.squared_counts.sum(axis=1)).ravel()
+
+    @staticmethod
+    def _analyze(resume_df):
+        """
+        Compute skill indicators and term counts for a pool from scratch
+
+        Args:
+            resume_df (DataFrame): DataFrame containing resume data
+
+        Returns:
+            tuple: (skill_bits, term_counts, vocabulary, analyzer)
+        """
+        skill_texts, similarity_texts = resume_texts(resume_df)
+
+        # Skill bitmasks, one row per resume and one column per category
+        skill_bits = np.zeros((len(skill_texts), len(SKILL_CATEGORIES)), dtype=np.uint64)
+        for row, text in enumerate(skill_texts):
+            skill_bits[row] = skills_to_bitmask(extract_skills(text))
+
+        # Document-term matrix over the pool vocabulary
+        vectorizer = CountVectorizer()
+        try:
+            counts = vectorizer.fit_transform(
+                [preprocess_text(text) for text in similarity_texts]
+            ).astype(np.float64)
+            vocabulary = vectorizer.vocabulary_
+        except ValueError:
+            # Empty vocabulary - no resume has any scorable term
+            counts = sparse.csr_matrix((len(skill_texts), 0))
+            vocabulary = {}
+
+        return skill_bits, counts, vocabulary, vectorizer.build_analyzer()
+
+    def score(self, job_desc, rows=None):
+        """
+        Compute blended similarity scores for every resume in the pool
+
+        Args:
+            job_desc (dict): Job description with Skills and Tools fields
+            rows (numpy.ndarray): Optional pool positions to score (e.g. a
+                retrieval shortlist), all resumes when None
+
+        Returns:
+            numpy.ndarray: Array of similarity scores, aligned with rows when given
+        """
+        skill_text, similarity_text = job_texts(job_desc)
+        job_skills = extract_skills(skill_text) if skill_text else {}
+
+        skill_scores = self.skill_scores(job_skills, rows)
+        text_scores = self.text_scores(preprocess_text(similarity_text), rows)
+        return (SKILL_WEIGHT * skill_scores) + (TEXT_WEIGHT * text_scores)
+
+    def skill_scores(self, job_skills, rows=None):
+        """
+        Mean per-category skill match ratio for every resume
+
+        Args:
+            job_skills (dict): Category -> list of keywords required by the job
+            rows (numpy.ndarray): Optional pool positions to score
+
+        Returns:
+            numpy.ndarray: Array of skill scores
+        """
+        job_bits = skills_to_bitmask(job_skills)
+        required = popcount(job_bits).astype(np.float64)
+        skill_bits = self.skill_bits if rows is None else self.skill_bits[rows]
+        if not len(skill_bits):
+            return np.zeros(0)
+
+        # AND every resume mask with the job mask and count the shared bits
+        matches = popcount(skill_bits & job_bits)
+        category_scores = np.divide(
+            matches, required,
+            out=np.zeros(matches.shape), where=required > 0
+        )
+        return category_scores.mean(axis=1)
+
+    def text_scores(self, job_text, rows=None):
+        """
+        Pairwise TF-IDF cosine similarity for every resume in the pool
+
+        Args:
+            job_text (str): Preprocessed job description text
+            rows (numpy.ndarray): Optional pool positions to score
+
+        Returns:
+            numpy.ndarray: Array of text similarity scores
+        """
+        if rows is None:
+            term_counts, term_presence = self.term_counts, self.term_presence
+            squared_counts, row_sq_norms = self.squared_counts, self.row_sq_norms
+        else:
+            term_counts, term_presence = self.term_counts[rows], self.term_presence[rows]
+            squared_counts, row_sq_norms = self.squared_counts[rows], self.row_sq_norms[rows]
+        size = term_counts.shape[0]
+
+        job_counts = Counter(self.analyzer(job_text))
+        if not job_counts:
+            return np.zeros(size)
+
+        # Terms outside the pool vocabulary are never shared with any resume,
+        # they only contribute to the job vector norm
+        n_terms = self.term_counts.shape[1]
+        job_vector = np.zeros(n_terms)
+        for term, count in job_counts.items():
+            idx = self.vocabulary.get(term)
+            if idx is not None and idx < n_terms:
+                job_vector[idx] = count
+        job_total_sq = float(sum(count * count for count in job_counts.values()))
+
+        dot = term_counts @ job_vector
+        job_sq = (_UNSHARED_IDF_SQ * job_total_sq
+                  + (1.0 - _UNSHARED_IDF_SQ) * (term_presence @ (job_vector ** 2)))
+        resume_sq = (_UNSHARED_IDF_SQ * row_sq_norms
+                     + (1.0 - _UNSHARED_IDF_SQ) * (squared_counts @ (job_vector > 0).astype(np.float64)))
+
+        denominator = np.sqrt(job_sq * resume_sq)
+        return np.divide(dot, denominator, out=np.zeros(size), where=denominator > 0)
+
+    def job_features(self, job_descs):
+        """
+        Encode several job descriptions against the pool vocabulary
+
+        Args:
+            job_descs (list): Job descriptions with Skills and Tools fields
+
+        Returns:
+            tuple: (job_bits, job_counts, job_total_sq) where job_bits holds one row of
+                category bitmasks per JD, job_counts is a CSR term-count matrix over
+                the pool vocabulary and job_total_sq the squared norm of every JD's
+                full count vector (out-of-vocabulary terms included)
+        """
+        n_terms = self.term_counts.shape[1]
+        job_bits = np.zeros((len(job_descs), len(SKILL_CATEGORIES)), dtype=np.uint64)
+        job_total_sq = np.zeros(len(job_descs))
+        rows, columns, values = [], [], []
+
+        for row, job_desc in enumerate(job_descs):
+            skill_text, similarity_text = job_texts(job_desc)
+            if skill_text:
+                job_bits[row] = skills_to_bitmask(extract_skills(skill_text))
+
+            job_counts = Counter(self.analyzer(preprocess_text(similarity_text)))
+            job_total_sq[row] = sum(count * count for count in job_counts.values())
+            for term, count in job_counts.items():
+                idx = self.vocabulary.get(term)
+                if idx is not None and idx < n_terms:
+                    rows.append(row)
+                    columns.append(idx)
+                    values.append(count)
+
+        job_counts = sparse.csr_matrix(
+            (np.asarray(values, dtype=np.float64), (rows, columns)),
+            shape=(len(job_descs), n_terms)
+        )
+        return job_bits, job_counts, job_total_sq
+
+    def score_blocks(self, job_descs, jd_chunk_size=64, resume_chunk_size=10000):
+        """
+        Score many job descriptions against the pool, one bounded block at a time
+
+        Every JD is encoded once against the shared pool vocabulary; each block is
+        then a few sparse matrix products plus a broadcast bitmask AND, so peak
+        memory depends on the chunk sizes rather than on JDs x resumes.
+
+        Args:
+            job_descs (list): Job descriptions with Skills and Tools fields
+            jd_chunk_size (int): JDs per block
+            resume_chunk_size (int): Resumes per block
+
+        Yields:
+            tuple: (jd_start, resume_start, scores) with scores of shape
+                (JDs in block, resumes in block), same values as score()
+        """
+        job_bits, job_counts, job_total_sq = self.job_features(job_descs)
+        required = popcount(job_bits).astype(np.float64)
+
+        for jd_start in range(0, len(job_descs), jd_chunk_size):
+            jd_end = min(jd_start + jd_chunk_size, len(job_descs))
+            block_bits = job_bits[jd_start:jd_end]
+            block_required = required[jd_start:jd_end][:, None, :]
+            block_counts = job_counts[jd_start:jd_end]
+            block_sq_counts = block_counts.multiply(block_counts).tocsr()
+            block_presence = block_counts.copy()
+            block_presence.data[:] = 1.0
+            block_total_sq = job_total_sq[jd_start:jd_end][:, None]
+
+            for resume_start in range(0, self.size, resume_chunk_size):
+                resume_end = min(resume_start + resume_chunk_size, self.size)
+
+                # Skill overlap: AND every JD mask with every resume mask
+                matches = popcount(block_bits[:, None, :] & self.skill_bits[None, resume_start:resume_end, :])
+                category_scores = np.divide(
+                    matches, block_required,
+                    out=np.zeros(matches.shape), where=block_required > 0
+                )
+                skill_scores = category_scores.mean(axis=2)
+
+                # Pairwise TF-IDF cosine, as in text_scores() but for a JD block
+                counts_t = self.term_counts[resume_start:resume_end].T
+                dot = (block_counts @ counts_t).toarray()
+                job_sq = (_UNSHARED_IDF_SQ * block_total_sq
+                          + (1.0 - _UNSHARED_IDF_SQ) * (block_sq_counts @ self.term_presence[resume_start:resume_end].T).toarray())
+                resume_sq = (_UNSHARED_IDF_SQ * self.row_sq_norms[None, resume_start:resume_end]
+                             + (1.0 - _UNSHARED_IDF_SQ) * (block_presence @ self.squared_counts[resume_start:resume_end].T).toarray())
+                denominator = np.sqrt(job_sq * resume_sq)
+                text_scores = np.divide(dot, denominator, out=np.zeros(dot.shape), where=denominator > 0)
+
+                yield jd_start, resume_start, (SKILL_WEIGHT * skill_scores) + (TEXT_WEIGHT * text_scores)
\ No newline at end of file
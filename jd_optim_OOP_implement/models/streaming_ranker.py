@@ -0,0 +1,219 @@
+import heapq
+
+import numpy as np
+
+from models.match_breakdown import match_breakdown
+from models.score_buckets import (
+    ADAPTIVE_QUANTILES, BUCKET_NAMES, HIGH_MATCH_THRESHOLD, MEDIUM_MATCH_THRESHOLD,
+    ScoreSketch, adaptive_thresholds, bucket_indices
+)
+
+
+def resume_entry(resume_row, position, score, profile=None):
+    """
+    Build the result record shown in the UI for one resume
+
+    Args:
+        resume_row (Series or dict): Resume row
+        position (int): Position of the resume in the pool
+        score (float): Similarity score
+        profile (dict): Optional job_match_profile, adds the match breakdown
+            read by the detailed analysis and radar charts
+
+    Returns:
+        dict: Result record
+    """
+    entry = {
+        'Resume ID': resume_row.get('File Name', f"Resume_{position+1}"),
+        'Skills': resume_row.get('Skills', ''),
+        'Tools': resume_row.get('Tools', ''),
+        'Certifications': resume_row.get('Certifications', ''),
+        'Score': float(score)
+    }
+    if profile is not None:
+        entry['Breakdown'] = match_breakdown(
+            profile, entry['Skills'], entry['Tools'], entry['Certifications']
+        )
+    return entry
+
+
+def _select_best(scores, limit):
+    """
+    Positions of the `limit` best scores, earlier positions winning ties
+
+    Args:
+        scores (numpy.ndarray): Scores of one chunk
+        limit (int): Number of positions to keep
+
+    Returns:
+        numpy.ndarray: Selected positions (unordered)
+    """
+    if len(scores) <= limit:
+        return np.arange(len(scores))
+
+    # Linear-time selection of the limit-th largest score
+    cutoff = np.partition(scores, len(scores) - limit)[len(scores) - limit]
+    above = np.flatnonzero(scores > cutoff)
+    ties = np.flatnonzero(scores == cutoff)[:limit - len(above)]
+    return np.concatenate([above, ties])
+
+
+class StreamingRanker:
+    """
+    Rank a resume pool chunk by chunk without materializing the full sorted list
+
+    Keeps a bounded min-heap for the top K resumes, bucket counters, and
+    optionally a bounded heap with the best entries of each bucket for paginated
+    display. Memory stays flat no matter how many chunks are pushed.
+
+    In adaptive mode the thresholds are only known once every chunk was seen, so
+    scores go into a quantile sketch and the bounded heaps are kept per sketch
+    bin; the buckets are assembled from the bins when results are requested.
+    """
+
+    def __init__(self, top_k=3, bucket_limit=50,
+                 high_threshold=HIGH_MATCH_THRESHOLD, medium_threshold=MEDIUM_MATCH_THRESHOLD,
+                 profile=None, adaptive=False, quantiles=ADAPTIVE_QUANTILES):
+        """
+        Initialize the ranker
+
+        Args:
+            top_k (int): Number of best resumes to keep overall
+            bucket_limit (int): Number of best resumes to keep per bucket (0 keeps counts only)
+            high_threshold (float): Minimum score of a high match (the floor in adaptive mode)
+            medium_threshold (float): Minimum score of a medium match (the floor in adaptive mode)
+            profile (dict): Optional job_match_profile; kept entries then carry
+                their match breakdown (computed only for entries that are kept)
+            adaptive (bool): Derive the thresholds from the score distribution
+            quantiles (tuple): (medium, high) score quantiles used in adaptive mode
+        """
+        self.top_k = top_k
+        self.bucket_limit = bucket_limit
+        self.high_threshold = high_threshold
+        self.medium_threshold = medium_threshold
+        self.profile = profile
+        self.adaptive = adaptive
+        self.quantiles = quantiles
+
+        self.total = 0
+        self.sketch = ScoreSketch()
+        self.counts = dict.fromkeys(BUCKET_NAMES, 0)
+        self._top = []
+        self._buckets = {name: [] for name in BUCKET_NAMES}
+        self._bins = {}  # adaptive mode: sketch bin -> bounded heap
+
+    def push(self, scores, chunk_df, offset=None):
+        """
+        Consume the scores of one chunk of resumes
+
+        Args:
+            scores (numpy.ndarray): Similarity scores of the chunk
+            chunk_df (DataFrame): Resume rows of the chunk, aligned with scores
+            offset (int): Position of the chunk's first row in the pool
+                (defaults to the number of resumes pushed so far)
+        """
+        scores = np.asarray(scores, dtype=np.float64)
+        if offset is None:
+            offset = self.total
+        self.total += len(scores)
+        self.sketch.update(scores)
+
+        positions = np.arange(len(scores))
+        self._offer(self._top, self.top_k, scores, positions, chunk_df, offset)
+
+        if self.adaptive:
+            if self.bucket_limit:
+                # Group the chunk by sketch bin and keep the best entries of each bin
+                bins = self.sketch.bin_of(scores)
+                order = np.argsort(bins, kind='stable')
+                splits = np.flatnonzero(np.diff(bins[order])) + 1
+                for group in np.split(order, splits):
+                    if len(group):
+                        heap = self._bins.setdefault(int(bins[group[0]]), [])
+                        self._offer(heap, self.bucket_limit, scores[group], group, chunk_df, offset)
+            return
+
+        buckets = bucket_indices(scores, (self.medium_threshold, self.high_threshold))
+        sizes = np.bincount(buckets, minlength=len(BUCKET_NAMES))
+        for index, name in enumerate(BUCKET_NAMES):
+            self.counts[name] += int(sizes[index])
+            if self.bucket_limit and sizes[index]:
+                mask = buckets == index
+                self._offer(self._buckets[name], self.bucket_limit,
+                            scores[mask], positions[mask], chunk_df, offset)
+
+    def _offer(self, heap, limit, scores, positions, chunk_df, offset):
+        """Push the chunk's candidates for one bounded heap"""
+        if not limit or not len(scores):
+            return
+
+        for idx in _select_best(scores, limit):
+            position = int(positions[idx])
+            # Higher score first, then earlier pool position (stable ordering)
+            key = (float(scores[idx]), -(offset + position))
+            if len(heap) >= limit and key <= heap[0][0]:
+                continue
+
+            entry = resume_entry(chunk_df.iloc[position], offset + position, scores[idx], self.profile)
+            if len(heap) < limit:
+                heapq.heappush(heap, (key, entry))
+            else:
+                heapq.heapreplace(heap, (key, entry))
+
+    @staticmethod
+    def _ordered(heap):
+        """Heap entries sorted from best to worst"""
+        return [entry for _, entry in sorted(heap, key=lambda item: item[0], reverse=True)]
+
+    def thresholds(self):
+        """
+        Thresholds in effect
+
+        Returns:
+            tuple: (medium, high) minimum scores; in adaptive mode derived from
+                the scores pushed so far
+        """
+        if self.adaptive:
+            return adaptive_thresholds(self.sketch, self.quantiles,
+                                       (self.medium_threshold, self.high_threshold))
+        return self.medium_threshold, self.high_threshold
+
+    def _bucket_lists(self, thresholds):
+        """Bucket sizes and bounded entry lists"""
+        if not self.adaptive:
+            return dict(self.counts), {name: self._ordered(heap) for name, heap in self._buckets.items()}
+
+        # Thresholds are sketch bin edges, so every bin lies in exactly one bucket
+        counts = self.sketch.bucket_counts(thresholds)
+        medium_bin, high_bin = (int(np.searchsorted(self.sketch.edges, t, side='left')) for t in thresholds)
+        ranges = {
+            'low_matches': (0, medium_bin),
+            'medium_matches': (medium_bin, high_bin),
+            'high_matches': (high_bin, self.sketch.bins)
+        }
+        lists = {}
+        for name, (first, last) in ranges.items():
+            items = [item for b, heap in self._bins.items() if first <= b < last for item in heap]
+            best = heapq.nlargest(self.bucket_limit, items, key=lambda item: item[0])
+            lists[name] = [entry for _, entry in best]
+        return counts, lists
+
+    def results(self):
+        """
+        Get the categorized results
+
+        Returns:
+            dict: Same layout as ResumeAnalyzer.categorize_resumes, where the bucket
+                lists hold at most bucket_limit entries, 'counts' holds the full
+                bucket sizes and 'thresholds' the medium/high thresholds used
+        """
+        thresholds = self.thresholds()
+        counts, lists = self._bucket_lists(thresholds)
+        return {
+            'top_3': self._ordered(self._top),
+            'high_matches': lists['high_matches'],
+            'medium_matches': lists['medium_matches'],
+            'low_matches': lists['low_matches'],
+            'counts': dict(counts, total=self.total),
+            'thresholds': {'medium': float(thresholds[0]), 'high': float(thresholds[1])}
+        }
\ No newline at end of file
@@ -0,0 +1,341 @@
+"""
+Headless batch ranking of resume pools against a job description
+
+Reads pool CSVs in chunks (only the columns ranking uses), scores each chunk
+with the vectorized engine, optionally across worker processes, and writes the
+ranked result to CSV or Parquet in batches.
+
+Usage (from jd_optim_OOP_implement/):
+    python rank_resumes.py --jd "Data/JDs/JobDescriptionJavaPythonSupport.txt" \
+        --output ranked.csv "Data/Extracted Resumes/Resume_Dataset_Output.csv"
+"""
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from models.feature_index import ResumeFeatureIndex
+from models.resume_analyzer import ResumeAnalyzer
+from models.ranking_engine import DEFAULT_SCORER, SCORERS, RankingEngine
+from models.score_buckets import MEDIUM_MATCH_THRESHOLD, HIGH_MATCH_THRESHOLD, bucket_indices, score_thresholds
+from utils.file_utils import read_job_description
+from utils.text_processing import extract_skills_from_text, extract_tools_from_text
+
+# Columns read from pool CSVs (everything else, e.g. "Additional Expertise", is skipped)
+POOL_COLUMNS = ['File Name', 'Skills', 'Tools', 'Certifications']
+REQUIRED_COLUMNS = ['Skills', 'Tools']
+
+DEFAULT_CHUNK_SIZE = 5000
+
+# Rows per write when streaming the ranked output
+OUTPUT_BATCH_SIZE = 50000
+
+# Rows indexed (and saved to the feature index) at once before parallel scoring
+INDEX_CHUNK_SIZE = 20000
+
+# Per-process analyzer (single process) and read-only index (worker processes)
+_worker_analyzer = None
+_worker_index = None
+
+
+def build_job_desc(jd_path=None, skills=None, tools=None):
+    """
+    Build the job description dict the way the ranking page does
+
+    Args:
+        jd_path (str): Job description file (.txt or .docx)
+        skills (str): Comma-separated skills, overrides the ones found in the file
+        tools (str): Comma-separated tools, overrides the ones found in the file
+
+    Returns:
+        dict: Job description with File Name, Skills and Tools fields
+    """
+    jd_text = read_job_description(jd_path) if jd_path else ""
+    return {
+        'File Name': os.path.basename(jd_path) if jd_path else "command line",
+        'Skills': skills if skills is not None else extract_skills_from_text(jd_text),
+        'Tools': tools if tools is not None else extract_tools_from_text(jd_text)
+    }
+
+
+def read_pool_chunks(csv_paths, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Read resume pools chunk by chunk, projecting to the ranking columns
+
+    Args:
+        csv_paths (list): Pool CSV files, read one after the other
+        chunk_size (int): Rows per chunk
+
+    Yields:
+        DataFrame: Chunk with the available POOL_COLUMNS
+    """
+    for csv_path in csv_paths:
+        header = pd.read_csv(csv_path, nrows=0).columns
+        missing = [column for column in REQUIRED_COLUMNS if column not in header]
+        if missing:
+            raise ValueError(f"{csv_path} is missing required columns: {', '.join(missing)}")
+
+        usecols = [column for column in POOL_COLUMNS if column in header]
+        for chunk_df in pd.read_csv(csv_path, usecols=usecols, chunksize=chunk_size):
+            yield chunk_df
+
+
+def score_chunk(job_desc, chunk_df, use_index=True, scorer=DEFAULT_SCORER, read_only=False, stats=None):
+    """
+    Score one chunk of resumes
+
+    Args:
+        job_desc (dict): Job description with Skills and Tools fields
+        chunk_df (DataFrame): Resume rows
+        use_index (bool): Reuse and extend the persistent feature index
+        scorer (str): Scorer name
+        read_only (bool): Only read the feature index (worker processes, the
+            parent indexes the pools before fanning out)
+        stats (dict): Whole-pool statistics (see pool_stats)
+
+    Returns:
+        numpy.ndarray: Similarity scores
+    """
+    global _worker_analyzer, _worker_index
+    if not use_index:
+        return RankingEngine(scorer).score(job_desc, chunk_df, stats=stats)
+
+    if read_only:
+        if _worker_index is None:
+            _worker_index = ResumeFeatureIndex(read_only=True)
+        return RankingEngine(scorer, feature_index=_worker_index).score(job_desc, chunk_df, stats=stats)
+
+    if _worker_analyzer is None:
+        _worker_analyzer = ResumeAnalyzer()
+    return _worker_analyzer.ranking_engine(scorer).score(job_desc, chunk_df, stats=stats)
+
+
+def resume_ids(chunk_df, offset):
+    """Resume IDs of a chunk, numbered by pool position when File Name is missing"""
+    if 'File Name' in chunk_df.columns:
+        names = chunk_df['File Name'].tolist()
+    else:
+        names = [None] * len(chunk_df)
+    return [
+        name if not pd.isna(name) else f"Resume_{offset + i + 1}"
+        for i, name in enumerate(names)
+    ]
+
+
+def index_pools(csv_paths, executor=None):
+    """
+    Add the unseen resumes of the pools to the persistent feature index
+
+    Args:
+        csv_paths (list): Pool CSV files
+        executor (Executor): Optional executor analyzing resumes in parallel
+    """
+    index = ResumeFeatureIndex.shared()
+    for chunk_df in read_pool_chunks(csv_paths, INDEX_CHUNK_SIZE):
+        index.update(chunk_df, executor=executor)
+
+
+def pool_stats(job_desc, csv_paths, use_index=True, scorer=DEFAULT_SCORER):
+    """
+    Whole-pool statistics for scorers that need them (BM25), so every chunk is
+    scored against the same document frequencies and average length
+
+    Args:
+        job_desc (dict): Job description with Skills and Tools fields
+        csv_paths (list): Pool CSV files
+        use_index (bool): Reuse and extend the persistent feature index
+        scorer (str): Scorer name
+
+    Returns:
+        dict or None: Statistics for score_chunk, None when the scorer needs none
+    """
+    engine = RankingEngine(scorer, feature_index=ResumeFeatureIndex.shared() if use_index else None)
+    if not engine.needs_collection_stats:
+        return None
+    return engine.collection_stats(job_desc, read_pool_chunks(csv_paths, INDEX_CHUNK_SIZE))
+
+
+def score_pools(job_desc, csv_paths, chunk_size=DEFAULT_CHUNK_SIZE, workers=1, use_index=True,
+                scorer=DEFAULT_SCORER):
+    """
+    Score every resume of the pools, keeping only IDs and scores in memory
+
+    Args:
+        job_desc (dict): Job description with Skills and Tools fields
+        csv_paths (list): Pool CSV files
+        chunk_size (int): Rows per chunk
+        workers (int): Worker processes (1 scores in this process)
+        use_index (bool): Reuse and extend the persistent feature index
+        scorer (str): Scorer name
+
+    Returns:
+        tuple: (resume_ids, scores) in pool order
+    """
+    ids = []
+    score_parts = []
+
+    def collect(chunk_ids, scores):
+        ids.extend(chunk_ids)
+        score_parts.append(np.asarray(scores, dtype=np.float64))
+
+    offset = 0
+    if workers <= 1:
+        stats = pool_stats(job_desc, csv_paths, use_index, scorer)
+        for chunk_df in read_pool_chunks(csv_paths, chunk_size):
+            collect(resume_ids(chunk_df, offset), score_chunk(job_desc, chunk_df, use_index, scorer, stats=stats))
+            offset += len(chunk_df)
+    else:
+        # Bounded number of chunks in flight; results are consumed in submit order
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Only this process writes the index (the workers analyze the unseen
+            # resumes for it), workers then score against it read-only
+            if use_index:
+                index_pools(csv_paths, executor)
+            stats = pool_stats(job_desc, csv_paths, use_index, scorer)
+
+            for chunk_df in read_pool_chunks(csv_paths, chunk_size):
+                if len(pending) >= workers * 2:
+                    chunk_ids, future = pending.popleft()
+                    collect(chunk_ids, future.result())
+                pending.append((
+                    resume_ids(chunk_df, offset),
+                    executor.submit(score_chunk, job_desc, chunk_df, use_index, scorer, True, stats)
+                ))
+                offset += len(chunk_df)
+            while pending:
+                chunk_ids, future = pending.popleft()
+                collect(chunk_ids, future.result())
+
+    scores = np.concatenate(score_parts) if score_parts else np.zeros(0)
+    return ids, scores
+
+
+# Labels by bucket index (see models.score_buckets.BUCKET_NAMES)
+MATCH_LABELS = np.array(["Low", "Medium", "High"])
+
+
+def match_category(scores, thresholds=(MEDIUM_MATCH_THRESHOLD, HIGH_MATCH_THRESHOLD)):
+    """High/Medium/Low labels using the ranking page thresholds"""
+    return MATCH_LABELS[bucket_indices(scores, thresholds)]
+
+
+def write_ranking(ids, scores, output_path, top=None,
+                  thresholds=(MEDIUM_MATCH_THRESHOLD, HIGH_MATCH_THRESHOLD)):
+    """
+    Write resumes ordered by score, in batches
+
+    Args:
+        ids (list): Resume IDs in pool order
+        scores (numpy.ndarray): Scores in pool order
+        output_path (str): Destination, .parquet for Parquet and CSV otherwise
+        top (int): Only write the best `top` resumes
+        thresholds (tuple): (medium, high) thresholds of the Match column
+
+    Returns:
+        int: Number of rows written
+    """
+    # Best score first, earlier pool position first among ties
+    order = np.lexsort((np.arange(len(scores)), -scores))
+    if top is not None:
+        order = order[:top]
+
+    ids = np.asarray(ids, dtype=object)
+    parquet = output_path.lower().endswith(".parquet")
+    writer = None
+    if parquet:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit("Parquet output needs pyarrow (pip install pyarrow), or use a .csv output")
+
+    try:
+        for start in range(0, max(len(order), 1), OUTPUT_BATCH_SIZE):
+            rows = order[start:start + OUTPUT_BATCH_SIZE]
+            batch = pd.DataFrame({
+                'Rank': np.arange(start + 1, start + len(rows) + 1),
+                'Resume ID': ids[rows].astype(str),
+                'Score': scores[rows],
+                'Match': match_category(scores[rows], thresholds)
+            })
+            if parquet:
+                table = pa.Table.from_pandas(batch, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(output_path, table.schema)
+                writer.write_table(table)
+            else:
+                batch.to_csv(output_path, mode='w' if start == 0 else 'a', header=start == 0, index=False)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return len(order)
+
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Rank resume pool CSVs against a job description")
+    parser.add_argument("pools", nargs="+", help="Resume pool CSV files")
+    parser.add_argument("--jd", help="Job description file (.txt or .docx)")
+    parser.add_argument("--skills", help="Comma-separated skills (overrides the JD file)")
+    parser.add_argument("--tools", help="Comma-separated tools (overrides the JD file)")
+    parser.add_argument("--output", "-o", default="ranked_resumes.csv",
+                        help="Output file, .csv or .parquet (default: ranked_resumes.csv)")
+    parser.add_argument("--top", type=int, help="Only write the best N resumes")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Rows read and scored per chunk")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes used to score chunks")
+    parser.add_argument("--scorer", choices=list(SCORERS), default=DEFAULT_SCORER,
+                        help=f"Scoring method (default: {DEFAULT_SCORER})")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="Derive High/Medium thresholds from the score distribution of this JD")
+    parser.add_argument("--no-index", action="store_true",
+                        help="Do not read or extend the persistent resume feature index")
+    args = parser.parse_args(argv)
+
+    if not args.jd and args.skills is None and args.tools is None:
+        parser.error("give a job description with --jd, --skills or --tools")
+    return args
+
+
+def main(argv=None):
+    """Command line entry point"""
+    args = parse_args(argv)
+    job_desc = build_job_desc(args.jd, args.skills, args.tools)
+    print(f"Job description: {job_desc['File Name']}")
+    print(f"Skills: {job_desc['Skills']}")
+    print(f"Tools: {job_desc['Tools']}")
+    print(f"Scorer: {args.scorer}")
+
+    start = time.perf_counter()
+    try:
+        ids, scores = score_pools(
+            job_desc, args.pools, chunk_size=args.chunk_size,
+            workers=args.workers, use_index=not args.no_index, scorer=args.scorer
+        )
+    except (OSError, ValueError) as e:
+        print(f"Error reading resume pools: {e}")
+        return 1
+    elapsed = time.perf_counter() - start
+
+    thresholds = score_thresholds(scores, args.adaptive)
+    written = write_ranking(ids, scores, args.output, args.top, thresholds)
+
+    categories = match_category(scores, thresholds)
+    print(f"Scored {len(scores)} resumes in {elapsed:.2f}s "
+          f"({len(scores) / elapsed if elapsed > 0 else 0:.0f} resumes/s)")
+    print(f"Thresholds: High >= {thresholds[1]:.3f}, Medium >= {thresholds[0]:.3f}")
+    print(f"High: {int(np.sum(categories == 'High'))}, "
+          f"Medium: {int(np.sum(categories == 'Medium'))}, "
+          f"Low: {int(np.sum(categories == 'Low'))}")
+    print(f"Wrote {written} rows to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -2,6 +2,7 @@ import streamlit as st
 import datetime
 import json
 import os
+from utils.pool_store import get_pool_store
 
 class StateManager:
     """
@@ -201,7 +202,9 @@ class StateManager:
                 self.set('analytics_repository', import_data['analytics_repository'])
                 
             if 'resume_repository' in import_data:
-                self.set('resume_repository', import_data['resume_repository'])
+                # Older snapshots carry pool data inline, keep only pool ids in the session
+                resume_repository = get_pool_store().migrate_session_pools(import_data['resume_repository'])
+                self.set('resume_repository', resume_repository)
                 
             # Update history and metadata
             if 'state_history' in import_data:
@@ -7,7 +7,12 @@ import re
 from docx import Document
 from ui.common import display_section_header, display_subsection_header, display_info_message, display_warning_message, display_success_message
 from utils.visualization import create_distribution_chart, create_radar_chart
+from utils.pool_cache import load_resume_pool
+from utils.pool_store import get_pool_store
+from utils.text_processing import extract_skills_from_text, extract_tools_from_text
 from models.resume_analyzer import ResumeAnalyzer
+from models.match_breakdown import matched_skills, missing_skills
+from models.ranking_engine import job_fingerprint, scorer_labels
 
 def render_candidate_ranking_page(services):
     """
@@ -133,24 +138,39 @@ def render_candidate_ranking_page(services):
             st.warning("No resume data available. Please select or upload a valid resume pool.")
             return
     
+    # Scoring method and threshold mode
+    labels = scorer_labels()
+    scorer_name = st.selectbox(
+        "Scoring method",
+        list(labels),
+        index=list(labels).index('keyword'),
+        format_func=lambda name: labels[name],
+        key="ranking_scorer_selector",
+        help="Keyword match checks the JD's listed skills and tools; the other methods combine taxonomy skills with text relevance"
+    )
+    use_adaptive_thresholds = st.checkbox(
+        "Adaptive match thresholds",
+        value=False,
+        key="adaptive_thresholds_toggle",
+        help="Set the High/Medium cut-offs from this JD's score distribution (top 10% / next 30%), never below the default thresholds"
+    )
+    use_shortlist = st.checkbox(
+        "Fast candidate retrieval",
+        value=False,
+        key="candidate_shortlist_toggle",
+        help="For large pools: first retrieve the resumes containing the JD's terms and skills, then score and rank only those (the whole pool is scored when too few are found)"
+    )
+    
     # Analyze button
     if st.button('🔍 Analyze Resumes', type="primary", key="analyze_resume_btn"):
         with st.spinner('Analyzing resumes...'):
             try:
                 # Get job description as dict/Series for analysis
-                skills = extract_skills_from_text(jd_content)
-                tools = extract_tools_from_text(jd_content)
+                job_desc = build_job_desc(jd_content, jd_source_name, jd_type)
                 
                 st.info(f"Analyzing job description: {jd_source_name}")
-                st.info(f"Found skills: {skills}")
-                st.info(f"Found tools: {tools}")
-                
-                job_desc = pd.Series({
-                    'File Name': jd_source_name,
-                    'JD_Type': jd_type,
-                    'Skills': skills,
-                    'Tools': tools
-                })
+                st.info(f"Found skills: {job_desc['Skills']}")
+                st.info(f"Found tools: {job_desc['Tools']}")
                 
                 # Check resume data
                 if resume_df is None or len(resume_df) == 0:
@@ -163,77 +183,22 @@ def render_candidate_ranking_page(services):
                 placeholder = st.empty()
                 placeholder.info("Starting analysis...")
                 
-                # Manually create analysis results
-                all_resumes = []
-                for i, row in resume_df.iterrows():
-                    # Simple scoring algorithm
-                    resume_skills = str(row.get('Skills', ''))
-                    resume_tools = str(row.get('Tools', ''))
-                    
-                    # Direct matching for demonstration
-                    skill_matches = 0
-                    if skills and resume_skills:
-                        for skill in skills.split(', '):
-                            if skill.lower() in resume_skills.lower():
-                                skill_matches += 1
-                    
-                    tool_matches = 0
-                    if tools and resume_tools:
-                        for tool in tools.split(', '):
-                            if tool.lower() in resume_tools.lower():
-                                tool_matches += 1
-                    
-                    # Calculate score (simple version)
-                    skill_count = len(skills.split(', ')) if skills else 1
-                    tool_count = len(tools.split(', ')) if tools else 1
-                    
-                    max_skills = max(1, skill_count)
-                    max_tools = max(1, tool_count)
-                    
-                    skill_score = skill_matches / max_skills
-                    tool_score = tool_matches / max_tools
-                    
-                    # Combined score
-                    score = 0.7 * skill_score + 0.3 * tool_score
-                    
-                    # Add to results
-                    all_resumes.append({
-                        'Resume ID': row.get('File Name', f"Resume_{i+1}"),
-                        'Skills': row.get('Skills', ''),
-                        'Tools': row.get('Tools', ''),
-                        'Certifications': row.get('Certifications', ''),
-                        'Score': float(score)
-                    })
-                    
-                    # Update progress
-                    if i % 10 == 0 or i == len(resume_df) - 1:
-                        placeholder.info(f"Processed {i+1}/{len(resume_df)} resumes...")
-                
-                # Sort by score
-                all_resumes.sort(key=lambda x: x['Score'], reverse=True)
-                
-                # Categorize
-                high_threshold = 0.25
-                medium_threshold = 0.15
-                
-                high_matches = [r for r in all_resumes if r['Score'] >= high_threshold]
-                medium_matches = [r for r in all_resumes if medium_threshold <= r['Score'] < high_threshold]
-                low_matches = [r for r in all_resumes if r['Score'] < medium_threshold]
-                
-                # Create results dictionary
-                results = {
-                    'top_3': all_resumes[:3] if len(all_resumes) >= 3 else all_resumes,
-                    'high_matches': high_matches,
-                    'medium_matches': medium_matches,
-                    'low_matches': low_matches
-                }
+                # Score, bucket and break down every resume with the shared ranking engine
+                engine = resume_analyzer.ranking_engine(scorer_name)
+                results = engine.rank(job_desc, resume_df, adaptive=use_adaptive_thresholds, shortlist=use_shortlist)
+                high_matches = results['high_matches']
+                medium_matches = results['medium_matches']
+                low_matches = results['low_matches']
                 
                 # Store results in state manager
                 resume_repository['analysis_results'] = results
                 state_manager.set('resume_repository', resume_repository)
                 
                 placeholder.success(f"Analysis complete! Found {len(high_matches)} high matches, {len(medium_matches)} medium matches, and {len(low_matches)} low matches")
-                st.success(f"Resume analysis completed with {len(all_resumes)} resumes processed")
+                if results['shortlist']:
+                    st.success(f"Resume analysis completed: {results['candidates']} of {len(resume_df)} resumes retrieved and ranked")
+                else:
+                    st.success(f"Resume analysis completed with {len(resume_df)} resumes processed")
                 
                 # Force a rerun to update the UI
                 st.rerun()
@@ -243,6 +208,17 @@ def render_candidate_ranking_page(services):
     
     # --- Results Display ---
     analysis_results = resume_repository.get('analysis_results')
+    job_desc = build_job_desc(jd_content, jd_source_name, jd_type)
+    
+    # After a feedback iteration the JD differs from the analyzed one; re-rank the
+    # same pool right away (the analyzed pool is cached, only the JD side is recomputed)
+    refreshed = refresh_analysis_results(analysis_results, job_desc, resume_df, resume_analyzer)
+    if refreshed is not None:
+        analysis_results = refreshed
+        resume_repository['analysis_results'] = refreshed
+        state_manager.set('resume_repository', resume_repository)
+        st.info("Rankings updated for the latest version of the job description")
+    
     if analysis_results:
         # Analysis overview in second column
         with col2:
@@ -250,6 +226,10 @@ def render_candidate_ranking_page(services):
             try:
                 chart = create_distribution_chart(analysis_results)
                 st.plotly_chart(chart, use_container_width=True)
+                
+                thresholds = analysis_results.get('thresholds')
+                if thresholds:
+                    st.caption(f"High ≥ {thresholds['high']:.1%}, Medium ≥ {thresholds['medium']:.1%}")
             except Exception as e:
                 st.error(f"Error creating distribution chart: {str(e)}")
                 display_info_message("Chart visualization failed. Please check your data.")
@@ -258,14 +238,6 @@ def render_candidate_ranking_page(services):
         with col3:
             display_subsection_header("Detailed Analysis")
             if 'top_3' in analysis_results and len(analysis_results['top_3']) > 0:
-                # Get JD as a Series for radar chart
-                job_desc = pd.Series({
-                    'File Name': jd_source_name,
-                    'JD_Type': jd_type,
-                    'Skills': extract_skills_from_text(jd_content),
-                    'Tools': extract_tools_from_text(jd_content)
-                })
-                
                 display_detailed_resume_analysis(analysis_results, job_desc)
             else:
                 st.info("No detailed analysis available.")
@@ -297,73 +269,53 @@ def detect_jd_type(file_name):
     # Default type
     return 'general'
 
-def extract_skills_from_text(text):
+def build_job_desc(jd_content, jd_source_name, jd_type):
     """
-    Extract skills from text (simplified version)
+    Build the job description record scored by the ranking engine
     
     Args:
-        text (str): The text to extract skills from
+        jd_content (str): Job description text
+        jd_source_name (str): Job description file name
+        jd_type (str): Detected job type
         
     Returns:
-        str: Comma-separated list of found skills
+        Series: File Name, JD_Type, Skills and Tools of the job description
     """
-    if not text:
-        return ""
-        
-    # Real implementation would use NLP or pattern matching
-    common_skills = [
-        'python', 'java', 'javascript', 'react', 'angular', 'node', 'aws', 'azure',
-        'docker', 'kubernetes', 'sql', 'nosql', 'mongodb', 'machine learning', 'ai',
-        'data analysis', 'cloud', 'devops', 'ci/cd', 'agile', 'scrum', 'rest api',
-        'spring', 'hibernate', 'microservices', 'django', 'flask', 'vue', 'typescript',
-        'html', 'css', 'php', 'ruby', 'c#', 'c++', 'golang', 'scala', 'rust',
-        'git', 'jenkins', 'terraform', 'ansible', 'prometheus', 'grafana'
-    ]
-    
-    found_skills = []
-    text_lower = text.lower()
-    
-    # Use simpler string matching instead of regex
-    for skill in common_skills:
-        # Ensure case-insensitive string matching
-        if f" {skill} " in f" {text_lower} " or f" {skill}," in f" {text_lower} " or f" {skill}." in f" {text_lower} ":
-            found_skills.append(skill)
-    
-    return ", ".join(found_skills)
+    return pd.Series({
+        'File Name': jd_source_name,
+        'JD_Type': jd_type,
+        'Skills': extract_skills_from_text(jd_content),
+        'Tools': extract_tools_from_text(jd_content)
+    })
 
-def extract_tools_from_text(text):
+def refresh_analysis_results(analysis_results, job_desc, resume_df, resume_analyzer):
     """
-    Extract tools from text (simplified version)
+    Re-rank the analyzed pool when the job description has changed since the analysis
     
     Args:
-        text (str): The text to extract tools from
+        analysis_results (dict): Stored analysis results
+        job_desc (Series): Current job description record
+        resume_df (DataFrame): Currently selected resume pool
+        resume_analyzer (ResumeAnalyzer): Analyzer providing the ranking engine
         
     Returns:
-        str: Comma-separated list of found tools
+        dict or None: New results, or None when the stored ones are current or
+            belong to another pool (those need a new analysis)
     """
-    if not text:
-        return ""
-        
-    # Real implementation would use NLP or pattern matching
-    common_tools = [
-        'git', 'jenkins', 'travis', 'circle ci', 'jira', 'confluence', 'slack',
-        'vscode', 'intellij', 'eclipse', 'visual studio', 'docker', 'terraform',
-        'ansible', 'chef', 'puppet', 'kubernetes', 'aws cli', 'azure cli',
-        'maven', 'gradle', 'npm', 'yarn', 'webpack', 'babel', 'gulp', 'grunt',
-        'jupyter', 'numpy', 'pandas', 'scikit-learn', 'tensorflow', 'pytorch',
-        'tableau', 'power bi', 'excel', 'postman', 'soapui', 'github', 'gitlab'
-    ]
-    
-    found_tools = []
-    text_lower = text.lower()
-    
-    # Use simpler string matching instead of regex
-    for tool in common_tools:
-        # Ensure case-insensitive string matching
-        if f" {tool} " in f" {text_lower} " or f" {tool}," in f" {text_lower} " or f" {tool}." in f" {text_lower} ":
-            found_tools.append(tool)
-    
-    return ", ".join(found_tools)
+    if not analysis_results or not analysis_results.get('jd_hash') or 'counts' in analysis_results:
+        return None
+    if analysis_results['jd_hash'] == job_fingerprint(job_desc):
+        return None
+    
+    try:
+        engine = resume_analyzer.ranking_engine(analysis_results.get('scorer') or 'keyword')
+        if resume_df is None or engine.pool_cache.fingerprint(resume_df) != analysis_results.get('pool_hash'):
+            return None
+        return engine.rank(job_desc, resume_df, adaptive=analysis_results.get('adaptive', False),
+                           shortlist=analysis_results.get('shortlist', False))
+    except Exception as e:
+        print(f"Error refreshing ranking results: {e}")
+        return None
 
 def create_fallback_analysis(resume_df):
     """
@@ -407,15 +359,10 @@ def handle_resume_pool_selection(selection, resume_analyzer, jd_type, state_mana
         
         if resume_file_path and os.path.exists(resume_file_path):
             try:
-                # Load the resume file
-                resume_df = pd.read_csv(resume_file_path)
+                # Load the resume file (ranking columns only, via the Parquet cache)
+                resume_df = load_resume_pool(resume_file_path)
                 st.success(f"Loaded resume pool from {os.path.basename(resume_file_path)}")
                 
-                # Ensure required columns exist
-                for col in ['File Name', 'Skills', 'Tools', 'Certifications']:
-                    if col not in resume_df.columns:
-                        resume_df[col] = ""
-                
                 return resume_df
             except Exception as e:
                 st.error(f"Error loading resume file: {e}")
@@ -440,21 +387,40 @@ def handle_resume_pool_selection(selection, resume_analyzer, jd_type, state_mana
         if st.button("Add Resume Pool", key="add_pool"):
             if new_pool_name and new_pool_files:
                 with st.spinner("Processing resume files..."):
-                    # Process all uploaded resumes
-                    pool_df = resume_analyzer.process_resume_pool(new_pool_files)
+                    progress_bar = st.progress(0.0)
+                    progress_text = st.empty()
+                    
+                    def update_progress(done, total, file_name):
+                        progress_bar.progress(done / max(total, 1))
+                        progress_text.caption(f"Processed {done}/{total}: {file_name}")
+                    
+                    # Process all uploaded resumes, parsing DOCX files in parallel
+                    pool_df = resume_analyzer.process_resume_pool(
+                        new_pool_files,
+                        parallel=True,
+                        progress_callback=update_progress
+                    )
                     
                     if pool_df is not None and not pool_df.empty:
                         # Display preview of the processed data
+                        stats = getattr(resume_analyzer, 'last_ingestion_stats', {})
                         st.success(f"Successfully processed {len(pool_df)} resumes")
+                        if stats:
+                            st.caption(
+                                f"Ingested {stats['files']} files in {stats['seconds']:.1f}s "
+                                f"({stats['files_per_sec']:.1f} files/sec)"
+                            )
                         
                         with st.expander("Preview Processed Resumes"):
                             st.dataframe(pool_df[['File Name', 'Skills', 'Tools']].head(5))
                         
-                        # Update resume repository
+                        # Keep the pool data in the shared store, the session only keeps its id
+                        pool_id = get_pool_store().put(pool_df)
                         pools = resume_repository.get('pools', [])
                         pools.append({
                             "pool_name": new_pool_name, 
-                            "data": pool_df.to_dict('records')  # Convert to dict for storage
+                            "pool_id": pool_id,
+                            "rows": len(pool_df)
                         })
                         resume_repository['pools'] = pools
                         state_manager.set('resume_repository', resume_repository)
@@ -494,14 +460,10 @@ def handle_resume_pool_selection(selection, resume_analyzer, jd_type, state_mana
         
         if resume_file_path and os.path.exists(resume_file_path):
             try:
-                resume_df = pd.read_csv(resume_file_path)
+                # Ranking columns only, via the Parquet cache (missing ones filled with "")
+                resume_df = load_resume_pool(resume_file_path)
                 st.success(f"Loaded {selection} resume pool from {os.path.basename(resume_file_path)}")
                 
-                # Ensure required columns exist
-                for col in ['File Name', 'Skills', 'Tools', 'Certifications']:
-                    if col not in resume_df.columns:
-                        resume_df[col] = ""
-                
                 return resume_df
             except Exception as e:
                 st.error(f"Error loading resume file: {e}")
@@ -519,8 +481,16 @@ def handle_resume_pool_selection(selection, resume_analyzer, jd_type, state_mana
         for pool in pools:
             if pool["pool_name"] == selection:
                 try:
-                    # Convert stored dict back to DataFrame
-                    pool_df = pd.DataFrame(pool["data"])
+                    if "data" in pool:
+                        # Pool stored inline by an older session, move it to the shared store
+                        get_pool_store().migrate_session_pools(resume_repository)
+                        state_manager.set('resume_repository', resume_repository)
+                        pool = next(p for p in resume_repository['pools'] if p["pool_name"] == selection)
+                    
+                    pool_df = get_pool_store().get(pool.get("pool_id"))
+                    if pool_df is None:
+                        st.error(f"Resume pool '{selection}' is no longer available. Please upload it again.")
+                        return None
                     st.success(f"Loaded custom resume pool '{selection}' with {len(pool_df)} resumes")
                     return pool_df
                 except Exception as e:
@@ -606,23 +576,59 @@ def display_detailed_resume_analysis(categorized_resumes, job_desc):
                     st.info("Match analysis visualization unavailable")
             
             with col_b:
-                # Get certifications with safe fallback
-                certs = resume.get('Certifications', 'Experience')
-                if not certs or certs.strip() == '':
-                    certs = 'Experience'
-                
-                st.markdown(f"""
-                <div class="insight-box compact-text">
-                    <h4>Key Match Analysis</h4>
-                    <p>This candidate shows alignment with the job requirements based on their skills and experience:</p>
-                    <ul>
-                        <li>Technical skills match core requirements</li>
-                        <li>Experience with relevant tools and technologies</li>
-                        <li>{certs} enhances qualifications</li>
-                    </ul>
-                    <p><strong>Overall assessment:</strong> Good potential match based on technical qualifications.</p>
-                </div>
-                """, unsafe_allow_html=True)
+                breakdown = resume.get('Breakdown')
+                if breakdown:
+                    st.markdown(format_breakdown_html(breakdown), unsafe_allow_html=True)
+                else:
+                    # Get certifications with safe fallback
+                    certs = resume.get('Certifications', 'Experience')
+                    if not certs or certs.strip() == '':
+                        certs = 'Experience'
+                    
+                    st.markdown(f"""
+                    <div class="insight-box compact-text">
+                        <h4>Key Match Analysis</h4>
+                        <p>This candidate shows alignment with the job requirements based on their skills and experience:</p>
+                        <ul>
+                            <li>Technical skills match core requirements</li>
+                            <li>Experience with relevant tools and technologies</li>
+                            <li>{certs} enhances qualifications</li>
+                        </ul>
+                        <p><strong>Overall assessment:</strong> Good potential match based on technical qualifications.</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+def format_breakdown_html(breakdown):
+    """
+    Render a precomputed match breakdown as the Key Match Analysis box
+    
+    Args:
+        breakdown (dict): Breakdown stored with the analysis results
+        
+    Returns:
+        str: HTML snippet
+    """
+    def listing(items, limit=8):
+        if not items:
+            return "none"
+        shown = ", ".join(items[:limit])
+        return shown + (f" (+{len(items) - limit} more)" if len(items) > limit else "")
+    
+    matched = matched_skills(breakdown)
+    missing = missing_skills(breakdown)
+    tools = breakdown.get('tools', {})
+    
+    return f"""
+    <div class="insight-box compact-text">
+        <h4>Key Match Analysis</h4>
+        <ul>
+            <li><strong>Matched skills ({len(matched)}/{len(matched) + len(missing)}):</strong> {listing(matched)}</li>
+            <li><strong>Missing skills:</strong> {listing(missing)}</li>
+            <li><strong>Tool overlap:</strong> {breakdown.get('tool_overlap', 0):.0%} ({listing(tools.get('matched', []))})</li>
+            <li><strong>Certifications:</strong> {breakdown.get('cert_count', 0)}</li>
+        </ul>
+    </div>
+    """
 
 def display_categorized_resumes(analysis_results):
     """Display all resumes categorized by match level"""
@@ -630,11 +636,14 @@ def display_categorized_resumes(analysis_results):
         st.info("No analysis results available")
         return
         
+    # Streaming rankings keep capped bucket lists and report full sizes in 'counts'
+    bucket_sizes = analysis_results.get('counts', {})
+    
     cat_col1, cat_col2, cat_col3 = st.columns(3)
     
     with cat_col1:
         high_matches = analysis_results.get('high_matches', [])
-        with st.expander(f"High Matches ({len(high_matches)})"):
+        with st.expander(f"High Matches ({bucket_sizes.get('high_matches', len(high_matches))})"):
             if high_matches:
                 for resume in high_matches:
                     try:
@@ -656,7 +665,7 @@ def display_categorized_resumes(analysis_results):
     
     with cat_col2:
         medium_matches = analysis_results.get('medium_matches', [])
-        with st.expander(f"Medium Matches ({len(medium_matches)})"):
+        with st.expander(f"Medium Matches ({bucket_sizes.get('medium_matches', len(medium_matches))})"):
             if medium_matches:
                 for resume in medium_matches:
                     try:
@@ -678,7 +687,7 @@ def display_categorized_resumes(analysis_results):
     
     with cat_col3:
         low_matches = analysis_results.get('low_matches', [])
-        with st.expander(f"Low Matches ({len(low_matches)})"):
+        with st.expander(f"Low Matches ({bucket_sizes.get('low_matches', len(low_matches))})"):
             if low_matches:
                 for resume in low_matches:
                     try:
@@ -7,7 +7,8 @@ from docx import Document
 from ui.common import (
     display_section_header, display_subsection_header,
     display_warning_message, display_info_message, display_success_message,
-    render_jd_selector, display_jd_comparison
+    render_jd_selector, display_jd_comparison, get_version_summaries,
+    stream_to_placeholder
 )
 from utils.file_utils import save_enhanced_jd
 from utils.jd_summary import generate_version_summary
@@ -290,6 +291,8 @@ def render_client_feedback_page(services):
         client_feedback = client_feedback_data.get('text')
         feedback_type = client_feedback_data.get('type')
         
+        # The revised JD is shown live while the model writes it
+        stream_placeholder = st.empty()
         with st.spinner("Enhancing job description with client feedback..."):
             try:
                 # Create feedback object with type
@@ -335,7 +338,10 @@ def render_client_feedback_page(services):
                 )
                 
                 # Call the agent to generate the enhanced JD
-                enhanced_jd = agent.generate_final_description(jd_content, [feedback_obj])
+                enhanced_jd = agent.generate_final_description(
+                    jd_content, [feedback_obj],
+                    on_update=stream_to_placeholder(stream_placeholder, st.markdown)
+                )
                 
                 # Store the enhanced JD in state
                 state_manager.set('client_enhanced_jd', enhanced_jd)
@@ -514,6 +520,7 @@ def display_jd_comparison_with_summary(original_jd, enhanced_jd, services, conte
     """
     analyzer = services.get('analyzer')
     agent = services.get('agent')
+    state_manager = services.get('state_manager')
     
     # Create main columns for JD comparison
     col1, col2 = st.columns(2)
@@ -540,23 +547,22 @@ def display_jd_comparison_with_summary(original_jd, enhanced_jd, services, conte
     # Add the summary section
     st.markdown("### Changes Summary")
     
-    with st.spinner("Generating summary..."):
-        # Generate summary using the agent
-        if agent:
-            summary = agent.generate_version_summary(original_jd, enhanced_jd)
-            
-            st.markdown(
-                f"""
-                <div style="background-color: #2D3748; padding: 15px; border-radius: 5px; border-left: 4px solid #4299E1; margin-bottom: 20px;">
-                    <div style="color: #FFFFFF; font-size: 1em;">
-                        {summary}
-                    </div>
+    # Generated once per (original, enhanced) pair and kept in the JD repository
+    if agent:
+        summary = get_version_summaries(state_manager, agent, [(original_jd, enhanced_jd)])[0]
+        
+        st.markdown(
+            f"""
+            <div style="background-color: #2D3748; padding: 15px; border-radius: 5px; border-left: 4px solid #4299E1; margin-bottom: 20px;">
+                <div style="color: #FFFFFF; font-size: 1em;">
+                    {summary}
                 </div>
-                """, 
-                unsafe_allow_html=True
-            )
-        else:
-            st.error("AI agent is not available. Cannot generate summary.")
+            </div>
+            """, 
+            unsafe_allow_html=True
+        )
+    else:
+        st.error("AI agent is not available. Cannot generate summary.")
     
     # Compare original vs enhanced with skill analysis
     if original_jd and enhanced_jd and analyzer:
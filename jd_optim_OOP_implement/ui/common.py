@@ -2,7 +2,16 @@ import streamlit as st
 import os
 import datetime
 import json
+import time
 from utils.file_utils import read_job_description
+from utils.jd_summary import fetch_version_summaries, summary_key
+from models.job_description_agent import SUMMARY_FAILED, SUMMARY_UNAVAILABLE
+
+# Version summaries kept in the JD repository (oldest dropped first)
+MAX_STORED_SUMMARIES = 32
+
+# Minimum seconds between two redraws of streamed model output
+STREAM_REFRESH_SECONDS = 0.1
 
 def render_header():
     """Render the application header with logo, title, and context info"""
@@ -355,6 +364,79 @@ def display_jd_comparison(original_jd, enhanced_jd, services, context=""):
             )
             st.caption("Percentages indicate keyword coverage in each category")
 
+def get_version_summaries(state_manager, agent, pairs):
+    """
+    Get AI change summaries for (original, enhanced) JD pairs, generating each only once
+    
+    Summaries are stored in the JD repository under 'version_summaries', keyed by
+    the pair's content, so reruns render them without any model call. Missing
+    ones are generated together, concurrently, the first time they are needed.
+    
+    Args:
+        state_manager (StateManager): State manager holding the JD repository
+        agent (JobDescriptionAgent): Agent generating missing summaries
+        pairs (list): (original_jd, enhanced_jd) tuples
+        
+    Returns:
+        list: Summaries in the order of pairs
+    """
+    jd_repository = state_manager.get('jd_repository', {})
+    stored = dict(jd_repository.get('version_summaries', {}))
+    keys = [summary_key(original, enhanced) for original, enhanced in pairs]
+    
+    missing = {}
+    for key, pair in zip(keys, pairs):
+        if key not in stored:
+            missing.setdefault(key, pair)
+    
+    generated = {}
+    if missing and agent:
+        with st.spinner("Generating summaries..."):
+            summaries = fetch_version_summaries(agent, list(missing.values()))
+        generated = dict(zip(missing, summaries))
+        
+        # Failures are shown but not kept, so the next rerun tries again
+        kept = {
+            key: summary for key, summary in generated.items()
+            if summary and summary not in (SUMMARY_FAILED, SUMMARY_UNAVAILABLE)
+        }
+        if kept:
+            stored.update(kept)
+            for key in list(stored)[:-MAX_STORED_SUMMARIES]:
+                del stored[key]
+            # A cache, not a JD change: stored without history or jd_updated notification
+            jd_repository = dict(state_manager.get('jd_repository', {}))
+            jd_repository['version_summaries'] = stored
+            state_manager.set('jd_repository', jd_repository)
+    
+    return [stored.get(key) or generated.get(key) or SUMMARY_FAILED for key in keys]
+
+def stream_to_placeholder(placeholder, render):
+    """
+    Build an on_update callback that renders streamed model output live
+    
+    Redraws happen at most every STREAM_REFRESH_SECONDS, so long answers do not
+    flood the browser with one update per token.
+    
+    Args:
+        placeholder: st.empty() placeholder to draw into
+        render (callable): render(value) drawing the partial output
+        
+    Returns:
+        callable: Callback for the agent's on_update parameter
+    """
+    last_redraw = [0.0]
+    
+    def on_update(value):
+        now = time.monotonic()
+        if now - last_redraw[0] < STREAM_REFRESH_SECONDS:
+            return
+        last_redraw[0] = now
+        with placeholder.container():
+            render(value)
+    
+    return on_update
+
 def render_jd_selector(state_manager, services, context=""):
     """
     Unified job description selector component
@@ -7,11 +7,27 @@ from utils.visualization import create_multi_radar_chart, create_comparison_data
 from ui.common import (
     display_section_header, display_subsection_header, 
     display_warning_message, display_info_message, display_success_message,
-    render_jd_selector, render_feedback_component, display_jd_comparison
+    render_jd_selector, render_feedback_component, display_jd_comparison,
+    get_version_summaries, stream_to_placeholder
 )
 from utils.file_utils import read_job_description
+from models.job_description_agent import split_versions
 
-def render_enhanced_versions_with_summaries(enhanced_versions, jd_content, agent):
+def render_partial_versions(text):
+    """
+    Render enhanced versions while they are being generated
+    
+    The text is split here, on throttled redraws only, not on every delta.
+    
+    Args:
+        text (str): Model response received so far
+    """
+    st.caption("Generating enhanced versions...")
+    for idx, version in enumerate(split_versions(text)):
+        st.markdown(f"**Version {idx + 1}**")
+        st.markdown(version)
+
+def render_enhanced_versions_with_summaries(enhanced_versions, jd_content, agent, state_manager):
     """
     Render enhanced versions with summaries displayed before the content
     
@@ -19,7 +35,13 @@ def render_enhanced_versions_with_summaries(enhanced_versions, jd_content, agent
         enhanced_versions (list): List of enhanced versions
         jd_content (str): Original JD content
         agent: AI agent for generating summaries
+        state_manager: State manager whose JD repository keeps the summaries
     """
+    # Summaries are generated once per (original, version) pair, all three concurrently
+    summaries = get_version_summaries(
+        state_manager, agent, [(jd_content, version) for version in enhanced_versions[:3]]
+    )
+    
     # Create tabs for content and analysis
     enhanced_tabs = st.tabs(["Enhanced Versions", "Analysis & Comparison"])
     
@@ -28,31 +50,29 @@ def render_enhanced_versions_with_summaries(enhanced_versions, jd_content, agent
         version_tabs = st.tabs(["Version 1", "Version 2", "Version 3"])
         for idx, (tab, version) in enumerate(zip(version_tabs, enhanced_versions)):
             with tab:
-                # Generate and display summary first
+                # Display summary first
                 st.markdown("### Version Summary")
                 
-                with st.spinner("Generating summary..."):
-                    # Generate summary using the agent
-                    summary_text = agent.generate_version_summary(jd_content, version)
-                    
-                    # Process summary into bullet points if it's not already in that format
-                    if not summary_text.strip().startswith("•"):
-                        # Split into sentences and convert to bullet points
-                        sentences = [s.strip() for s in summary_text.split('.') if s.strip()]
-                        bullet_summary = "\n".join([f"• {sentence}." for sentence in sentences if sentence])
-                    else:
-                        bullet_summary = summary_text
-                    
-                    st.markdown(
-                        f"""
-                        <div style="background-color: #2D3748; padding: 12px; border-radius: 5px; border-left: 4px solid #4299E1; margin-bottom: 15px;">
-                            <div style="color: #FFFFFF; font-size: 0.9em;">
-                                {bullet_summary}
-                            </div>
+                summary_text = summaries[idx]
+                
+                # Process summary into bullet points if it's not already in that format
+                if not summary_text.strip().startswith("•"):
+                    # Split into sentences and convert to bullet points
+                    sentences = [s.strip() for s in summary_text.split('.') if s.strip()]
+                    bullet_summary = "\n".join([f"• {sentence}." for sentence in sentences if sentence])
+                else:
+                    bullet_summary = summary_text
+                
+                st.markdown(
+                    f"""
+                    <div style="background-color: #2D3748; padding: 12px; border-radius: 5px; border-left: 4px solid #4299E1; margin-bottom: 15px;">
+                        <div style="color: #FFFFFF; font-size: 0.9em;">
+                            {bullet_summary}
                         </div>
-                        """, 
-                        unsafe_allow_html=True
-                    )
+                    </div>
+                    """, 
+                    unsafe_allow_html=True
+                )
                 
                 # Display version content AFTER the summary
                 st.text_area(
@@ -409,6 +429,7 @@ def render_jd_optimization_page(services):
             enhanced_versions = jd_repository.get('enhanced_versions', [])
             
             # Check if we need to generate versions
+            regenerate = False
             if not enhanced_versions:
                 # Check if we have cached versions from logger
                 cached_versions = None
@@ -458,10 +479,16 @@ def render_jd_optimization_page(services):
                 
                 # Handle generating enhanced versions
                 if generate_btn:
+                    # Versions are shown live while the model writes them
+                    stream_placeholder = st.empty()
                     with st.spinner("Generating enhanced versions... This may take a moment"):
                         # Call the agent to generate versions
                         try:
-                            versions = agent.generate_initial_descriptions(jd_content)
+                            versions = agent.generate_initial_descriptions(
+                                jd_content, regenerate=regenerate,
+                                on_update=stream_to_placeholder(stream_placeholder, render_partial_versions)
+                            )
+                            stream_placeholder.empty()
                             
                             # Ensure we have 3 versions
                             while len(versions) < 3:
@@ -491,7 +518,7 @@ def render_jd_optimization_page(services):
             # Display enhanced versions if available
             if enhanced_versions:
                 # Use our custom function to render enhanced versions with summaries
-                render_enhanced_versions_with_summaries(enhanced_versions, jd_content, agent)
+                render_enhanced_versions_with_summaries(enhanced_versions, jd_content, agent, state_manager)
                 
                 # Show analysis & comparison tab content
                 enhanced_tabs = st.tabs(["Enhanced Versions", "Analysis & Comparison"])
@@ -651,6 +678,7 @@ def render_jd_optimization_page(services):
                 # Generate Final JD Button
                 if st.button("🚀 Generate Final Enhanced Version", type="primary", key="generate_final_jd"):
                     try:
+                        stream_placeholder = st.empty()
                         with st.spinner("Enhancing job description with feedback..."):
                             # Log version selection if using logger
                             if logger:
@@ -664,7 +692,8 @@ def render_jd_optimization_page(services):
                             
                             # Generate final JD using AI agent
                             final_description = agent.generate_final_description(
-                                base_description, feedback_history
+                                base_description, feedback_history,
+                                on_update=stream_to_placeholder(stream_placeholder, st.markdown)
                             )
                             
                             # Store in session state
@@ -697,61 +726,58 @@ def render_jd_optimization_page(services):
                         key="final_description"
                     )
                     
+                    # Both summaries are generated once per (base, final) pair, concurrently
+                    base_version = enhanced_versions[selected_index]
+                    summary_vs_original, summary_vs_base = get_version_summaries(
+                        state_manager, agent, [(jd_content, final_version), (base_version, final_version)]
+                    )
+                    
                     # Create two columns for the summaries
                     col1, col2 = st.columns(2)
                     
                     with col1:
                         st.markdown("### Changes from Original")
                         
-                        with st.spinner("Generating summary..."):
-                            # Generate summary compared to original
-                            summary_vs_original = agent.generate_version_summary(jd_content, final_version)
-                            
-                            # Process summary into bullet points if it's not already in that format
-                            if not summary_vs_original.strip().startswith("•"):
-                                # Split into sentences and convert to bullet points
-                                sentences = [s.strip() for s in summary_vs_original.split('.') if s.strip()]
-                                bullet_summary = "\n".join([f"• {sentence}." for sentence in sentences if sentence])
-                            else:
-                                bullet_summary = summary_vs_original
-                            
-                            st.markdown(
-                                f"""
-                                <div style="background-color: #2D3748; padding: 12px; border-radius: 5px; border-left: 4px solid #4299E1;">
-                                    <div style="color: #FFFFFF; font-size: 0.9em;">
-                                        {bullet_summary}
-                                    </div>
+                        # Process summary into bullet points if it's not already in that format
+                        if not summary_vs_original.strip().startswith("•"):
+                            # Split into sentences and convert to bullet points
+                            sentences = [s.strip() for s in summary_vs_original.split('.') if s.strip()]
+                            bullet_summary = "\n".join([f"• {sentence}." for sentence in sentences if sentence])
+                        else:
+                            bullet_summary = summary_vs_original
+                        
+                        st.markdown(
+                            f"""
+                            <div style="background-color: #2D3748; padding: 12px; border-radius: 5px; border-left: 4px solid #4299E1;">
+                                <div style="color: #FFFFFF; font-size: 0.9em;">
+                                    {bullet_summary}
                                 </div>
-                                """, 
-                                unsafe_allow_html=True
-                            )
+                            </div>
+                            """, 
+                            unsafe_allow_html=True
+                        )
                     
                     with col2:
                         st.markdown(f"### Changes from Version {selected_index + 1}")
                         
-                        with st.spinner("Generating summary..."):
-                            # Generate summary compared to base version
-                            base_version = enhanced_versions[selected_index]
-                            summary_vs_base = agent.generate_version_summary(base_version, final_version)
-                            
-                            # Process summary into bullet points if it's not already in that format
-                            if not summary_vs_base.strip().startswith("•"):
-                                # Split into sentences and convert to bullet points
-                                sentences = [s.strip() for s in summary_vs_base.split('.') if s.strip()]
-                                bullet_summary = "\n".join([f"• {sentence}." for sentence in sentences if sentence])
-                            else:
-                                bullet_summary = summary_vs_base
-                            
-                            st.markdown(
-                                f"""
-                                <div style="background-color: #2D3748; padding: 12px; border-radius: 5px; border-left: 4px solid #38A169;">
-                                    <div style="color: #FFFFFF; font-size: 0.9em;">
-                                        {bullet_summary}
-                                    </div>
+                        # Process summary into bullet points if it's not already in that format
+                        if not summary_vs_base.strip().startswith("•"):
+                            # Split into sentences and convert to bullet points
+                            sentences = [s.strip() for s in summary_vs_base.split('.') if s.strip()]
+                            bullet_summary = "\n".join([f"• {sentence}." for sentence in sentences if sentence])
+                        else:
+                            bullet_summary = summary_vs_base
+                        
+                        st.markdown(
+                            f"""
+                            <div style="background-color: #2D3748; padding: 12px; border-radius: 5px; border-left: 4px solid #38A169;">
+                                <div style="color: #FFFFFF; font-size: 0.9em;">
+                                    {bullet_summary}
                                 </div>
-                                """, 
-                                unsafe_allow_html=True
-                            )
+                            </div>
+                            """, 
+                            unsafe_allow_html=True
+                        )
                     
                     # Compare original vs final JD with skill analysis
                     display_subsection_header("📊 Final Analysis")
@@ -0,0 +1,136 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+# Default limits for the process-wide cache
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Rough per-entry bookkeeping overhead counted against the size cap
+_ENTRY_OVERHEAD = 256
+
+
+def content_key(kind, file_bytes):
+    """
+    Build a cache key from the raw bytes of an uploaded file
+
+    Args:
+        kind (str): Extraction type (e.g. 'docx', 'csv')
+        file_bytes (bytes): Uploaded file content
+
+    Returns:
+        str: Cache key
+    """
+    return f"{kind}:{hashlib.sha256(file_bytes).hexdigest()}"
+
+
+def _entry_size(value):
+    """Approximate memory footprint of a cached extraction result"""
+    if not value:
+        return _ENTRY_OVERHEAD
+    return _ENTRY_OVERHEAD + sum(len(str(k)) + len(str(v)) for k, v in value.items())
+
+
+class ExtractionCache:
+    """
+    Thread-safe LRU cache of resume extraction results keyed by content hash
+
+    Bounded both by entry count and by approximate size in bytes; the least
+    recently used entries are evicted first. Results of None (files that could
+    not be extracted as a single resume) are cached too.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries (int): Maximum number of cached results
+            max_bytes (int): Maximum approximate size of all cached results
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        Look up a cached result
+
+        Args:
+            key (str): Cache key from content_key()
+
+        Returns:
+            tuple: (found, result) where result is a copy of the cached dict
+        """
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value, _ = self._entries[key]
+            return True, dict(value) if value is not None else None
+
+    def put(self, key, value):
+        """
+        Store a result, evicting least recently used entries over the limits
+
+        Args:
+            key (str): Cache key from content_key()
+            value (dict or None): Extraction result
+        """
+        size = _entry_size(value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._size -= self._entries.pop(key)[1]
+            self._entries[key] = (dict(value) if value is not None else None, size)
+            self._size += size
+
+            while self._entries and (len(self._entries) > self.max_entries or self._size > self.max_bytes):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+
+    def clear(self):
+        """Drop all cached results"""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self):
+        """
+        Get cache statistics
+
+        Returns:
+            dict: Entry count, approximate size, hits and misses
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+
+# Module-level instance, shared by every Streamlit session in the process
+_shared_cache = ExtractionCache()
+
+
+def get_extraction_cache():
+    """
+    Get the process-wide extraction cache
+
+    Returns:
+        ExtractionCache: Shared cache instance
+    """
+    return _shared_cache
\ No newline at end of file
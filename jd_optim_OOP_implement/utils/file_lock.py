@@ -0,0 +1,71 @@
+import os
+import time
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    # Windows: fall back to msvcrt byte-range locks
+    import msvcrt
+    FCNTL_AVAILABLE = False
+
+
+class FileLock:
+    """
+    Exclusive lock shared by every process using the same lock file
+
+    Blocks until the lock is free. The lock is released by the operating system
+    if the holding process dies, so a crashed writer never leaves it stuck.
+    Not re-entrant: use it with a threading lock around it for threads.
+    """
+
+    def __init__(self, path):
+        """
+        Initialize the lock
+
+        Args:
+            path (str): Lock file, created on first use
+        """
+        self.path = path
+        self._file = None
+
+    def acquire(self):
+        """Block until the lock is held"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        lock_file = open(self.path, 'a+')
+        try:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                while True:
+                    try:
+                        msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+                        break
+                    except OSError:
+                        time.sleep(0.05)
+        except Exception:
+            lock_file.close()
+            raise
+        self._file = lock_file
+
+    def release(self):
+        """Release the lock"""
+        lock_file, self._file = self._file, None
+        if lock_file is None:
+            return
+        try:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            lock_file.close()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
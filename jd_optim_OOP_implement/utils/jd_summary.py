@@ -5,7 +5,8 @@ This module should be placed in the utils directory.
 
 import re
 import difflib
-from nltk.tokenize import sent_tokenize
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 
 class JDSummaryGenerator:
     """
@@ -101,6 +102,9 @@ class JDSummaryGenerator:
         
         # Look for key sentence additions using sentence tokenization
         try:
+            # Imported here, NLTK is slow to import and only needed for summaries
+            from nltk.tokenize import sent_tokenize
+            
             orig_sentences = set(sent_tokenize(original_text))
             enhanced_sentences = set(sent_tokenize(enhanced_text))
             
@@ -312,4 +316,52 @@ def generate_version_summary(original_jd, enhanced_jd):
         str: Summary of changes
     """
     generator = JDSummaryGenerator()
-    return generator.generate_summary(original_jd, enhanced_jd)
\ No newline at end of file
+    return generator.generate_summary(original_jd, enhanced_jd)
+
+
+def summary_key(original_jd, enhanced_jd):
+    """
+    Key identifying an (original, enhanced) pair of job descriptions
+    
+    Args:
+        original_jd (str): Original job description
+        enhanced_jd (str): Enhanced job description
+        
+    Returns:
+        str: Hex digest of both texts
+    """
+    digest = hashlib.sha256()
+    digest.update((original_jd or "").encode('utf-8'))
+    digest.update(b'\x00')
+    digest.update((enhanced_jd or "").encode('utf-8'))
+    return digest.hexdigest()[:32]
+
+
+def fetch_version_summaries(agent, pairs, max_workers=4):
+    """
+    Generate AI summaries for several (original, enhanced) pairs concurrently
+    
+    Each summary is a blocking model call, so they run in a thread pool and
+    the total wait is that of the slowest call rather than their sum.
+    
+    Args:
+        agent (JobDescriptionAgent): Agent generating the summaries
+        pairs (list): (original_jd, enhanced_jd) tuples
+        max_workers (int): Maximum concurrent model calls
+        
+    Returns:
+        list: Summaries in the order of pairs (None where generation raised)
+    """
+    if not pairs:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as executor:
+        futures = [executor.submit(agent.generate_version_summary, original, enhanced) for original, enhanced in pairs]
+        summaries = []
+        for future in futures:
+            try:
+                summaries.append(future.result())
+            except Exception as e:
+                print(f"Error generating version summary: {e}")
+                summaries.append(None)
+    return summaries
\ No newline at end of file
@@ -0,0 +1,221 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+# Default location, relative to the working directory like logs/
+DEFAULT_CACHE_PATH = os.path.join("cache", "llm_responses.sqlite3")
+
+# Responses older than this are regenerated
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+
+# Total size of the stored responses; least recently used ones are evicted beyond it
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Seconds a writer waits for another process holding the database lock
+_BUSY_TIMEOUT = 10.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model_id TEXT NOT NULL,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+
+def response_key(model_id, temperature, max_tokens, prompt):
+    """
+    Build a cache key for a model request
+
+    Args:
+        model_id (str): Bedrock model id
+        temperature (float): Sampling temperature
+        max_tokens (int): Response token limit
+        prompt (str): Prompt text
+
+    Returns:
+        str: Cache key
+    """
+    prompt_hash = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+    request = json.dumps([model_id, float(temperature), int(max_tokens), prompt_hash])
+    return hashlib.sha256(request.encode('utf-8')).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    Persistent cache of model responses, shared by every process using the file
+
+    Responses live in a SQLite database (WAL mode, so readers never block the
+    writer and app workers can share it). Entries expire after a TTL, and the
+    least recently used ones are evicted once the stored responses exceed a
+    size cap. Every call opens its own short-lived connection, which keeps the
+    cache safe to use from any thread.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl_seconds=DEFAULT_TTL_SECONDS, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache
+
+        Args:
+            path (str): SQLite database file
+            ttl_seconds (float): Age after which a response is no longer served
+            max_bytes (int): Maximum total size of the stored responses
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._initialized = False
+        self._init_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self):
+        """Open a connection, creating the database on first use"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=_BUSY_TIMEOUT)
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    connection.execute("PRAGMA journal_mode=WAL")
+                    connection.executescript(_SCHEMA)
+                    self._initialized = True
+        return connection
+
+    def get(self, key):
+        """
+        Look up a response
+
+        Args:
+            key (str): Key from response_key()
+
+        Returns:
+            dict or None: Cached response body, None if missing or expired
+        """
+        try:
+            connection = self._connect()
+            try:
+                with connection:
+                    row = connection.execute(
+                        "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+                    ).fetchone()
+                    now = time.time()
+                    if row is not None and now - row[1] > self.ttl_seconds:
+                        connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                        row = None
+                    if row is not None:
+                        connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            finally:
+                connection.close()
+        except Exception as e:
+            print(f"Error reading LLM response cache: {e}")
+            row = None
+
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key, model_id, response):
+        """
+        Store a response, evicting least recently used ones over the size cap
+
+        Args:
+            key (str): Key from response_key()
+            model_id (str): Model that produced the response
+            response (dict): Response body
+        """
+        payload = json.dumps(response)
+        size = len(payload.encode('utf-8'))
+        if size > self.max_bytes:
+            return
+
+        try:
+            connection = self._connect()
+            try:
+                with connection:
+                    now = time.time()
+                    connection.execute(
+                        "INSERT OR REPLACE INTO responses (key, model_id, response, size, created_at, accessed_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, model_id, payload, size, now, now)
+                    )
+                    connection.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,))
+                    self._evict(connection)
+            finally:
+                connection.close()
+        except Exception as e:
+            # A response that cannot be cached is still returned to the caller
+            print(f"Error writing LLM response cache: {e}")
+
+    def _evict(self, connection):
+        """Delete least recently used responses until the total size fits the cap"""
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = []
+        for key, size in connection.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def clear(self):
+        """Drop all stored responses"""
+        try:
+            connection = self._connect()
+            try:
+                with connection:
+                    connection.execute("DELETE FROM responses")
+            finally:
+                connection.close()
+        except Exception as e:
+            print(f"Error clearing LLM response cache: {e}")
+
+    def stats(self):
+        """
+        Get cache statistics
+
+        Returns:
+            dict: Entry count, stored bytes, and this process's hits and misses
+        """
+        entries, size = 0, 0
+        try:
+            if os.path.exists(self.path):
+                connection = self._connect()
+                try:
+                    entries, size = connection.execute(
+                        "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+                    ).fetchone()
+                finally:
+                    connection.close()
+        except Exception as e:
+            print(f"Error reading LLM response cache: {e}")
+        return {'entries': entries, 'bytes': size, 'hits': self.hits, 'misses': self.misses}
+
+
+# Module-level instance, shared by every Streamlit session in the process
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_llm_cache():
+    """
+    Get the process-wide LLM response cache
+
+    Returns:
+        LLMResponseCache: Shared cache
+    """
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = LLMResponseCache()
+        return _shared_cache
\ No newline at end of file
@@ -0,0 +1,218 @@
+import os
+import threading
+
+# Missing NLTK data is downloaded on first use; set to 0 to never download
+# (air-gapped deployments then use the bundled fallbacks right away)
+NLTK_DOWNLOAD_ENV = "JDOPTIM_NLTK_DOWNLOAD"
+
+# Seconds a download may take before the bundled fallback is used instead
+NLTK_DOWNLOAD_TIMEOUT = 30
+
+# NLTK's English stopword list, bundled so preprocessing works without corpora
+ENGLISH_STOPWORDS = frozenset("""
+i me my myself we our ours ourselves you you're you've you'll you'd your yours
+yourself yourselves he him his himself she she's her hers herself it it's its
+itself they them their theirs themselves what which who whom this that that'll
+these those am is are was were be been being have has had having do does did
+doing a an the and but if or because as until while of at by for with about
+against between into through during before after above below to from up down
+in out on off over under again further then once here there when where why how
+all any both each few more most other some such no nor not only own same so
+than too very s t can will just don don't should should've now d ll m o re ve y
+ain aren aren't couldn couldn't didn didn't doesn doesn't hadn hadn't hasn
+hasn't haven haven't isn isn't ma mightn mightn't mustn mustn't needn needn't
+shan shan't shouldn shouldn't wasn wasn't weren weren't won won't wouldn
+wouldn't
+""".split())
+
+
+class FallbackLemmatizer:
+    """
+    Rule-based noun lemmatizer used when WordNet data is not available
+
+    Applies the plural suffix rules of WordNet's morphy without the dictionary
+    lookup, plus a short list of irregular plurals and words that only look
+    plural. It is an approximation of WordNetLemmatizer, but it is applied to
+    both job descriptions and resumes, so matching stays consistent.
+    """
+
+    # Bump whenever the rules change (stored normalized text depends on them)
+    RULES_VERSION = 2
+
+    # Irregular plurals
+    EXCEPTIONS = {
+        'men': 'man',
+        'women': 'woman',
+        'children': 'child',
+        'feet': 'foot',
+        'teeth': 'tooth',
+        'mice': 'mouse',
+        'indices': 'index',
+        'matrices': 'matrix',
+        'analyses': 'analysis',
+        'criteria': 'criterion',
+        'data': 'data',
+        'apis': 'api',
+        'kpis': 'kpi',
+    }
+
+    # Words ending in 's' that are not plurals
+    KEEP = frozenset([
+        'aws', 'kubernetes', 'jenkins', 'redis', 'analytics', 'devops', 'ios',
+        'js', 'pandas', 'numpy', 'sas', 'postgres', 'express', 'news', 'series',
+        'business', 'process', 'access', 'address', 'class', 'status', 'bus',
+        'plus', 'basis', 'analysis', 'thesis', 'canvas', 'atlas', 'chaos',
+        'physics', 'mathematics', 'statistics', 'economics', 'logistics',
+        'ethics', 'graphics', 'electronics', 'genomics', 'is', 'has', 'was',
+        'this', 'us', 'yes', 'gas', 'lens', 'campus', 'corpus', 'virus',
+        'does', 'goes',
+    ])
+
+    # Endings of words that are never plural nouns (nodejs, reactjs, class, status, basis)
+    NON_PLURAL_ENDINGS = ('js', 'ss', 'us', 'is')
+
+    # (suffix, replacement) pairs from WordNet's noun morphology rules
+    SUFFIX_RULES = [
+        ('ies', 'y'),
+        ('ches', 'ch'),
+        ('shes', 'sh'),
+        ('sses', 'ss'),
+        ('xes', 'x'),
+        ('zes', 'z'),
+        ('men', 'man'),
+        ('s', ''),
+    ]
+
+    def lemmatize(self, word, pos='n'):
+        """
+        Lemmatize a lowercase word
+
+        Args:
+            word (str): Word to lemmatize
+            pos (str): Part of speech, only nouns are reduced
+
+        Returns:
+            str: Lemma
+        """
+        if pos != 'n' or len(word) <= 3 or word in self.KEEP:
+            return word
+
+        if word in self.EXCEPTIONS:
+            return self.EXCEPTIONS[word]
+
+        if word.endswith(self.NON_PLURAL_ENDINGS):
+            return word
+
+        for suffix, replacement in self.SUFFIX_RULES:
+            if word.endswith(suffix):
+                return word[:-len(suffix)] + replacement
+
+        return word
+
+
+_lock = threading.Lock()
+_stop_words = None
+_lemmatizer = None
+
+
+def _download_allowed():
+    """Whether missing NLTK data may be downloaded"""
+    return os.environ.get(NLTK_DOWNLOAD_ENV, "").lower() not in ("0", "false", "no")
+
+
+def _download(package):
+    """
+    Best-effort NLTK download, given up after NLTK_DOWNLOAD_TIMEOUT seconds
+
+    The download runs in a daemon thread so an unreachable server cannot
+    block the app; a download that finishes late is used on the next start.
+    """
+    if not _download_allowed():
+        return False
+    result = []
+
+    def run():
+        try:
+            import nltk
+            result.append(bool(nltk.download(package, quiet=True)))
+        except Exception as e:
+            print(f"Error downloading NLTK package {package}: {e}")
+            result.append(False)
+
+    thread = threading.Thread(target=run, name=f"nltk-download-{package}", daemon=True)
+    thread.start()
+    thread.join(NLTK_DOWNLOAD_TIMEOUT)
+    if thread.is_alive():
+        print(f"Error downloading NLTK package {package}: no answer within {NLTK_DOWNLOAD_TIMEOUT}s")
+        return False
+    return result[0]
+
+
+def _warn_fallback(package, replacement):
+    """Tell the operator that scores are computed without an NLTK package"""
+    print(f"Warning: NLTK '{package}' data is not available, using {replacement} instead. "
+          f"Tokenization and scores differ from a setup with the data; install it with "
+          f"'python -m nltk.downloader {package}'.")
+
+
+def _load_stop_words():
+    """NLTK English stopwords, or the bundled copy if the corpus is missing"""
+    for attempt in range(2):
+        try:
+            from nltk.corpus import stopwords
+            return set(stopwords.words('english'))
+        except ImportError:
+            break
+        except LookupError:
+            if attempt or not _download('stopwords'):
+                break
+    _warn_fallback('stopwords', "the bundled stopword list")
+    return set(ENGLISH_STOPWORDS)
+
+
+def _load_lemmatizer():
+    """WordNetLemmatizer, or the rule-based fallback if WordNet is missing"""
+    for attempt in range(2):
+        try:
+            from nltk.stem import WordNetLemmatizer
+            lemmatizer = WordNetLemmatizer()
+            # WordNet is read lazily, so a probe call surfaces missing data
+            lemmatizer.lemmatize('tests')
+            return lemmatizer
+        except ImportError:
+            break
+        except LookupError:
+            if attempt or not _download('wordnet'):
+                break
+    _warn_fallback('wordnet', "the rule-based FallbackLemmatizer")
+    return FallbackLemmatizer()
+
+
+def get_stop_words():
+    """
+    Get the English stopword set, loading it on first use
+
+    Returns:
+        set: Stopwords
+    """
+    global _stop_words
+    if _stop_words is None:
+        with _lock:
+            if _stop_words is None:
+                _stop_words = _load_stop_words()
+    return _stop_words
+
+
+def get_lemmatizer():
+    """
+    Get the lemmatizer, loading WordNet on first use
+
+    Returns:
+        object: WordNetLemmatizer, or FallbackLemmatizer when WordNet is unavailable
+    """
+    global _lemmatizer
+    if _lemmatizer is None:
+        with _lock:
+            if _lemmatizer is None:
+                _lemmatizer = _load_lemmatizer()
+    return _lemmatizer
\ No newline at end of file
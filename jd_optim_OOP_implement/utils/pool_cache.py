@@ -0,0 +1,210 @@
+import hashlib
+import json
+import os
+import shutil
+import uuid
+
+import numpy as np
+import pandas as pd
+
+# Columns the ranking pipeline reads from a resume pool
+POOL_COLUMNS = ['File Name', 'Skills', 'Tools', 'Certifications']
+
+# Default location, relative to the working directory like logs/
+DEFAULT_CACHE_DIR = os.path.join("cache", "pools")
+
+# Bump whenever the cached file layout changes
+CACHE_VERSION = 1
+
+try:
+    import pyarrow  # noqa: F401 - Parquet engine used by pandas
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+
+def string_dtype():
+    """
+    Compact string dtype that keeps NaN for missing values, like read_csv does
+
+    Returns:
+        Arrow-backed string dtype when available, otherwise object
+    """
+    if not PARQUET_AVAILABLE:
+        return object
+    try:
+        return pd.StringDtype("pyarrow", na_value=np.nan)  # pandas >= 2.3
+    except TypeError:
+        try:
+            return pd.StringDtype("pyarrow_numpy")  # pandas 2.1 / 2.2
+        except (TypeError, ValueError):
+            return object
+
+
+def _cache_paths(csv_path, cache_dir):
+    """Parquet and metadata paths of a pool CSV's cache entry"""
+    key = hashlib.sha256(os.path.abspath(csv_path).encode('utf-8')).hexdigest()[:24]
+    base = os.path.join(cache_dir, key)
+    return f"{base}.parquet", f"{base}.json"
+
+
+def _source_signature(csv_path):
+    """mtime and size identifying the current version of a CSV"""
+    stat = os.stat(csv_path)
+    return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+
+def _read_meta(meta_path):
+    """Cache metadata, or None if missing or unreadable"""
+    try:
+        with open(meta_path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(resume_df, csv_path, parquet_path, meta_path, signature):
+    """Write the full pool as Parquet, then its metadata, each replaced atomically"""
+    os.makedirs(os.path.dirname(parquet_path), exist_ok=True)
+    suffix = f".{uuid.uuid4().hex[:8]}.tmp"
+
+    resume_df.to_parquet(parquet_path + suffix, index=False)
+    os.replace(parquet_path + suffix, parquet_path)
+
+    meta = dict(signature, source=os.path.abspath(csv_path), version=CACHE_VERSION,
+                columns=list(resume_df.columns))
+    with open(meta_path + suffix, 'w') as f:
+        json.dump(meta, f)
+    os.replace(meta_path + suffix, meta_path)
+
+
+def _fill_missing(resume_df, columns):
+    """Add requested columns the pool does not have as empty strings, in order"""
+    resume_df = resume_df.copy()
+    for column in columns:
+        if column not in resume_df.columns:
+            resume_df[column] = ""
+    return resume_df[columns]
+
+
+def load_resume_pool(csv_path, columns=None, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Load a resume pool CSV through a columnar Parquet cache
+
+    The first load parses the CSV and stores every column as Parquet; later loads
+    read only the requested columns from Parquet. The cache entry is rebuilt when
+    the CSV's modification time or size changes. Without pyarrow the CSV is read
+    directly (still projected to the requested columns).
+
+    Args:
+        csv_path (str): Path to the resume pool CSV
+        columns (list): Columns to return (defaults to POOL_COLUMNS); columns the
+            CSV does not have are added as empty strings
+        cache_dir (str): Directory holding the cache files
+
+    Returns:
+        DataFrame: Resume pool with string columns
+    """
+    columns = list(columns or POOL_COLUMNS)
+    signature = _source_signature(csv_path)
+
+    if PARQUET_AVAILABLE:
+        parquet_path, meta_path = _cache_paths(csv_path, cache_dir)
+        meta = _read_meta(meta_path)
+        if (meta and meta.get('version') == CACHE_VERSION and
+                meta.get('mtime_ns') == signature['mtime_ns'] and
+                meta.get('size') == signature['size'] and
+                os.path.exists(parquet_path)):
+            try:
+                present = [column for column in columns if column in meta.get('columns', [])]
+                resume_df = pd.read_parquet(parquet_path, columns=present)
+                return _fill_missing(resume_df, columns).astype(string_dtype())
+            except Exception as e:
+                print(f"Error reading resume pool cache, reloading CSV: {e}")
+
+        resume_df = pd.read_csv(csv_path)
+        try:
+            _write_cache(resume_df, csv_path, parquet_path, meta_path, signature)
+        except Exception as e:
+            # Keep working from the CSV if the cache directory is not writable
+            print(f"Error writing resume pool cache: {e}")
+    else:
+        header = pd.read_csv(csv_path, nrows=0).columns
+        resume_df = pd.read_csv(csv_path, usecols=[column for column in columns if column in header])
+
+    present = [column for column in columns if column in resume_df.columns]
+    return _fill_missing(resume_df[present], columns).astype(string_dtype())
+
+def _read_full_pool(csv_path, cache_dir):
+    """Every column of a pool, from a current cache entry when there is one"""
+    if PARQUET_AVAILABLE:
+        parquet_path, meta_path = _cache_paths(csv_path, cache_dir)
+        meta = _read_meta(meta_path)
+        signature = _source_signature(csv_path)
+        if (meta and meta.get('version') == CACHE_VERSION and
+                meta.get('mtime_ns') == signature['mtime_ns'] and
+                meta.get('size') == signature['size'] and
+                os.path.exists(parquet_path)):
+            try:
+                return pd.read_parquet(parquet_path), True
+            except Exception as e:
+                print(f"Error reading resume pool cache, reloading CSV: {e}")
+    return pd.read_csv(csv_path), False
+
+
+def append_pool_rows(csv_path, rows_df, key_column='File Name', cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Add resumes to a pool CSV and its columnar cache without re-parsing the pool
+
+    Rows whose key is already in the pool replace the existing row, the others
+    are appended. The CSV is rewritten atomically (so directory listings such as
+    ResumeCatalog notice the change) and the Parquet cache entry is updated to
+    the new CSV version from the cached columns, so the next load_resume_pool
+    call is still a cache hit.
+
+    Args:
+        csv_path (str): Pool CSV (created if missing)
+        rows_df (DataFrame): New rows; columns the pool does not have are dropped,
+            pool columns missing from the rows are left empty
+        key_column (str): Column identifying a resume
+        cache_dir (str): Directory holding the cache files
+
+    Returns:
+        int: Number of rows in the pool afterwards
+    """
+    if os.path.exists(csv_path):
+        pool_df, cached = _read_full_pool(csv_path, cache_dir)
+        rows_df = rows_df.reindex(columns=pool_df.columns)
+    else:
+        pool_df, cached = None, False
+        rows_df = rows_df.reset_index(drop=True)
+
+    replaced = pool_df is not None and key_column in pool_df.columns and \
+        pool_df[key_column].isin(rows_df[key_column]).any()
+    if replaced:
+        pool_df = pool_df[~pool_df[key_column].isin(rows_df[key_column])]
+    combined_df = rows_df if pool_df is None else pd.concat([pool_df, rows_df], ignore_index=True)
+
+    os.makedirs(os.path.dirname(os.path.abspath(csv_path)), exist_ok=True)
+    tmp_path = f"{csv_path}.{uuid.uuid4().hex[:8]}.tmp"
+    if pool_df is not None and not replaced:
+        # Pure append: copy the existing bytes and add the new rows after them
+        shutil.copyfile(csv_path, tmp_path)
+        with open(tmp_path, 'rb+') as f:
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) not in (b"\n", b"\r"):
+                    f.write(b"\n")
+        rows_df.to_csv(tmp_path, mode='a', header=False, index=False)
+    else:
+        combined_df.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, csv_path)
+
+    if PARQUET_AVAILABLE and (cached or pool_df is None):
+        parquet_path, meta_path = _cache_paths(csv_path, cache_dir)
+        try:
+            _write_cache(combined_df, csv_path, parquet_path, meta_path, _source_signature(csv_path))
+        except Exception as e:
+            print(f"Error writing resume pool cache: {e}")
+
+    return len(combined_df)
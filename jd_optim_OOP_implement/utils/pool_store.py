@@ -0,0 +1,230 @@
+import hashlib
+import os
+import threading
+import uuid
+from collections import OrderedDict
+
+import pandas as pd
+
+from utils.pool_cache import PARQUET_AVAILABLE, POOL_COLUMNS, string_dtype
+
+# Default location, relative to the working directory like logs/
+DEFAULT_STORE_DIR = os.path.join("cache", "pool_store")
+
+# Pools kept in memory, the rest are re-read from disk on demand
+DEFAULT_MEMORY_POOLS = 8
+
+# Total size of the pool files; least recently used ones are deleted beyond it
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+
+def pool_id_for(pool_df):
+    """
+    Content-derived id of a resume pool (identical uploads share one id)
+
+    Args:
+        pool_df (DataFrame): Pool with POOL_COLUMNS
+
+    Returns:
+        str: Pool id
+    """
+    row_hashes = pd.util.hash_pandas_object(pool_df, index=False).to_numpy()
+    digest = hashlib.sha256(row_hashes.tobytes())
+    digest.update(",".join(pool_df.columns).encode('utf-8'))
+    return f"pool-{digest.hexdigest()[:20]}"
+
+
+def _compact(pool_df):
+    """Project a pool to POOL_COLUMNS (missing ones as "") with compact string columns"""
+    pool_df = pool_df.copy()
+    for column in POOL_COLUMNS:
+        if column not in pool_df.columns:
+            pool_df[column] = ""
+    return pool_df[POOL_COLUMNS].reset_index(drop=True).astype(string_dtype())
+
+
+class ResumePoolStore:
+    """
+    Process-wide store of uploaded resume pools
+
+    Each pool is held once, as compact string columns, no matter how many
+    sessions use it. Pools are persisted to disk (Parquet, or pickle without
+    pyarrow) so they survive restarts and session snapshots can keep just the
+    pool id; the most recently used pools also stay in memory. Pool files
+    are touched on every use and the least recently used ones are deleted
+    once the store grows beyond max_bytes (a session whose pool was evicted
+    is asked to upload it again).
+    """
+
+    def __init__(self, store_dir=DEFAULT_STORE_DIR, memory_pools=DEFAULT_MEMORY_POOLS,
+                 max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Initialize the store
+
+        Args:
+            store_dir (str): Directory holding the pool files
+            memory_pools (int): Number of pools kept in memory
+            max_bytes (int): Maximum total size of the pool files
+        """
+        self.store_dir = store_dir
+        self.memory_pools = memory_pools
+        self.max_bytes = max_bytes
+        self.extension = ".parquet" if PARQUET_AVAILABLE else ".pkl"
+        self._pools = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path(self, pool_id):
+        """File holding a pool"""
+        return os.path.join(self.store_dir, f"{pool_id}{self.extension}")
+
+    def _remember(self, pool_id, pool_df):
+        """Keep a pool in memory, evicting the least recently used ones"""
+        self._pools[pool_id] = pool_df
+        self._pools.move_to_end(pool_id)
+        while len(self._pools) > self.memory_pools:
+            self._pools.popitem(last=False)
+
+    def _touch(self, path):
+        """Mark a pool file as used (its mtime orders the eviction)"""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _evict(self, keep):
+        """Delete least recently used pool files until the store fits max_bytes"""
+        files = []
+        try:
+            with os.scandir(self.store_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.endswith(self.extension):
+                        stat = entry.stat()
+                        files.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError as e:
+            print(f"Error listing resume pool store: {e}")
+            return
+
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+                total -= size
+            except OSError as e:
+                print(f"Error evicting resume pool {os.path.basename(path)}: {e}")
+
+    def put(self, pool_df):
+        """
+        Add a pool to the store
+
+        Args:
+            pool_df (DataFrame): Resume pool (e.g. from process_resume_pool)
+
+        Returns:
+            str: Pool id to keep in session state
+        """
+        pool_df = _compact(pool_df)
+        pool_id = pool_id_for(pool_df)
+        path = self._path(pool_id)
+
+        with self._lock:
+            if os.path.exists(path):
+                self._touch(path)
+            else:
+                tmp_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+                try:
+                    os.makedirs(self.store_dir, exist_ok=True)
+                    if PARQUET_AVAILABLE:
+                        pool_df.to_parquet(tmp_path, index=False)
+                    else:
+                        pool_df.to_pickle(tmp_path)
+                    os.replace(tmp_path, path)
+                    self._evict(keep=path)
+                except Exception as e:
+                    # The in-memory copy still serves this process
+                    print(f"Error saving resume pool {pool_id}: {e}")
+            self._remember(pool_id, pool_df)
+
+        return pool_id
+
+    def get(self, pool_id):
+        """
+        Get a pool by id
+
+        Args:
+            pool_id (str): Id returned by put()
+
+        Returns:
+            DataFrame or None: The pool (shared, do not modify in place), or None
+                if it is not in the store
+        """
+        with self._lock:
+            pool_df = self._pools.get(pool_id)
+            path = self._path(pool_id)
+            if pool_df is not None:
+                self._pools.move_to_end(pool_id)
+                self._touch(path)
+                return pool_df
+
+            if not os.path.exists(path):
+                return None
+            try:
+                if PARQUET_AVAILABLE:
+                    pool_df = pd.read_parquet(path).astype(string_dtype())
+                else:
+                    pool_df = pd.read_pickle(path)
+            except Exception as e:
+                print(f"Error loading resume pool {pool_id}: {e}")
+                return None
+
+            self._touch(path)
+            self._remember(pool_id, pool_df)
+            return pool_df
+
+    def migrate_session_pools(self, resume_repository):
+        """
+        Move pools stored inline in session state (legacy 'data' records) into the store
+
+        Args:
+            resume_repository (dict): Session resume repository, updated in place
+
+        Returns:
+            dict: The same repository, with every pool reduced to name, id and size
+        """
+        pools = []
+        for pool in resume_repository.get('pools', []) or []:
+            if 'data' in pool:
+                try:
+                    pool_df = pd.DataFrame(pool['data'])
+                    pool = {
+                        'pool_name': pool.get('pool_name'),
+                        'pool_id': self.put(pool_df),
+                        'rows': len(pool_df)
+                    }
+                except Exception as e:
+                    print(f"Error migrating resume pool {pool.get('pool_name')}: {e}")
+            pools.append(pool)
+        resume_repository['pools'] = pools
+        return resume_repository
+
+
+# Module-level instance, shared by every Streamlit session in the process
+_shared_store = None
+_shared_store_lock = threading.Lock()
+
+
+def get_pool_store():
+    """
+    Get the process-wide resume pool store
+
+    Returns:
+        ResumePoolStore: Shared store
+    """
+    global _shared_store
+    with _shared_store_lock:
+        if _shared_store is None:
+            _shared_store = ResumePoolStore()
+        return _shared_store
\ No newline at end of file
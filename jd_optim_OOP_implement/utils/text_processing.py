@@ -1,57 +1,126 @@
 import re
+from functools import lru_cache
+
 import pandas as pd
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
-
-# Make sure NLTK resources are downloaded
-try:
-    nltk.data.find('tokenizers/punkt')
-    nltk.data.find('corpora/stopwords')
-    nltk.data.find('corpora/wordnet')
-except LookupError:
-    nltk.download('punkt')
-    nltk.download('stopwords')
-    nltk.download('wordnet')
-
-# Initialize lemmatizer and stopwords
-lemmatizer = WordNetLemmatizer()
-stop_words = set(stopwords.words('english'))
+
+# NLTK data is loaded lazily on first use of preprocess_text, with bundled
+# fallbacks, so importing this module never touches the network
+from utils.nlp_resources import get_lemmatizer, get_stop_words
+
+# Technical skill taxonomy used for resume and job description matching
+TECH_KEYWORDS = {
+    'programming_languages': ['python', 'java', 'javascript', 'c++', 'c#', 'ruby', 'php', 'scala', 'swift', 'golang'],
+    'frameworks': ['django', 'flask', 'spring', 'react', 'angular', 'vue', 'nodejs', 'express', 'hibernate'],
+    'databases': ['sql', 'mysql', 'postgresql', 'mongodb', 'oracle', 'redis', 'elasticsearch'],
+    'cloud': ['aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform', 'jenkins'],
+    'tools': ['git', 'maven', 'gradle', 'junit', 'selenium', 'jira', 'confluence']
+}
+
+def _build_skill_matcher(taxonomy):
+    """
+    Compile the skill taxonomy into a single alternation regex
+    
+    Each category is a named group, so one finditer pass over the text returns
+    every hit together with its category. Word boundaries treat '+' and '#' as
+    part of a token, which lets keywords like 'c++' and 'c#' match as whole
+    tokens (a plain \\b boundary never matches after those characters).
+    
+    Args:
+        taxonomy (dict): Category -> list of keywords
+        
+    Returns:
+        re.Pattern: Compiled matcher
+    """
+    groups = []
+    for category, keywords in taxonomy.items():
+        # Longest keywords first so prefixes never shadow a longer keyword
+        alternatives = sorted(keywords, key=len, reverse=True)
+        groups.append(f"(?P<{category}>" + "|".join(re.escape(kw) for kw in alternatives) + ")")
+    
+    return re.compile(r"(?<![\w+#])(?:" + "|".join(groups) + r")(?![\w+#])")
+
+# Compiled once at import, reused by every extract_skills call
+SKILL_MATCHER = _build_skill_matcher(TECH_KEYWORDS)
 
 def extract_skills(text):
     """Extract technical skills and technologies from text"""
-    tech_keywords = {
-        'programming_languages': ['python', 'java', 'javascript', 'c++', 'c#', 'ruby', 'php', 'scala', 'swift', 'golang'],
-        'frameworks': ['django', 'flask', 'spring', 'react', 'angular', 'vue', 'nodejs', 'express', 'hibernate'],
-        'databases': ['sql', 'mysql', 'postgresql', 'mongodb', 'oracle', 'redis', 'elasticsearch'],
-        'cloud': ['aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform', 'jenkins'],
-        'tools': ['git', 'maven', 'gradle', 'junit', 'selenium', 'jira', 'confluence']
-    }
-    
     text = str(text).lower()
-    found_skills = {category: [] for category in tech_keywords}
     
-    for category, keywords in tech_keywords.items():
-        for keyword in keywords:
-            if re.search(r'\b' + keyword + r'\b', text):
-                found_skills[category].append(keyword)
+    # Single linear scan collecting every (category, keyword) hit
+    hits = {(match.lastgroup, match.group()) for match in SKILL_MATCHER.finditer(text)}
+    
+    # Report hits in taxonomy order, as the per-keyword scan used to
+    return {
+        category: [keyword for keyword in keywords if (category, keyword) in hits]
+        for category, keywords in TECH_KEYWORDS.items()
+    }
+
+# Memo sizes for the preprocess_text fast path
+LEMMA_CACHE_SIZE = 50000
+PREPROCESS_CACHE_SIZE = 8192
+
+# Characters removed before tokenizing (everything but letters and whitespace)
+_NON_ALPHA = re.compile(r'[^a-zA-Z\s]')
+
+# On text reduced to letters and whitespace, word_tokenize only differs from a
+# whitespace split by splitting these contractions into two tokens
+_CONTRACTION_SPLITS = {
+    'cannot': ('can', 'not'),
+    'gimme': ('gim', 'me'),
+    'gonna': ('gon', 'na'),
+    'gotta': ('got', 'ta'),
+    'lemme': ('lem', 'me'),
+    'wanna': ('wan', 'na'),
+}
+
+def _tokenize_alpha(text):
+    """
+    Tokenize lowercase text holding only letters and whitespace
+    
+    Produces the same tokens as word_tokenize for such text without running the
+    sentence splitter and the punctuation rules.
     
-    return found_skills
+    Args:
+        text (str): Text with every non-letter already replaced by a space
+        
+    Returns:
+        list: Tokens
+    """
+    tokens = []
+    for token in text.split():
+        split = _CONTRACTION_SPLITS.get(token)
+        if split:
+            tokens.extend(split)
+        else:
+            tokens.append(token)
+    return tokens
+
+@lru_cache(maxsize=LEMMA_CACHE_SIZE)
+def _lemmatize(token):
+    """Lemmatize a single token, memoized"""
+    return get_lemmatizer().lemmatize(token)
+
+@lru_cache(maxsize=PREPROCESS_CACHE_SIZE)
+def _preprocess_cached(text):
+    """Preprocess a string, memoized by the string (hash) itself"""
+    text = _NON_ALPHA.sub(' ', text.lower())
+    tokens = _tokenize_alpha(text)
+    stop_words = get_stop_words()
+    return ' '.join(_lemmatize(token) for token in tokens if token not in stop_words)
 
 def preprocess_text(text):
     """Preprocess text for similarity comparison"""
     if pd.isna(text):
         return ""
     
-    text = str(text).lower()
-    # Remove special characters and numbers
-    text = re.sub(r'[^a-zA-Z\s]', ' ', text)
-    # Tokenize
-    tokens = word_tokenize(text)
-    # Remove stopwords and lemmatize
-    tokens = [lemmatizer.lemmatize(token) for token in tokens if token not in stop_words]
-    return ' '.join(tokens)
+    # Lowercase, remove special characters and numbers, tokenize, remove
+    # stopwords and lemmatize (same JD text is seen once per resume, so cached)
+    return _preprocess_cached(str(text))
+
+def clear_preprocess_caches():
+    """Drop the memoized lemmas and preprocessed strings"""
+    _lemmatize.cache_clear()
+    _preprocess_cached.cache_clear()
 
 def detect_jd_type(file_name):
     """Detect the job description type based on the file name"""
@@ -70,4 +139,72 @@ def detect_jd_type(file_name):
         return 'data_engineer'
     
     # Default type
-    return 'general'
\ No newline at end of file
+    return 'general'
+
+def extract_skills_from_text(text):
+    """
+    Extract skills from text (simplified version)
+    
+    Args:
+        text (str): The text to extract skills from
+        
+    Returns:
+        str: Comma-separated list of found skills
+    """
+    if not text:
+        return ""
+        
+    # Real implementation would use NLP or pattern matching
+    common_skills = [
+        'python', 'java', 'javascript', 'react', 'angular', 'node', 'aws', 'azure',
+        'docker', 'kubernetes', 'sql', 'nosql', 'mongodb', 'machine learning', 'ai',
+        'data analysis', 'cloud', 'devops', 'ci/cd', 'agile', 'scrum', 'rest api',
+        'spring', 'hibernate', 'microservices', 'django', 'flask', 'vue', 'typescript',
+        'html', 'css', 'php', 'ruby', 'c#', 'c++', 'golang', 'scala', 'rust',
+        'git', 'jenkins', 'terraform', 'ansible', 'prometheus', 'grafana'
+    ]
+    
+    found_skills = []
+    text_lower = text.lower()
+    
+    # Use simpler string matching instead of regex
+    for skill in common_skills:
+        # Ensure case-insensitive string matching
+        if f" {skill} " in f" {text_lower} " or f" {skill}," in f" {text_lower} " or f" {skill}." in f" {text_lower} ":
+            found_skills.append(skill)
+    
+    return ", ".join(found_skills)
+
+def extract_tools_from_text(text):
+    """
+    Extract tools from text (simplified version)
+    
+    Args:
+        text (str): The text to extract tools from
+        
+    Returns:
+        str: Comma-separated list of found tools
+    """
+    if not text:
+        return ""
+        
+    # Real implementation would use NLP or pattern matching
+    common_tools = [
+        'git', 'jenkins', 'travis', 'circle ci', 'jira', 'confluence', 'slack',
+        'vscode', 'intellij', 'eclipse', 'visual studio', 'docker', 'terraform',
+        'ansible', 'chef', 'puppet', 'kubernetes', 'aws cli', 'azure cli',
+        'maven', 'gradle', 'npm', 'yarn', 'webpack', 'babel', 'gulp', 'grunt',
+        'jupyter', 'numpy', 'pandas', 'scikit-learn', 'tensorflow', 'pytorch',
+        'tableau', 'power bi', 'excel', 'postman', 'soapui', 'github', 'gitlab'
+    ]
+    
+    found_tools = []
+    text_lower = text.lower()
+    
+    # Use simpler string matching instead of regex
+    for tool in common_tools:
+        # Ensure case-insensitive string matching
+        if f" {tool} " in f" {text_lower} " or f" {tool}," in f" {text_lower} " or f" {tool}." in f" {text_lower} ":
+            found_tools.append(tool)
+    
+    return ", ".join(found_tools)
\ No newline at end of file
@@ -1,11 +1,17 @@
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
+from models.match_breakdown import radar_scores
 
 def create_radar_chart(resume, job_desc):
     """Create a radar chart for skill matching visualization"""
     categories = ['Technical Skills', 'Tools Proficiency', 'Certifications']
     
+    # Results from the ranking pass carry a precomputed breakdown
+    breakdown = resume.get('Breakdown')
+    if breakdown:
+        return _radar_figure(radar_scores(breakdown), categories)
+    
     # Safely convert values to strings and handle missing values
     resume_skills = set(str(resume.get('Skills', '')).lower().split(', '))
     resume_tools = set(str(resume.get('Tools', '')).lower().split(', '))
@@ -20,7 +26,10 @@ def create_radar_chart(resume, job_desc):
     cert_score = min(len(resume_certs) / 10, 1.0)  # Normalize certification count (capped at 1.0)
     
     scores = [skill_score, tools_score, cert_score]
-    
+    return _radar_figure(scores, categories)
+
+def _radar_figure(scores, categories):
+    """Build the single-trace radar figure used for candidate match scores"""
     fig = go.Figure()
     fig.add_trace(go.Scatterpolar(
         r=scores,
@@ -86,10 +95,11 @@ def create_distribution_chart(categorized_resumes):
         return fig
     
     categories = ['High Match', 'Medium Match', 'Low Match']
+    # Streaming rankings keep capped bucket lists and report full sizes in 'counts'
+    bucket_sizes = categorized_resumes.get('counts', {})
     counts = [
-        len(categorized_resumes.get('high_matches', [])),
-        len(categorized_resumes.get('medium_matches', [])),
-        len(categorized_resumes.get('low_matches', []))
+        bucket_sizes.get(bucket, len(categorized_resumes.get(bucket, [])))
+        for bucket in ['high_matches', 'medium_matches', 'low_matches']
     ]
     
     # Check if we have any data